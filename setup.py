@@ -37,6 +37,12 @@ setup(
     #: Dependencies
     install_requires=requirements,
 
+    #: Optional extras
+    #: fast-png: multi-threaded PNG encoding for charts (builds from source)
+    extras_require={
+        "fast-png": ["pymtpng"],
+    },
+
     #: Python version requirement
     python_requires=">=3.10",
 
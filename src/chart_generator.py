@@ -2,24 +2,35 @@
 Chart generation for KPI reports using matplotlib.
 
 All charts are static PNG images suitable for PDF export and HTML embedding.
-"""
 
-import matplotlib
-matplotlib.use('Agg')  # Non-interactive backend for server/CLI use
+matplotlib is imported lazily on the first chart call (see _get_plt), so
+importing this module - and CLI paths that never draw a chart - do not
+pay its startup cost.
+"""
 
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
+import hashlib
+import io
+import json
+import numpy as np
+import os
+from PIL import Image
+from PIL.PngImagePlugin import PngInfo
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Tuple, Any
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union, Any
 
-#: Apply seaborn style for professional appearance
-plt.style.use('seaborn-v0_8-darkgrid')
+try:
+    #: Optional multi-threaded PNG encoder (pip install kpi-report-generator[fast-png])
+    import pymtpng
+except ImportError:
+    pymtpng = None
 
 #: Consistent styling across all charts
 CHART_STYLE = {
     "figure.figsize": (10, 6),
-    "figure.dpi": 150,
+    "figure.dpi": 100,
     "font.family": "sans-serif",
     "font.size": 11,
     "axes.titlesize": 14,
@@ -28,11 +39,37 @@ CHART_STYLE = {
     "xtick.labelsize": 10,
     "ytick.labelsize": 10,
     "legend.fontsize": 10,
-    "savefig.bbox": "tight",
-    "savefig.pad_inches": 0.3,
-    "savefig.facecolor": "white"
+    "figure.facecolor": "white",
+    #: Grey panel / white grid look (the parts of seaborn-v0_8-darkgrid we use)
+    "axes.facecolor": "#EAEAF2",
+    "axes.edgecolor": "white",
+    "axes.linewidth": 0.0,
+    "axes.grid": True,
+    "axes.axisbelow": True,
+    "grid.color": "white",
+    "axes.labelcolor": ".15",
+    "text.color": ".15",
+    "xtick.color": ".15",
+    "ytick.color": ".15",
+    "xtick.major.size": 0.0,
+    "xtick.minor.size": 0.0,
+    "ytick.major.size": 0.0,
+    "ytick.minor.size": 0.0,
+    "legend.frameon": False,
+    "font.sans-serif": [
+        "Arial", "Liberation Sans", "DejaVu Sans", "Bitstream Vera Sans", "sans-serif"
+    ]
 }
 
+#: Resolution used when a chart is rendered with high_res=True (e.g. print/PDF)
+HIGH_RES_DPI = 150
+
+#: zlib level for chart PNGs (0 = no compression, 9 = smallest file)
+PNG_COMPRESS_LEVEL = 1
+
+#: PNG text chunk holding the hash of the inputs a chart was rendered from
+CHART_CACHE_KEY_FIELD = "kpi-chart-key"
+
 #: Color palette matching HTML report theme
 COLOR_PALETTE = {
     "primary": "#2C3E50",      # Dark blue-gray
@@ -45,24 +82,326 @@ COLOR_PALETTE = {
 }
 
 
+#: matplotlib.pyplot, imported and styled on first use by _get_plt
+_plt = None
+
+#: COLOR_PALETTE resolved to RGBA tuples by _get_plt for draw calls
+_RGBA_PALETTE: Dict[str, Tuple[float, float, float, float]] = {}
+
+#: Reusable (figure, axes) pairs keyed by figure size
+_FIGURE_CACHE: Dict[Tuple[float, float], Tuple[Any, Any]] = {}
+
+
+def _get_cached_figure(
+    figsize: Tuple[float, float],
+    dpi: Optional[float] = None
+) -> Tuple[Any, Any]:
+    """
+    Get a cleared (figure, axes) pair of the given size.
+
+    Figure construction is a fixed cost that dominates small charts, so
+    figures are kept open and reused across chart calls. A cached figure
+    is made current (so pyplot calls target it) and its axes are cleared.
+
+    :param figsize: Figure size in inches (width, height)
+    :type figsize: Tuple[float, float]
+    :param dpi: Figure resolution (default: rcParams['figure.dpi'])
+    :type dpi: Optional[float]
+    :return: Tuple of (figure, axes)
+    :rtype: Tuple[Any, Any]
+
+    :Example:
+
+    >>> fig, ax = _get_cached_figure((10, 6))
+    >>> fig is _get_cached_figure((10, 6))[0]
+    True
+    """
+    plt = _get_plt()
+    dpi = dpi or plt.rcParams['figure.dpi']
+    cached = _FIGURE_CACHE.get(figsize)
+
+    #: Reuse only figures still registered with pyplot (not closed elsewhere)
+    if cached is not None and plt.fignum_exists(cached[0].number):
+        fig, ax = cached
+        plt.figure(fig.number)
+        ax.clear()
+        if fig.dpi != dpi:
+            fig.set_dpi(dpi)
+        return fig, ax
+
+    fig, ax = plt.subplots(figsize=figsize, dpi=dpi)
+    _FIGURE_CACHE[figsize] = (fig, ax)
+    return fig, ax
+
+
+def _mtpng_compression_level(compress_level: int) -> Any:
+    """
+    Map a zlib compression level (0-9) onto pymtpng's three presets.
+
+    :param compress_level: zlib compression level
+    :type compress_level: int
+    :return: Matching pymtpng.CompressionLevel
+    :rtype: pymtpng.CompressionLevel
+    """
+    if compress_level <= 3:
+        return pymtpng.CompressionLevel.Fast
+    if compress_level <= 6:
+        return pymtpng.CompressionLevel.Default
+    return pymtpng.CompressionLevel.High
+
+
+def _save_figure_fast(
+    fig: Any,
+    output_file: Union[Path, io.BytesIO],
+    compress_level: int = PNG_COMPRESS_LEVEL,
+    cache_key: Optional[str] = None
+) -> Union[Path, io.BytesIO]:
+    """
+    Save figure as PNG straight from the Agg RGBA buffer.
+
+    Bypasses the savefig pipeline: the canvas is drawn once and its
+    pixel buffer is encoded at a low compression level, by pymtpng
+    (parallel deflate) when installed, otherwise by Pillow.
+
+    :param fig: Figure to save
+    :type fig: matplotlib.figure.Figure
+    :param output_file: Destination PNG path or in-memory buffer
+    :type output_file: Union[Path, io.BytesIO]
+    :param compress_level: zlib compression level (0-9)
+    :type compress_level: int
+    :param cache_key: Input hash stored in the PNG (see _is_chart_cached)
+    :type cache_key: Optional[str]
+    :return: output_file, now holding the PNG
+    :rtype: Union[Path, io.BytesIO]
+
+    :Example:
+
+    >>> fig, ax = _get_cached_figure((8, 4))
+    >>> _save_figure_fast(fig, Path('reports/chart.png'), compress_level=0)
+    PosixPath('reports/chart.png')
+    """
+    fig.canvas.draw()
+    rgba = np.asarray(fig.canvas.buffer_rgba())
+
+    if pymtpng is not None:
+        info = {CHART_CACHE_KEY_FIELD: cache_key} if cache_key is not None else {}
+        compression_level = _mtpng_compression_level(compress_level)
+        if isinstance(output_file, io.BytesIO):
+            pymtpng.encode_png(
+                rgba, output_file, compression_level=compression_level, info=info
+            )
+        else:
+            with open(output_file, 'wb') as fh:
+                pymtpng.encode_png(
+                    rgba, fh, compression_level=compression_level, info=info
+                )
+        return output_file
+
+    pnginfo = None
+    if cache_key is not None:
+        pnginfo = PngInfo()
+        pnginfo.add_text(CHART_CACHE_KEY_FIELD, cache_key)
+
+    Image.fromarray(rgba).save(
+        output_file, 'PNG', compress_level=compress_level, pnginfo=pnginfo
+    )
+
+    return output_file
+
+
+def _chart_output(
+    output_path: Union[Path, io.BytesIO],
+    filename: str
+) -> Union[Path, io.BytesIO]:
+    """
+    Resolve where a chart is written.
+
+    :param output_path: Chart directory, or a buffer to receive the PNG
+    :type output_path: Union[Path, io.BytesIO]
+    :param filename: PNG filename used when output_path is a directory
+    :type filename: str
+    :return: output_path / filename, or the buffer itself
+    :rtype: Union[Path, io.BytesIO]
+
+    :Example:
+
+    >>> _chart_output(Path('reports'), 'timeline-all.png')
+    PosixPath('reports/timeline-all.png')
+    """
+    if isinstance(output_path, io.BytesIO):
+        return output_path
+    return output_path / filename
+
+
+def _chart_cache_key(chart: str, *inputs: Any) -> str:
+    """
+    Hash the data a chart is drawn from, together with the chart styling.
+
+    Any change to the plotted values, CHART_STYLE, COLOR_PALETTE or the
+    PNG settings produces a different key.
+
+    :param chart: Chart identifier (e.g. 'timeline')
+    :type chart: str
+    :param inputs: JSON-serialisable plotted data (datetimes become strings)
+    :type inputs: Any
+    :return: Hex digest identifying the rendered chart
+    :rtype: str
+
+    :Example:
+
+    >>> key = _chart_cache_key('release-activity', ['Releases'], [15])
+    >>> len(key)
+    32
+    """
+    payload = json.dumps(
+        [chart, inputs, CHART_STYLE, COLOR_PALETTE, PNG_COMPRESS_LEVEL],
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _is_chart_cached(output_file: Union[Path, io.BytesIO], cache_key: str) -> bool:
+    """
+    Check whether output_file was already rendered from the same inputs.
+
+    The key is read from the PNG's text chunk, which Pillow parses
+    without decoding the image data. Missing or unreadable files are
+    treated as a cache miss.
+
+    :param output_file: Chart PNG path (in-memory buffers never hit)
+    :type output_file: Union[Path, io.BytesIO]
+    :param cache_key: Key from _chart_cache_key for the current inputs
+    :type cache_key: str
+    :return: True if the existing PNG can be reused
+    :rtype: bool
+
+    :Example:
+
+    >>> key = _chart_cache_key('timeline', [])
+    >>> _is_chart_cached(Path('reports/missing.png'), key)
+    False
+    """
+    if isinstance(output_file, io.BytesIO) or os.environ.get('KPI_NO_CACHE'):
+        return False
+
+    try:
+        with Image.open(output_file) as image:
+            return image.info.get(CHART_CACHE_KEY_FIELD) == cache_key
+    except OSError:
+        return False
+
+
+def _bucket_by_month(
+    dated_counts: Iterable[Tuple[datetime, int]]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sum counts per calendar month, in chronological order.
+
+    Months are keyed as (year, month) tuples, so there is no strftime /
+    strptime round-trip and dates with different UTC offsets in the same
+    month share one bucket. Results are NumPy arrays so matplotlib
+    converts the dates in one vectorised step instead of per datetime.
+
+    :param dated_counts: (date, count) pairs
+    :type dated_counts: Iterable[Tuple[datetime, int]]
+    :return: Tuple of (first-of-month datetime64[D] array, summed counts)
+    :rtype: Tuple[np.ndarray, np.ndarray]
+
+    :Example:
+
+    >>> _bucket_by_month([
+    ...     (datetime(2025, 11, 15), 2),
+    ...     (datetime(2025, 10, 3), 1),
+    ...     (datetime(2025, 11, 1), 3)
+    ... ])
+    (array(['2025-10-01', '2025-11-01'], dtype='datetime64[D]'), array([1, 5]))
+    """
+    month_counts = Counter()
+    for date, count in dated_counts:
+        month_counts[(date.year, date.month)] += count
+
+    months = sorted(month_counts)
+
+    #: Months since the epoch -> datetime64[M] -> first day of each month
+    month_index = np.fromiter(
+        ((year - 1970) * 12 + month - 1 for year, month in months),
+        dtype=np.int64,
+        count=len(months)
+    )
+    month_dates = month_index.astype('datetime64[M]').astype('datetime64[D]')
+    counts = np.fromiter(
+        (month_counts[m] for m in months), dtype=np.int64, count=len(months)
+    )
+
+    return month_dates, counts
+
+
+def _get_plt() -> Any:
+    """
+    Import and configure matplotlib.pyplot on first use.
+
+    The first call selects the non-interactive Agg backend, applies
+    CHART_STYLE, resolves COLOR_PALETTE hex strings into _RGBA_PALETTE
+    (so draw calls skip colour parsing) and warms the font cache.
+    COLOR_PALETTE itself keeps its hex strings for the chart cache key. Later calls return the configured module immediately.
+
+    :return: Configured pyplot module
+    :rtype: module
+
+    :Example:
+
+    >>> plt = _get_plt()
+    >>> plt.get_backend()
+    'agg'
+    """
+    global _plt
+
+    if _plt is not None:
+        return _plt
+
+    import matplotlib
+    matplotlib.use('Agg', force=True)  # Non-interactive backend for server/CLI use
+
+    import matplotlib.pyplot as plt
+    from matplotlib.colors import to_rgba
+    from matplotlib.font_manager import FontProperties, findfont
+
+    plt.rcParams.update(CHART_STYLE)
+
+    _RGBA_PALETTE.update(
+        {name: to_rgba(color) for name, color in COLOR_PALETTE.items()}
+    )
+
+    #: Resolve the chart font now rather than on the first text render
+    findfont(FontProperties(family=[CHART_STYLE["font.family"]]))
+
+    _plt = plt
+    return _plt
+
+
 def setup_chart_style():
     """
     Apply consistent styling to all charts.
 
+    Kept for callers that style matplotlib before drawing their own
+    figures; chart functions in this module call _get_plt directly.
+
     :Example:
 
     >>> setup_chart_style()
-    >>> plt.plot([1, 2, 3])
+    >>> _get_plt().plot([1, 2, 3])
     """
-    plt.rcParams.update(CHART_STYLE)
+    _get_plt()
 
 
 def generate_project_breakdown_chart(
     projects: List[Dict[str, Any]],
     metric: str,
     period: str,
-    output_path: Path
-) -> Path:
+    output_path: Union[Path, io.BytesIO],
+    high_res: bool = False
+) -> Union[Path, io.BytesIO]:
     """
     Generate horizontal bar chart for project metrics.
 
@@ -75,10 +414,12 @@ def generate_project_breakdown_chart(
     :type metric: str
     :param period: Period identifier for filename
     :type period: str
-    :param output_path: Directory to save chart
-    :type output_path: Path
-    :return: Path to saved PNG file
-    :rtype: Path
+    :param output_path: Directory to save chart, or a BytesIO to receive the PNG
+    :type output_path: Union[Path, io.BytesIO]
+    :param high_res: Render at HIGH_RES_DPI instead of the default dpi
+    :type high_res: bool
+    :return: Path to saved PNG file (or the BytesIO passed as output_path)
+    :rtype: Union[Path, io.BytesIO]
 
     :Example:
 
@@ -90,27 +431,36 @@ def generate_project_breakdown_chart(
     ...     projects, 'total_commits', 'all', Path('reports')
     ... )
     """
-    setup_chart_style()
+    plt = _get_plt()
 
-    #: Sort projects by metric value (descending)
-    sorted_projects = sorted(
-        projects,
-        key=lambda p: p.get(metric, 0),
-        reverse=True
+    all_values = np.fromiter(
+        (p.get(metric, 0) for p in projects),
+        dtype=np.int64,
+        count=len(projects)
     )
+    all_names = np.array([p['name'] for p in projects], dtype=object)
+
+    #: Sort projects by metric value (descending, ties keep input order)
+    order = np.argsort(-all_values, kind='stable')
+    names = all_names[order].tolist()
+    values = all_values[order].tolist()
 
-    names = [p['name'] for p in sorted_projects]
-    values = [p.get(metric, 0) for p in sorted_projects]
+    #: Reuse the existing PNG if it was rendered from identical data
+    output_file = _chart_output(output_path, f"project-{metric}-{period}.png")
+    dpi = HIGH_RES_DPI if high_res else None
+    cache_key = _chart_cache_key('project-breakdown', metric, names, values, dpi)
+    if _is_chart_cached(output_file, cache_key):
+        return output_file
 
     #: Create horizontal bar chart with dynamic height
     fig_height = max(6, len(names) * 0.5)
-    fig, ax = plt.subplots(figsize=(10, fig_height))
+    fig, ax = _get_cached_figure((10, fig_height), dpi)
 
-    bars = ax.barh(names, values, color=COLOR_PALETTE['secondary'])
+    bars = ax.barh(names, values, color=_RGBA_PALETTE['secondary'])
 
     #: Highlight top performer in green
     if bars:
-        bars[0].set_color(COLOR_PALETTE['success'])
+        bars[0].set_color(_RGBA_PALETTE['success'])
 
     #: Format labels
     metric_label = metric.replace('_', ' ').replace('total ', '').title()
@@ -119,22 +469,14 @@ def generate_project_breakdown_chart(
     ax.set_title(f'{metric_label} by Service')
 
     #: Add value labels on bars
-    for i, (name, value) in enumerate(zip(names, values)):
-        ax.text(
-            value,
-            i,
-            f'  {value:,}',
-            va='center',
-            fontsize=9
-        )
+    ax.bar_label(bars, labels=[f'{v:,}' for v in values], padding=3, fontsize=9)
 
     plt.tight_layout()
 
     #: Save chart
-    output_file = output_path / f"project-{metric}-{period}.png"
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(output_file)
-    plt.close()
+    if isinstance(output_file, Path):
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+    _save_figure_fast(fig, output_file, cache_key=cache_key)
 
     return output_file
 
@@ -142,8 +484,9 @@ def generate_project_breakdown_chart(
 def generate_timeline_chart(
     timeline_data: List[Tuple[datetime, str]],
     period: str,
-    output_path: Path
-) -> Path:
+    output_path: Union[Path, io.BytesIO],
+    high_res: bool = False
+) -> Union[Path, io.BytesIO]:
     """
     Generate timeline chart showing releases over time.
 
@@ -154,10 +497,12 @@ def generate_timeline_chart(
     :type timeline_data: List[Tuple[datetime, str]]
     :param period: Period identifier for filename
     :type period: str
-    :param output_path: Directory to save chart
-    :type output_path: Path
-    :return: Path to saved PNG file
-    :rtype: Path
+    :param output_path: Directory to save chart, or a BytesIO to receive the PNG
+    :type output_path: Union[Path, io.BytesIO]
+    :param high_res: Render at HIGH_RES_DPI instead of the default dpi
+    :type high_res: bool
+    :return: Path to saved PNG file (or the BytesIO passed as output_path)
+    :rtype: Union[Path, io.BytesIO]
 
     :Example:
 
@@ -168,44 +513,44 @@ def generate_timeline_chart(
     ... ]
     >>> path = generate_timeline_chart(timeline, 'all', Path('reports'))
     """
-    setup_chart_style()
+    plt = _get_plt()
+
+    #: Reuse the existing PNG if it was rendered from identical data
+    output_file = _chart_output(output_path, f"timeline-{period}.png")
+    dpi = HIGH_RES_DPI if high_res else None
+    cache_key = _chart_cache_key('timeline', timeline_data, dpi)
+    if _is_chart_cached(output_file, cache_key):
+        return output_file
 
     if not timeline_data:
         #: Create empty chart with message
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig, ax = _get_cached_figure((10, 6), dpi)
         ax.text(
             0.5, 0.5,
             'No release data available',
             ha='center',
             va='center',
             fontsize=14,
-            color=COLOR_PALETTE['primary']
+            color=_RGBA_PALETTE['primary']
         )
         ax.set_xlim(0, 1)
         ax.set_ylim(0, 1)
         ax.axis('off')
     else:
-        dates = [d for d, _ in timeline_data]
-        versions = [v for _, v in timeline_data]
-
         #: Count releases per month for histogram
-        from collections import Counter
-        month_counts = Counter([d.strftime('%Y-%m') for d in dates])
-        months = sorted(month_counts.keys())
-        counts = [month_counts[m] for m in months]
-        month_dates = [datetime.strptime(m, '%Y-%m') for m in months]
+        month_dates, counts = _bucket_by_month((d, 1) for d, _ in timeline_data)
 
-        fig, ax = plt.subplots(figsize=(12, 6))
+        fig, ax = _get_cached_figure((12, 6), dpi)
 
         #: Bar chart showing releases per month
         #: Width of 25 days makes monthly bars more prominent
-        ax.bar(
+        bars = ax.bar(
             month_dates,
             counts,
             width=25,
-            color=COLOR_PALETTE['secondary'],
+            color=_RGBA_PALETTE['secondary'],
             alpha=0.7,
-            edgecolor=COLOR_PALETTE['primary']
+            edgecolor=_RGBA_PALETTE['primary']
         )
 
         ax.set_xlabel('Month')
@@ -213,6 +558,7 @@ def generate_timeline_chart(
         ax.set_title('Release Activity Over Time')
 
         #: Format x-axis dates
+        import matplotlib.dates as mdates
         ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
         ax.xaxis.set_major_locator(mdates.MonthLocator(interval=1))
         plt.xticks(rotation=45, ha='right')
@@ -221,23 +567,14 @@ def generate_timeline_chart(
         ax.grid(True, alpha=0.3, axis='y')
 
         #: Add value labels on bars
-        for date, count in zip(month_dates, counts):
-            ax.text(
-                date,
-                count,
-                str(count),
-                ha='center',
-                va='bottom',
-                fontsize=9
-            )
+        ax.bar_label(bars, labels=[str(c) for c in counts], padding=3, fontsize=9)
 
     plt.tight_layout()
 
     #: Save chart
-    output_file = output_path / f"timeline-{period}.png"
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(output_file)
-    plt.close()
+    if isinstance(output_file, Path):
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+    _save_figure_fast(fig, output_file, cache_key=cache_key)
 
     return output_file
 
@@ -245,8 +582,9 @@ def generate_timeline_chart(
 def generate_commit_timeline_chart(
     commit_data: List[Tuple[datetime, int]],
     period: str,
-    output_path: Path
-) -> Path:
+    output_path: Union[Path, io.BytesIO],
+    high_res: bool = False
+) -> Union[Path, io.BytesIO]:
     """
     Generate timeline chart showing commits over time.
 
@@ -258,10 +596,12 @@ def generate_commit_timeline_chart(
     :type commit_data: List[Tuple[datetime, int]]
     :param period: Period identifier for filename
     :type period: str
-    :param output_path: Directory to save chart
-    :type output_path: Path
-    :return: Path to saved PNG file
-    :rtype: Path
+    :param output_path: Directory to save chart, or a BytesIO to receive the PNG
+    :type output_path: Union[Path, io.BytesIO]
+    :param high_res: Render at HIGH_RES_DPI instead of the default dpi
+    :type high_res: bool
+    :return: Path to saved PNG file (or the BytesIO passed as output_path)
+    :rtype: Union[Path, io.BytesIO]
 
     :Example:
 
@@ -273,47 +613,46 @@ def generate_commit_timeline_chart(
     ... ]
     >>> path = generate_commit_timeline_chart(commits, 'all', Path('reports'))
     """
-    setup_chart_style()
+    plt = _get_plt()
+
+    #: Reuse the existing PNG if it was rendered from identical data
+    output_file = _chart_output(output_path, f"commit-timeline-{period}.png")
+    dpi = HIGH_RES_DPI if high_res else None
+    cache_key = _chart_cache_key('commit-timeline', commit_data, dpi)
+    if _is_chart_cached(output_file, cache_key):
+        return output_file
 
     if not commit_data:
         #: Create empty chart with message
-        fig, ax = plt.subplots(figsize=(12, 6))
+        fig, ax = _get_cached_figure((12, 6), dpi)
         ax.text(
             0.5, 0.5,
             'No commit data available',
             ha='center',
             va='center',
             fontsize=14,
-            color=COLOR_PALETTE['primary']
+            color=_RGBA_PALETTE['primary']
         )
         ax.set_xlim(0, 1)
         ax.set_ylim(0, 1)
         ax.axis('off')
     else:
         #: Aggregate commits by month (multiple releases in same month)
-        from collections import defaultdict
-        month_commits = defaultdict(int)
-        for date, commits in commit_data:
-            month_key = date.strftime('%Y-%m')
-            month_commits[month_key] += commits
-
-        #: Sort months chronologically
-        months = sorted(month_commits.keys())
-        month_dates = [datetime.strptime(m, '%Y-%m') for m in months]
-        commit_counts = [month_commits[m] for m in months]
+        #: Sorted chronologically
+        month_dates, commit_counts = _bucket_by_month(commit_data)
 
         #: Create bar chart - same size as release timeline for alignment
-        fig, ax = plt.subplots(figsize=(12, 6))
+        fig, ax = _get_cached_figure((12, 6), dpi)
 
         #: Use teal color to distinguish from release timeline (blue)
         #: Width of 25 days makes monthly bars more prominent
-        ax.bar(
+        bars = ax.bar(
             month_dates,
             commit_counts,
             width=25,
-            color=COLOR_PALETTE['teal'],
+            color=_RGBA_PALETTE['teal'],
             alpha=0.7,
-            edgecolor=COLOR_PALETTE['primary']
+            edgecolor=_RGBA_PALETTE['primary']
         )
 
         ax.set_xlabel('Month')
@@ -321,6 +660,7 @@ def generate_commit_timeline_chart(
         ax.set_title('Commit Activity Over Time')
 
         #: Format x-axis identically to release timeline for vertical alignment
+        import matplotlib.dates as mdates
         ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
         ax.xaxis.set_major_locator(mdates.MonthLocator(interval=1))
         plt.xticks(rotation=45, ha='right')
@@ -329,23 +669,16 @@ def generate_commit_timeline_chart(
         ax.grid(True, alpha=0.3, axis='y')
 
         #: Add value labels on bars
-        for date, count in zip(month_dates, commit_counts):
-            ax.text(
-                date,
-                count,
-                str(count),
-                ha='center',
-                va='bottom',
-                fontsize=9
-            )
+        ax.bar_label(
+            bars, labels=[str(c) for c in commit_counts], padding=3, fontsize=9
+        )
 
     plt.tight_layout()
 
     #: Save chart
-    output_file = output_path / f"commit-timeline-{period}.png"
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(output_file)
-    plt.close()
+    if isinstance(output_file, Path):
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+    _save_figure_fast(fig, output_file, cache_key=cache_key)
 
     return output_file
 
@@ -353,8 +686,9 @@ def generate_commit_timeline_chart(
 def generate_release_activity_chart(
     summary_data: Dict[str, int],
     period: str,
-    output_path: Path
-) -> Path:
+    output_path: Union[Path, io.BytesIO],
+    high_res: bool = False
+) -> Union[Path, io.BytesIO]:
     """
     Generate release activity chart showing releases and commits.
 
@@ -365,17 +699,19 @@ def generate_release_activity_chart(
     :type summary_data: Dict[str, int]
     :param period: Period identifier for filename
     :type period: str
-    :param output_path: Directory to save chart
-    :type output_path: Path
-    :return: Path to saved PNG file
-    :rtype: Path
+    :param output_path: Directory to save chart, or a BytesIO to receive the PNG
+    :type output_path: Union[Path, io.BytesIO]
+    :param high_res: Render at HIGH_RES_DPI instead of the default dpi
+    :type high_res: bool
+    :return: Path to saved PNG file (or the BytesIO passed as output_path)
+    :rtype: Union[Path, io.BytesIO]
 
     :Example:
 
     >>> summary = {'total_releases': 15, 'total_commits': 156}
     >>> path = generate_release_activity_chart(summary, 'all', Path('reports'))
     """
-    setup_chart_style()
+    plt = _get_plt()
 
     #: Prepare data
     metrics = [
@@ -386,10 +722,17 @@ def generate_release_activity_chart(
     labels = [m[0] for m in metrics]
     values = [m[1] for m in metrics]
 
+    #: Reuse the existing PNG if it was rendered from identical data
+    output_file = _chart_output(output_path, f"release-activity-{period}.png")
+    dpi = HIGH_RES_DPI if high_res else None
+    cache_key = _chart_cache_key('release-activity', labels, values, dpi)
+    if _is_chart_cached(output_file, cache_key):
+        return output_file
+
     #: Create bar chart (compact height for print layout)
-    fig, ax = plt.subplots(figsize=(8, 4))
+    fig, ax = _get_cached_figure((8, 4), dpi)
 
-    colors = [COLOR_PALETTE['secondary'], COLOR_PALETTE['primary']]
+    colors = [_RGBA_PALETTE['secondary'], _RGBA_PALETTE['primary']]
 
     bars = ax.bar(labels, values, color=colors, alpha=0.8, edgecolor='black', width=0.6)
 
@@ -397,25 +740,20 @@ def generate_release_activity_chart(
     ax.set_title('Release Activity')
 
     #: Add value labels on bars
-    for bar, value in zip(bars, values):
-        height = bar.get_height()
-        ax.text(
-            bar.get_x() + bar.get_width()/2.,
-            height,
-            f'{value:,}',
-            ha='center',
-            va='bottom',
-            fontsize=11,
-            fontweight='bold'
-        )
+    ax.bar_label(
+        bars,
+        labels=[f'{v:,}' for v in values],
+        padding=3,
+        fontsize=11,
+        fontweight='bold'
+    )
 
     plt.tight_layout()
 
     #: Save chart
-    output_file = output_path / f"release-activity-{period}.png"
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(output_file)
-    plt.close()
+    if isinstance(output_file, Path):
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+    _save_figure_fast(fig, output_file, cache_key=cache_key)
 
     return output_file
 
@@ -423,8 +761,9 @@ def generate_release_activity_chart(
 def generate_code_volume_chart(
     summary_data: Dict[str, int],
     period: str,
-    output_path: Path
-) -> Path:
+    output_path: Union[Path, io.BytesIO],
+    high_res: bool = False
+) -> Union[Path, io.BytesIO]:
     """
     Generate code volume chart showing lines added, removed, and net change.
 
@@ -435,10 +774,12 @@ def generate_code_volume_chart(
     :type summary_data: Dict[str, int]
     :param period: Period identifier for filename
     :type period: str
-    :param output_path: Directory to save chart
-    :type output_path: Path
-    :return: Path to saved PNG file
-    :rtype: Path
+    :param output_path: Directory to save chart, or a BytesIO to receive the PNG
+    :type output_path: Union[Path, io.BytesIO]
+    :param high_res: Render at HIGH_RES_DPI instead of the default dpi
+    :type high_res: bool
+    :return: Path to saved PNG file (or the BytesIO passed as output_path)
+    :rtype: Union[Path, io.BytesIO]
 
     :Example:
 
@@ -448,7 +789,7 @@ def generate_code_volume_chart(
     ... }
     >>> path = generate_code_volume_chart(summary, 'all', Path('reports'))
     """
-    setup_chart_style()
+    plt = _get_plt()
 
     #: Calculate net change
     lines_added = summary_data.get('total_lines_added', 0)
@@ -465,13 +806,20 @@ def generate_code_volume_chart(
     labels = [m[0] for m in metrics]
     values = [m[1] for m in metrics]
 
+    #: Reuse the existing PNG if it was rendered from identical data
+    output_file = _chart_output(output_path, f"code-volume-{period}.png")
+    dpi = HIGH_RES_DPI if high_res else None
+    cache_key = _chart_cache_key('code-volume', labels, values, dpi)
+    if _is_chart_cached(output_file, cache_key):
+        return output_file
+
     #: Create bar chart (compact height for print layout)
-    fig, ax = plt.subplots(figsize=(9, 4))
+    fig, ax = _get_cached_figure((9, 4), dpi)
 
     colors = [
-        COLOR_PALETTE['success'],   # Green for added
-        COLOR_PALETTE['danger'],     # Red for removed
-        COLOR_PALETTE['secondary']   # Blue for net change
+        _RGBA_PALETTE['success'],   # Green for added
+        _RGBA_PALETTE['danger'],     # Red for removed
+        _RGBA_PALETTE['secondary']   # Blue for net change
     ]
 
     bars = ax.bar(labels, values, color=colors, alpha=0.8, edgecolor='black', width=0.6)
@@ -480,17 +828,13 @@ def generate_code_volume_chart(
     ax.set_title('Code Volume')
 
     #: Add value labels on bars
-    for bar, value in zip(bars, values):
-        height = bar.get_height()
-        ax.text(
-            bar.get_x() + bar.get_width()/2.,
-            height,
-            f'{value:,}',
-            ha='center',
-            va='bottom',
-            fontsize=10,
-            fontweight='bold'
-        )
+    ax.bar_label(
+        bars,
+        labels=[f'{v:,}' for v in values],
+        padding=3,
+        fontsize=10,
+        fontweight='bold'
+    )
 
     #: Add horizontal line at zero for reference
     ax.axhline(y=0, color='gray', linestyle='-', linewidth=0.5, alpha=0.5)
@@ -498,9 +842,54 @@ def generate_code_volume_chart(
     plt.tight_layout()
 
     #: Save chart
-    output_file = output_path / f"code-volume-{period}.png"
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(output_file)
-    plt.close()
+    if isinstance(output_file, Path):
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+    _save_figure_fast(fig, output_file, cache_key=cache_key)
 
     return output_file
+
+
+def render_all_charts(
+    tasks: Dict[str, Tuple[Callable[..., Any], Tuple[Any, ...]]],
+    single_core: bool = False
+) -> Dict[str, Union[Path, io.BytesIO]]:
+    """
+    Render independent charts in parallel worker processes.
+
+    matplotlib is not thread-safe, but each chart function is a pure
+    inputs -> PNG path call, so charts render well in separate processes.
+    Each worker runs _get_plt as its initializer, so it draws with the Agg
+    backend and a warm font cache. Charts rendered into a BytesIO come back
+    as the worker's copy of the buffer, so always use the returned values.
+
+    :param tasks: Dict mapping chart names to (chart_function, args) tuples
+    :type tasks: Dict[str, Tuple[Callable[..., Any], Tuple[Any, ...]]]
+    :param single_core: Render serially in this process (useful for debugging)
+    :type single_core: bool
+    :return: Dict mapping chart names to saved PNG paths (or filled buffers)
+    :rtype: Dict[str, Union[Path, io.BytesIO]]
+
+    :Example:
+
+    >>> tasks = {
+    ...     'code_volume': (generate_code_volume_chart, (summary, 'all', chart_dir)),
+    ...     'timeline': (generate_timeline_chart, (timeline, 'all', chart_dir))
+    ... }
+    >>> paths = render_all_charts(tasks)
+    >>> paths['timeline'].name
+    'timeline-all.png'
+    """
+    if single_core or len(tasks) < 2:
+        return {name: func(*args) for name, (func, args) in tasks.items()}
+
+    max_workers = min(len(tasks), 5, os.cpu_count() or 1)
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_get_plt
+    ) as executor:
+        futures = {
+            name: executor.submit(func, *args)
+            for name, (func, args) in tasks.items()
+        }
+        return {name: future.result() for name, future in futures.items()}
@@ -5,22 +5,42 @@ Loads and validates YAML configuration for project analysis.
 """
 
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
+import hashlib
+import os
+import pickle
+import sys
 import yaml
 
+try:
+    #: libyaml-backed loader; several times faster than the pure-Python one
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
-@dataclass
+#: Directory for parsed-config pickles (disable with KPI_NO_CACHE=1)
+CONFIG_CACHE_DIR = Path.home() / ".cache" / "kpi"
+
+#: Parsed-config pickles kept; the least recently written are removed
+_CONFIG_CACHE_ENTRIES = 8
+
+#: Fingerprint of this module's source; pickles written by other versions
+#: of the Config classes are ignored rather than unpickled
+_CONFIG_CACHE_VERSION = hashlib.sha1(Path(__file__).read_bytes()).hexdigest()
+
+
+@dataclass(slots=True, frozen=True)
 class ServiceMetadata:
     """
     Metadata for a single service.
 
     :param category: Service category (e.g., "Core Infrastructure")
-    :param tags: List of tags describing service function
+    :param tags: Tags describing service function, in config order
     :param description: Human-readable service description
     """
     category: str
-    tags: List[str]
+    tags: Tuple[str, ...]
     description: str
 
 
@@ -91,38 +111,120 @@ def _validate_service_metadata(data: dict) -> Dict[str, ServiceMetadata]:
             f"Missing service_metadata for: {', '.join(sorted(missing))}"
         )
 
+    #: Sets for O(1) membership checks inside the service loop
+    valid_tags = frozenset(data['tag_descriptions'])
+    valid_categories = frozenset(data['category_priority'])
+    required = ('category', 'tags', 'description')
+
     service_metadata = {}
     for service_name, meta in data['service_metadata'].items():
         #: Validate required fields present
-        for field in ['category', 'tags', 'description']:
-            if field not in meta:
-                raise ValueError(
-                    f"Service '{service_name}' missing '{field}'"
-                )
-
-        #: Validate tags are defined
-        for tag in meta['tags']:
-            if tag not in data['tag_descriptions']:
-                raise ValueError(
-                    f"Service '{service_name}' uses undefined tag '{tag}'"
-                )
+        missing_field = next((f for f in required if f not in meta), None)
+        if missing_field is not None:
+            raise ValueError(
+                f"Service '{service_name}' missing '{missing_field}'"
+            )
+
+        #: Validate tags are defined (report first undefined in config order)
+        if not valid_tags.issuperset(meta['tags']):
+            tag = next(t for t in meta['tags'] if t not in valid_tags)
+            raise ValueError(
+                f"Service '{service_name}' uses undefined tag '{tag}'"
+            )
 
         #: Validate category is defined
-        if meta['category'] not in data['category_priority']:
+        if meta['category'] not in valid_categories:
             raise ValueError(
                 f"Service '{service_name}' uses undefined "
                 f"category '{meta['category']}'"
             )
 
+        #: Interned so repeated tag/category compares are identity checks
         service_metadata[service_name] = ServiceMetadata(
-            category=meta['category'],
-            tags=meta['tags'],
+            category=sys.intern(meta['category']),
+            tags=tuple(sys.intern(tag) for tag in meta['tags']),
             description=meta['description']
         )
 
     return service_metadata
 
 
+def _config_cache_file(config_file: Path) -> Path:
+    """
+    Get the pickle path caching the parsed form of config_file.
+
+    :param config_file: YAML config file
+    :type config_file: Path
+    :return: Cache file path keyed on the absolute config path
+    :rtype: Path
+    """
+    path_hash = hashlib.sha1(str(config_file.resolve()).encode('utf-8')).hexdigest()
+    return CONFIG_CACHE_DIR / f"config-{path_hash}.pkl"
+
+
+def _load_cached_config(config_file: Path, mtime: int) -> Optional[Config]:
+    """
+    Load a previously parsed Config if config_file is unchanged.
+
+    :param config_file: YAML config file
+    :type config_file: Path
+    :param mtime: Current modification time of config_file (ns)
+    :type mtime: int
+    :return: Cached Config, or None on a miss or unreadable cache
+    :rtype: Optional[Config]
+    """
+    try:
+        with open(_config_cache_file(config_file), 'rb') as f:
+            #: Header is checked before the Config itself is unpickled
+            if pickle.load(f) != (_CONFIG_CACHE_VERSION, mtime):
+                return None
+            config = pickle.load(f)
+    except Exception:
+        return None
+
+    if not isinstance(config, Config):
+        return None
+
+    return config
+
+
+def _store_cached_config(config_file: Path, mtime: int, config: Config) -> None:
+    """
+    Write the parsed Config for config_file to the cache.
+
+    The pickle is written to a temporary file and renamed into place so
+    concurrent runs never read a partial file. Only the newest
+    _CONFIG_CACHE_ENTRIES config pickles are kept, so pickles for config
+    files that are no longer loaded do not pile up. Failures are ignored.
+
+    :param config_file: YAML config file
+    :type config_file: Path
+    :param mtime: Modification time of config_file (ns) when parsed
+    :type mtime: int
+    :param config: Parsed configuration
+    :type config: Config
+    """
+    cache_file = _config_cache_file(config_file)
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, 'wb') as f:
+            pickle.dump((_CONFIG_CACHE_VERSION, mtime), f)
+            pickle.dump(config, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+
+        entries = sorted(
+            cache_file.parent.glob("config-*.pkl"),
+            key=lambda entry: entry.stat().st_mtime_ns,
+            reverse=True
+        )
+        for stale in entries[_CONFIG_CACHE_ENTRIES:]:
+            stale.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
 def load_config(config_path: str = "config.yaml") -> Config:
     """
     Load configuration from YAML file with local override support.
@@ -134,6 +236,10 @@ def load_config(config_path: str = "config.yaml") -> Config:
     This allows maintaining private organization data while keeping
     the public repository generic.
 
+    The parsed Config is cached under CONFIG_CACHE_DIR keyed on the
+    file's path and mtime, so unchanged files skip YAML parsing and
+    validation. Set the KPI_NO_CACHE environment variable to bypass it.
+
     :param config_path: Path to config file (default: config.yaml)
     :type config_path: str
     :return: Validated configuration object
@@ -166,11 +272,18 @@ def load_config(config_path: str = "config.yaml") -> Config:
     if not config_file.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_file}")
 
-    with open(config_file, 'r') as f:
-        try:
-            data = yaml.safe_load(f)
-        except yaml.YAMLError as e:
-            raise yaml.YAMLError(f"Error parsing YAML: {e}")
+    use_cache = not os.environ.get('KPI_NO_CACHE')
+    mtime = config_file.stat().st_mtime_ns
+
+    if use_cache:
+        cached = _load_cached_config(config_file, mtime)
+        if cached is not None:
+            return cached
+
+    try:
+        data = yaml.load(config_file.read_bytes(), Loader=_YamlLoader)
+    except yaml.YAMLError as e:
+        raise yaml.YAMLError(f"Error parsing YAML: {e}")
 
     #: Validate required fields
     required_fields = [
@@ -194,8 +307,8 @@ def load_config(config_path: str = "config.yaml") -> Config:
     #: Validate service metadata
     service_metadata = _validate_service_metadata(data)
 
-    #: Convert string paths to Path objects and return config
-    return Config(
+    #: Convert string paths to Path objects
+    config = Config(
         projects_directory=Path(data['projects_directory']),
         included_projects=data['included_projects'],
         file_exclusions=data['file_exclusions'],
@@ -206,3 +319,8 @@ def load_config(config_path: str = "config.yaml") -> Config:
         category_priority=data['category_priority'],
         tag_groups=data['tag_groups']
     )
+
+    if use_cache:
+        _store_cached_config(config_file, mtime, config)
+
+    return config
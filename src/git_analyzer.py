@@ -7,11 +7,38 @@ line changes between releases for development metrics reporting.
 
 from pathlib import Path
 from datetime import datetime
-from typing import List, Tuple, Union
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Pattern, Sequence, Set, Tuple, Union
+import heapq
+import os
 import re
+import tempfile
 import git
 import fnmatch
 
+#: Semantic version tag: X.Y.Z with optional -suffix (e.g. 1.2.3-rc1)
+_SEMVER_RE = re.compile(r'\d+\.\d+\.\d+(?:-[a-zA-Z0-9]+)?')
+
+#: Bytes read from git's stdout at a time when streaming output
+_STREAM_CHUNK_SIZE = 1 << 20
+
+#: Range walk flags: commit reachable from the range's from_ref / to_ref
+_FROM_SIDE = 1
+_TO_SIDE = 2
+
+#: Repository argument: a path, or a git.Repo opened once and passed along
+RepoLike = Union[Path, git.Repo]
+
+#: One ``--numstat -z`` token: either the "<from tree> <to tree>" line echoed
+#: by git diff-tree --stdin per input pair, or an "added<TAB>removed<TAB>path"
+#: record (renames put "<NUL>old path<NUL>" before the new path). A token
+#: cut off at the end of a read chunk never matches.
+_NUMSTAT_Z_RE = re.compile(
+    rb'([0-9a-f]+) ([0-9a-f]+)\n'
+    rb'|(-|\d+)\t(-|\d+)\t(?:\0[^\0]*\0)?([^\0]+)\0'
+)
+
 
 def _is_semantic_version(tag_name: str) -> bool:
     """
@@ -40,11 +67,32 @@ def _is_semantic_version(tag_name: str) -> bool:
     >>> _is_semantic_version("v1.2.3")
     False
     """
-    pattern = r'^\d+\.\d+\.\d+(-[a-zA-Z0-9]+)?$'
-    return bool(re.match(pattern, tag_name))
+    return _SEMVER_RE.fullmatch(tag_name) is not None
+
+
+def open_repository(repo_path: RepoLike) -> git.Repo:
+    """
+    Open a repository, or return it as-is if it is already open.
+
+    Every function here accepts either form, so callers making several
+    calls for one project can open it once and pass the git.Repo along.
 
+    :param repo_path: Absolute path to git repository, or an open git.Repo
+    :type repo_path: Union[Path, git.Repo]
+    :return: Open repository
+    :rtype: git.Repo
 
-def get_tags(repo_path: Path) -> List[Tuple[str, datetime]]:
+    :Example:
+
+    >>> repo = open_repository(Path("/path/to/repo"))
+    >>> tags = get_tags(repo)
+    """
+    if isinstance(repo_path, (str, os.PathLike)):
+        return git.Repo(repo_path)
+    return repo_path
+
+
+def get_tags(repo_path: RepoLike) -> List[Tuple[str, datetime]]:
     """
     Extract all semantic version tags from repository, sorted chronologically.
 
@@ -52,8 +100,8 @@ def get_tags(repo_path: Path) -> List[Tuple[str, datetime]]:
     versioning pattern (X.Y.Z or X.Y.Z-suffix). Tags are sorted by commit
     date with newest first.
 
-    :param repo_path: Absolute path to git repository
-    :type repo_path: Path
+    :param repo_path: Absolute path to git repository, or an open git.Repo
+    :type repo_path: Union[Path, git.Repo]
     :return: List of (tag_name, tag_date) tuples, newest first
     :rtype: List[Tuple[str, datetime]]
 
@@ -63,39 +111,85 @@ def get_tags(repo_path: Path) -> List[Tuple[str, datetime]]:
     >>> tags[0]
     ('9.2.6', datetime(2025, 11, 15, 10, 30, 0))
     """
-    repo = git.Repo(repo_path)
+    repo = open_repository(repo_path)
     tags_with_dates = []
 
-    for tag in repo.tags:
-        try:
-            #: Get commit date from tag's commit object
-            commit = tag.commit
-            tag_date = datetime.fromtimestamp(commit.committed_date)
+    #: One git call lists every tag with its commit date. *committerdate is
+    #: the dereferenced commit of an annotated tag; committerdate is the
+    #: commit of a lightweight tag (the other field is empty)
+    ref_output = repo.git.for_each_ref(
+        "--format=%(refname:lstrip=2)%09%(*committerdate:unix)%09%(committerdate:unix)",
+        "refs/tags/"
+    )
+
+    for line in ref_output.splitlines():
+        tag_name, _, dates = line.partition('\t')
 
-            #: Filter to semantic versioning pattern only
-            if _is_semantic_version(tag.name):
-                tags_with_dates.append((tag.name, tag_date))
+        #: Filter to semantic versioning pattern only
+        if not _is_semantic_version(tag_name):
+            continue
+
+        peeled_date, _, direct_date = dates.partition('\t')
+        timestamp = peeled_date or direct_date
 
-        except Exception as e:
-            #: Skip problematic tags with warning
-            print(f"⚠️  Warning: Could not parse tag {tag.name}: {e}")
+        if not timestamp:
+            #: Skip problematic tags (e.g. tags pointing at a tree or blob)
+            print(f"⚠️  Warning: Could not parse tag {tag_name}: not a commit")
             continue
 
+        tags_with_dates.append((tag_name, datetime.fromtimestamp(int(timestamp))))
+
     #: Sort by date (newest first) - important for correct ordering
-    tags_with_dates.sort(key=lambda x: x[1], reverse=True)
+    tags_with_dates.sort(key=itemgetter(1), reverse=True)
 
     return tags_with_dates
 
 
-def fetch_repository(repo_path: Path) -> Tuple[bool, str]:
+def _shallow_boundary_after(repo: git.Repo, since: datetime) -> bool:
+    """
+    Check whether a shallow clone's history stops after a given date.
+
+    True only when the clone is shallow and every boundary commit is
+    newer than ``since``, so fetching with ``--shallow-since`` would only
+    deepen history. Complete clones always return False: a shallow fetch
+    would discard their history.
+
+    :param repo: Repository
+    :type repo: git.Repo
+    :param since: Date the history should reach back to
+    :type since: datetime
+    :return: True if ``--shallow-since`` would deepen the clone
+    :rtype: bool
+    """
+    shallow_file = Path(repo.git_dir) / "shallow"
+    if not shallow_file.exists():
+        return False
+
+    boundary = shallow_file.read_text().split()
+    if not boundary:
+        return False
+
+    timestamps = repo.git.log("--no-walk", "--format=%ct", *boundary).split()
+    return min(int(timestamp) for timestamp in timestamps) > since.timestamp()
+
+
+def fetch_repository(
+    repo_path: RepoLike,
+    shallow_since: Optional[datetime] = None
+) -> Tuple[bool, str]:
     """
     Fetch latest tags and commits from remote.
 
     Non-destructive operation that updates remote-tracking branches
-    and tags without modifying the working directory.
-
-    :param repo_path: Absolute path to git repository
-    :type repo_path: Path
+    and tags without modifying the working directory. For a shallow
+    clone whose history starts after ``shallow_since``, the fetch also
+    deepens it back to that date so releases in the reporting period
+    can be measured; complete clones are never made shallow.
+
+    :param repo_path: Absolute path to git repository, or an open git.Repo
+    :type repo_path: Union[Path, git.Repo]
+    :param shallow_since: Start of the reporting period (None for all time)
+    :type shallow_since: Optional[datetime]
     :return: Tuple of (success: bool, message: str)
     :rtype: Tuple[bool, str]
 
@@ -107,7 +201,7 @@ def fetch_repository(repo_path: Path) -> Tuple[bool, str]:
     Success: Fetched 2 new tags
     """
     try:
-        repo = git.Repo(repo_path)
+        repo = open_repository(repo_path)
 
         #: Check if remote exists
         if not repo.remotes:
@@ -115,10 +209,22 @@ def fetch_repository(repo_path: Path) -> Tuple[bool, str]:
 
         #: Fetch tags and commits from origin
         origin = repo.remotes.origin
-        fetch_info = origin.fetch(tags=True, prune=True)
-
-        #: Count new tags fetched
-        new_tags = sum(1 for info in fetch_info if 'tag' in str(info.ref))
+        fetch_info = None
+        if shallow_since is not None and _shallow_boundary_after(repo, shallow_since):
+            try:
+                fetch_info = origin.fetch(
+                    tags=True,
+                    prune=True,
+                    shallow_since=shallow_since.strftime('%Y-%m-%d')
+                )
+            except git.exc.GitCommandError:
+                #: Server may not support deepening by date: plain fetch below
+                fetch_info = None
+        if fetch_info is None:
+            fetch_info = origin.fetch(tags=True, prune=True)
+
+        #: Count tags created by this fetch (not ones already up to date)
+        new_tags = sum(1 for info in fetch_info if info.flags & git.FetchInfo.NEW_TAG)
 
         if new_tags > 0:
             return True, f"Fetched {new_tags} new tag{'s' if new_tags != 1 else ''}"
@@ -138,8 +244,59 @@ def fetch_repository(repo_path: Path) -> Tuple[bool, str]:
         return False, "Fetch failed - using local tags"
 
 
+def write_commit_graph(repo_path: RepoLike) -> bool:
+    """
+    Update the repository's commit-graph file after new commits arrive.
+
+    The commit-graph stores parents and generation numbers so git can
+    answer rev-list, merge-base and log queries without parsing every
+    commit object. Written with ``--split`` so only newly fetched commits
+    are added to the existing chain (a no-op when nothing changed).
+
+    :param repo_path: Absolute path to git repository, or an open git.Repo
+    :type repo_path: Union[Path, git.Repo]
+    :return: True if the commit-graph was written
+    :rtype: bool
+
+    :Example:
+
+    >>> write_commit_graph(Path("/path/to/repo"))
+    True
+    """
+    try:
+        open_repository(repo_path).git.commit_graph("write", "--reachable", "--split")
+        return True
+    except git.GitCommandError:
+        #: Old git or read-only repository: queries still work, just slower
+        return False
+
+
+def get_ref_snapshot(repo_path: RepoLike) -> Optional[str]:
+    """
+    Snapshot HEAD and all tag refs with a single git call.
+
+    Two equal snapshots mean HEAD and every tag still point at the same
+    objects, so tag-based metrics computed earlier are still valid.
+
+    :param repo_path: Absolute path to git repository, or an open git.Repo
+    :type repo_path: Union[Path, git.Repo]
+    :return: "<sha> <refname>" lines, or None if the refs cannot be read
+    :rtype: Optional[str]
+
+    :Example:
+
+    >>> print(get_ref_snapshot(Path("/path/to/repo")))
+    d5479ecdb984b288cf6e9d812123a2cc33e4b212 HEAD
+    abbfbd69711b1d39b14672e32de3e8c11b2a7c9a refs/tags/9.2.6
+    """
+    try:
+        return open_repository(repo_path).git.show_ref("--head", "--tags")
+    except (git.GitCommandError, git.InvalidGitRepositoryError):
+        return None
+
+
 def count_commits_between(
-    repo_path: Path,
+    repo_path: RepoLike,
     from_tag: str,
     to_tag: str,
     return_dates: bool = False
@@ -149,9 +306,11 @@ def count_commits_between(
 
     Uses git range syntax (from_tag..to_tag) to count commits. The range
     excludes from_tag and includes to_tag, following git conventions.
+    The count comes from ``git rev-list --count`` and dates from committer
+    timestamps, so no commit objects are built.
 
-    :param repo_path: Absolute path to git repository
-    :type repo_path: Path
+    :param repo_path: Absolute path to git repository, or an open git.Repo
+    :type repo_path: Union[Path, git.Repo]
     :param from_tag: Older tag (excluded from count)
     :type from_tag: str
     :param to_tag: Newer tag (included in count)
@@ -179,22 +338,24 @@ def count_commits_between(
     >>> len(dates)
     23
     """
-    repo = git.Repo(repo_path)
+    repo = open_repository(repo_path)
 
-    try:
-        #: Use git range syntax: from_tag..to_tag
-        #: This excludes from_tag, includes to_tag
-        commits = list(repo.iter_commits(f"{from_tag}..{to_tag}"))
+    #: Use git range syntax: from_tag..to_tag
+    #: This excludes from_tag, includes to_tag
+    commit_range = f"{from_tag}..{to_tag}"
 
+    try:
         if return_dates:
-            #: Extract commit dates from commit objects
+            #: Read only the committer timestamps, not full commit objects
+            timestamps = repo.git.log("--format=%ct", commit_range, "--").split()
             commit_dates = [
-                datetime.fromtimestamp(commit.committed_date)
-                for commit in commits
+                datetime.fromtimestamp(int(timestamp))
+                for timestamp in timestamps
             ]
-            return len(commits), commit_dates
+            return len(commit_dates), commit_dates
         else:
-            return len(commits)
+            #: git counts the range itself
+            return int(repo.git.rev_list("--count", commit_range, "--"))
 
     except git.GitCommandError as e:
         #: Handle git errors gracefully - return 0 and warn
@@ -202,7 +363,97 @@ def count_commits_between(
         return (0, []) if return_dates else 0
 
 
-def should_exclude_file(filepath: str, exclusion_patterns: List[str]) -> bool:
+def _join_globs(patterns: Sequence[str]) -> Optional[Pattern[str]]:
+    """
+    Compile glob patterns into one alternation regex.
+
+    :param patterns: Glob patterns
+    :type patterns: Sequence[str]
+    :return: Regex matching any pattern, or None if there are none
+    :rtype: Optional[Pattern[str]]
+    """
+    if not patterns:
+        return None
+
+    return re.compile('|'.join(f'(?:{fnmatch.translate(p)})' for p in patterns))
+
+
+def _matches_basename_only(pattern: str) -> bool:
+    """
+    Check whether a pattern can only match a path through its filename.
+
+    True for slash-free literals and for a leading '*' followed by a
+    literal suffix (e.g. "*.lock", "package-lock.json"): if such a pattern
+    matches a full path it also matches the filename, so the full-path
+    check can be skipped. Patterns like "src*" or "?.py" can match across
+    a '/' and still need the full-path check.
+
+    :param pattern: Glob pattern
+    :type pattern: str
+    :return: True if matching the filename alone is sufficient
+    :rtype: bool
+    """
+    if '/' in pattern:
+        return False
+
+    suffix = pattern[1:] if pattern.startswith('*') else pattern
+    return not any(char in suffix for char in '*?[')
+
+
+@lru_cache(maxsize=32)
+def _compile_exclusions(
+    patterns: Tuple[str, ...]
+) -> Tuple[Optional[Pattern[str]], Optional[Pattern[str]]]:
+    """
+    Translate glob exclusion patterns into a filename regex and a path regex.
+
+    Slash-free patterns go into the filename regex, which is tried first
+    on the short basename. Only patterns that can match differently on the
+    full path (those containing '/', or wildcards that could span one) go
+    into the path regex. Results are cached per pattern tuple.
+
+    :param patterns: Glob patterns to exclude
+    :type patterns: Tuple[str, ...]
+    :return: Tuple of (filename regex, full-path regex); either may be None
+    :rtype: Tuple[Optional[Pattern[str]], Optional[Pattern[str]]]
+
+    :Example:
+
+    >>> basename_regex, path_regex = _compile_exclusions(("*.lock", "dist/*"))
+    >>> bool(basename_regex.match("yarn.lock")), bool(path_regex.match("dist/a.js"))
+    (True, True)
+    """
+    basename_patterns = [p for p in patterns if '/' not in p]
+    path_patterns = [p for p in patterns if not _matches_basename_only(p)]
+
+    return _join_globs(basename_patterns), _join_globs(path_patterns)
+
+
+def _is_excluded(
+    filepath: str,
+    exclusion_regexes: Tuple[Optional[Pattern[str]], Optional[Pattern[str]]]
+) -> bool:
+    """
+    Check a file's name, then (only if needed) its full path, for exclusion.
+
+    :param filepath: File path to check
+    :type filepath: str
+    :param exclusion_regexes: Regex pair from _compile_exclusions
+    :type exclusion_regexes: Tuple[Optional[Pattern[str]], Optional[Pattern[str]]]
+    :return: True if file should be excluded
+    :rtype: bool
+    """
+    basename_regex, path_regex = exclusion_regexes
+
+    if basename_regex is not None:
+        basename = filepath.rpartition('/')[2]
+        if basename_regex.match(basename) is not None:
+            return True
+
+    return path_regex is not None and path_regex.match(filepath) is not None
+
+
+def should_exclude_file(filepath: str, exclusion_patterns: Sequence[str]) -> bool:
     """
     Check if file matches any exclusion pattern.
 
@@ -225,19 +476,86 @@ def should_exclude_file(filepath: str, exclusion_patterns: List[str]) -> bool:
     >>> should_exclude_file("src/main.py", ["*.lock"])
     False
     """
-    for pattern in exclusion_patterns:
-        #: Check full path match
-        if fnmatch.fnmatch(filepath, pattern):
-            return True
-        #: Check filename only match
-        if fnmatch.fnmatch(filepath.split('/')[-1], pattern):
-            return True
+    #: Full path or filename-only match against any pattern
+    return _is_excluded(filepath, _compile_exclusions(tuple(exclusion_patterns)))
 
-    return False
+
+def _stream_output(process) -> Iterator[bytes]:
+    """
+    Yield a git process's stdout in chunks, then check its exit status.
+
+    :param process: Process from a GitPython call with as_process=True
+    :return: Iterator over stdout chunks
+    :rtype: Iterator[bytes]
+    :raises git.GitCommandError: If git exits with an error
+    """
+    yield from iter(lambda: process.stdout.read(_STREAM_CHUNK_SIZE), b'')
+    process.wait()
+
+
+def _sum_numstat_z(
+    numstat_chunks: Iterable[bytes],
+    exclusion_regexes: Tuple[Optional[Pattern[str]], Optional[Pattern[str]]]
+) -> Dict[Optional[Tuple[str, str]], Tuple[int, int]]:
+    """
+    Sum added/removed counts from ``--numstat -z`` output, skipping excluded files.
+
+    Records are NUL-terminated ``added<TAB>removed<TAB>path`` with raw
+    (unquoted) paths; renames and copies leave the path empty and follow
+    it with NUL-terminated old and new paths, of which the new one is
+    matched against the exclusions. Rows are grouped under the last
+    ``<from> <to>`` header echoed by ``git diff-tree --stdin``, or under
+    None for plain ``git diff`` output. Output is consumed chunk by chunk,
+    so only a partial token is held over between reads.
+
+    :param numstat_chunks: Raw numstat output, in one or more chunks
+    :type numstat_chunks: Iterable[bytes]
+    :param exclusion_regexes: Regex pair from _compile_exclusions
+    :type exclusion_regexes: Tuple[Optional[Pattern[str]], Optional[Pattern[str]]]
+    :return: Mapping of tree pair (or None) to (lines_added, lines_removed)
+    :rtype: Dict[Optional[Tuple[str, str]], Tuple[int, int]]
+    """
+    totals: Dict[Optional[Tuple[str, str]], Tuple[int, int]] = {}
+    pair = None
+    lines_added = 0
+    lines_removed = 0
+    pending = b''
+
+    for chunk in numstat_chunks:
+        buffer = pending + chunk
+        consumed = 0
+
+        for match in _NUMSTAT_Z_RE.finditer(buffer):
+            consumed = match.end()
+            tree_from, tree_to, added_str, removed_str, filepath = match.groups()
+
+            if tree_from:
+                #: Header: close the previous pair's totals and start the next
+                totals[pair] = (lines_added, lines_removed)
+                pair = (tree_from.decode(), tree_to.decode())
+                lines_added = 0
+                lines_removed = 0
+                continue
+
+            #: Apply exclusions
+            if _is_excluded(filepath.decode('utf-8', 'surrogateescape'), exclusion_regexes):
+                continue
+
+            #: Binary files show '-' for added/removed
+            if added_str != b'-':
+                lines_added += int(added_str)
+            if removed_str != b'-':
+                lines_removed += int(removed_str)
+
+        #: Keep the unterminated tail for the next chunk
+        pending = buffer[consumed:]
+
+    totals[pair] = (lines_added, lines_removed)
+    return totals
 
 
 def calculate_line_changes(
-    repo_path: Path,
+    repo_path: RepoLike,
     from_tag: str,
     to_tag: str,
     exclusions: List[str]
@@ -248,8 +566,8 @@ def calculate_line_changes(
     Applies file exclusion patterns to filter out generated files,
     dependencies, and other unwanted files from line counts.
 
-    :param repo_path: Absolute path to git repository
-    :type repo_path: Path
+    :param repo_path: Absolute path to git repository, or an open git.Repo
+    :type repo_path: Union[Path, git.Repo]
     :param from_tag: Older tag
     :type from_tag: str
     :param to_tag: Newer tag
@@ -270,41 +588,376 @@ def calculate_line_changes(
     >>> added, removed
     (3245, 1102)
     """
-    repo = git.Repo(repo_path)
+    repo = open_repository(repo_path)
+    exclusion_regexes = _compile_exclusions(tuple(exclusions))
 
     try:
-        #: Get diff with numstat (shows additions/deletions per file)
-        diff_output = repo.git.diff(from_tag, to_tag, numstat=True)
+        #: Get diff with numstat (shows additions/deletions per file),
+        #: NUL-separated so paths arrive unquoted
+        diff_process = repo.git.diff(from_tag, to_tag, numstat=True, z=True, as_process=True)
 
-        lines_added = 0
-        lines_removed = 0
+        totals = _sum_numstat_z(_stream_output(diff_process), exclusion_regexes)
+        return totals.get(None, (0, 0))
 
-        for line in diff_output.split('\n'):
-            if not line.strip():
-                continue
+    except git.GitCommandError as e:
+        print(f"⚠️  Warning: Could not calculate line changes {from_tag}..{to_tag}: {e}")
+        return 0, 0
+
+
+#: A git revision range as (from_ref, to_ref), i.e. from_ref..to_ref
+RefRange = Tuple[str, str]
+
+
+def _resolve_refs(repo: git.Repo, refs: Iterable[str]) -> Dict[str, Tuple[str, str]]:
+    """
+    Resolve refs to their commit and tree SHAs with a single rev-parse call.
+
+    :param repo: Repository
+    :type repo: git.Repo
+    :param refs: Tag names or other refs (e.g. "HEAD")
+    :type refs: Iterable[str]
+    :return: Mapping of ref to (commit SHA, tree SHA)
+    :rtype: Dict[str, Tuple[str, str]]
+    """
+    unique_refs = list(dict.fromkeys(refs))
+    if not unique_refs:
+        return {}
+
+    args = [f"{ref}^{{{kind}}}" for ref in unique_refs for kind in ("commit", "tree")]
+    shas = repo.git.rev_parse(*args).split('\n')
+
+    return {
+        ref: (shas[2 * i], shas[2 * i + 1])
+        for i, ref in enumerate(unique_refs)
+    }
+
+
+def resolve_refs(
+    repo_path: RepoLike,
+    refs: Iterable[str]
+) -> Optional[Dict[str, Tuple[str, str]]]:
+    """
+    Resolve many refs to commit and tree SHAs with one git call.
+
+    Pass the result to count_commits_in_ranges and
+    calculate_line_changes_in_ranges so they share one lookup.
+
+    :param repo_path: Absolute path to git repository, or an open git.Repo
+    :type repo_path: Union[Path, git.Repo]
+    :param refs: Tag names or other refs (e.g. "HEAD")
+    :type refs: Iterable[str]
+    :return: Mapping of ref to (commit SHA, tree SHA), or None if any ref
+        cannot be resolved
+    :rtype: Optional[Dict[str, Tuple[str, str]]]
+
+    :Example:
+
+    >>> resolve_refs(Path("/path/to/repo"), ["9.2.6"])
+    {'9.2.6': ('5f1c...', '9a3e...')}
+    """
+    try:
+        return _resolve_refs(open_repository(repo_path), refs)
+    except git.GitCommandError:
+        return None
+
+
+def _common_ancestors(repo: git.Repo, commits: Sequence[str]) -> List[str]:
+    """
+    Find the best common ancestors of all given commits.
+
+    Everything reachable from the result is reachable from every commit,
+    so it can be hidden from a walk that only needs what lies between them
+    and newer refs. Returns an empty list for unrelated histories.
+
+    :param repo: Repository
+    :type repo: git.Repo
+    :param commits: Commit SHAs
+    :type commits: Sequence[str]
+    :return: Merge base SHAs (usually one)
+    :rtype: List[str]
+    """
+    try:
+        return repo.git.merge_base("--octopus", *dict.fromkeys(commits)).split()
+    except git.GitCommandError:
+        #: No common ancestor: merge-base exits non-zero
+        return []
+
+
+def _commit_generations(parents: Dict[str, List[str]]) -> Dict[str, int]:
+    """
+    Number every loaded commit by its generation.
+
+    A commit's generation is one more than its highest parent's (parents
+    missing from the graph count as 0), so every commit ranks strictly
+    above its ancestors regardless of commit timestamps.
 
-            parts = line.split('\t')
-            if len(parts) < 3:
+    :param parents: Commit SHA to parent SHAs for the loaded graph
+    :type parents: Dict[str, List[str]]
+    :return: Commit SHA to generation number
+    :rtype: Dict[str, int]
+
+    :Example:
+
+    >>> _commit_generations({'c3': ['c2'], 'c2': ['c1'], 'c1': []})
+    {'c1': 1, 'c2': 2, 'c3': 3}
+    """
+    generations: Dict[str, int] = {}
+    for root in parents:
+        if root in generations:
+            continue
+        #: Iterative post-order: a commit is numbered after all its parents
+        stack = [root]
+        while stack:
+            sha = stack[-1]
+            pending = [
+                parent for parent in parents[sha]
+                if parent in parents and parent not in generations
+            ]
+            if pending:
+                stack.extend(pending)
                 continue
+            stack.pop()
+            if sha not in generations:
+                generations[sha] = 1 + max(
+                    (generations[parent] for parent in parents[sha] if parent in generations),
+                    default=0
+                )
+    return generations
+
+
+def _commits_in_range(
+    parents: Dict[str, List[str]],
+    generations: Dict[str, int],
+    from_commit: str,
+    to_commit: str
+) -> List[str]:
+    """
+    Find the commits reachable from to_commit but not from from_commit.
+
+    Walks highest generation first, marking each commit as reached from
+    either end. Every descendant of a commit is visited before it, so its
+    marks are final when it is popped, and the walk stops exactly once
+    only from_commit's history is queued. A range therefore costs roughly
+    its own commits, and skewed commit timestamps cannot affect the
+    result. Commits missing from parents (the walk boundary, or a shallow
+    clone's cut) are roots.
+
+    :param parents: Commit SHA to parent SHAs for the loaded graph
+    :type parents: Dict[str, List[str]]
+    :param generations: Result of _commit_generations for parents
+    :type generations: Dict[str, int]
+    :param from_commit: Excluded end of the range
+    :type from_commit: str
+    :param to_commit: Included end of the range
+    :type to_commit: str
+    :return: SHAs in the range
+    :rtype: List[str]
 
-            added_str, removed_str, filepath = parts
+    :Example:
 
-            #: Apply exclusions
-            if should_exclude_file(filepath, exclusions):
+    >>> parents = {'c3': ['c2'], 'c2': ['c1'], 'c1': []}
+    >>> _commits_in_range(parents, _commit_generations(parents), 'c1', 'c3')
+    ['c3', 'c2']
+    """
+    flags: Dict[str, int] = {}
+    queue: List[Tuple[int, str]] = []
+    #: Queued commits not (yet) known to be in from_commit's history
+    interesting = 0
+    for sha, side in ((from_commit, _FROM_SIDE), (to_commit, _TO_SIDE)):
+        if sha in parents:
+            flags[sha] = side
+            heapq.heappush(queue, (-generations[sha], sha))
+            interesting += side == _TO_SIDE
+
+    in_range = []
+    while interesting:
+        _, sha = heapq.heappop(queue)
+        side = flags[sha]
+        if side == _TO_SIDE:
+            interesting -= 1
+            in_range.append(sha)
+
+        for parent in parents[sha]:
+            if parent not in parents:
                 continue
+            parent_side = flags.get(parent)
+            if parent_side is None:
+                flags[parent] = side
+                heapq.heappush(queue, (-generations[parent], parent))
+                interesting += side == _TO_SIDE
+            elif parent_side != parent_side | side:
+                flags[parent] = parent_side | side
+                #: A queued to-side commit turned out to be from-side history
+                interesting -= parent_side == _TO_SIDE
+
+    return in_range
+
+
+def count_commits_in_ranges(
+    repo_path: RepoLike,
+    ranges: Sequence[RefRange],
+    resolved_refs: Optional[Dict[str, Tuple[str, str]]] = None
+) -> Dict[RefRange, List[datetime]]:
+    """
+    Collect commit dates for many from..to ranges with one git log call.
+
+    Equivalent to calling count_commits_between(..., return_dates=True)
+    per range, but reads the commit graph once and resolves each range
+    (commits reachable from to_ref but not from from_ref) in Python. The
+    read stops at the common ancestor of all from_refs, so a narrow
+    reporting period only reads the history inside it.
+    Falls back to per-range calls if the refs cannot be resolved.
+
+    :param repo_path: Absolute path to git repository, or an open git.Repo
+    :type repo_path: Union[Path, git.Repo]
+    :param ranges: (from_ref, to_ref) pairs; from_ref is excluded, to_ref included
+    :type ranges: Sequence[RefRange]
+    :param resolved_refs: SHAs from resolve_refs covering every ref in ranges
+        (looked up here if None)
+    :type resolved_refs: Optional[Dict[str, Tuple[str, str]]]
+    :return: Mapping of each range to its commit dates, newest first
+    :rtype: Dict[RefRange, List[datetime]]
 
-            try:
-                #: Binary files show '-' for added/removed
-                if added_str != '-':
-                    lines_added += int(added_str)
-                if removed_str != '-':
-                    lines_removed += int(removed_str)
-            except ValueError:
-                #: Skip lines that can't be parsed
+    :Example:
+
+    >>> dates = count_commits_in_ranges(
+    ...     Path("/path/to/repo"),
+    ...     [("9.2.5", "9.2.6"), ("9.2.6", "HEAD")]
+    ... )
+    >>> len(dates[("9.2.5", "9.2.6")])
+    23
+    """
+    if not ranges:
+        return {}
+
+    repo = open_repository(repo_path)
+
+    try:
+        resolved = resolved_refs or _resolve_refs(repo, [ref for pair in ranges for ref in pair])
+        commit_pairs = {
+            (from_ref, to_ref): (resolved[from_ref][0], resolved[to_ref][0])
+            for from_ref, to_ref in ranges
+        }
+
+        #: A range between two refs on the same commit (e.g. HEAD still at
+        #: the newest tag) is empty and needs no walk
+        walked_pairs = [pair for pair in commit_pairs.values() if pair[0] != pair[1]]
+        if not walked_pairs:
+            return {commit_range: [] for commit_range in ranges}
+
+        tips = list(dict.fromkeys(commit for pair in walked_pairs for commit in pair))
+        boundary = _common_ancestors(repo, [from_commit for from_commit, _ in walked_pairs])
+
+        #: One pass over every commit reachable from a range endpoint, stopping
+        #: at history shared by every from_ref (which no range can contain)
+        parents: Dict[str, List[str]] = {}
+        timestamps: Dict[str, int] = {}
+        log_args = [*tips, *(f"^{sha}" for sha in boundary), "--"]
+        for line in repo.git.log("--format=%H%x09%P%x09%ct", *log_args).split('\n'):
+            if not line:
                 continue
+            sha, parent_shas, timestamp = line.split('\t')
+            parents[sha] = parent_shas.split()
+            timestamps[sha] = int(timestamp)
 
-        return lines_added, lines_removed
+    except git.GitCommandError as e:
+        print(f"⚠️  Warning: Could not read commit graph, counting ranges one by one: {e}")
+        return {
+            (from_ref, to_ref): count_commits_between(repo, from_ref, to_ref, return_dates=True)[1]
+            for from_ref, to_ref in ranges
+        }
+
+    generations = _commit_generations(parents)
+
+    commit_dates = {}
+    for commit_range, (from_commit, to_commit) in commit_pairs.items():
+        if from_commit == to_commit:
+            commit_dates[commit_range] = []
+            continue
+
+        in_range = _commits_in_range(parents, generations, from_commit, to_commit)
+        commit_dates[commit_range] = [
+            datetime.fromtimestamp(timestamps[sha])
+            for sha in sorted(in_range, key=timestamps.__getitem__, reverse=True)
+        ]
+
+    return commit_dates
+
+
+def calculate_line_changes_in_ranges(
+    repo_path: RepoLike,
+    ranges: Sequence[RefRange],
+    exclusions: List[str],
+    resolved_refs: Optional[Dict[str, Tuple[str, str]]] = None
+) -> Dict[RefRange, Tuple[int, int]]:
+    """
+    Calculate lines added and removed for many ranges with one git call.
+
+    Equivalent to calling calculate_line_changes per range: every pair
+    of trees is fed to a single ``git diff-tree --stdin --numstat`` process
+    instead of spawning one ``git diff`` per range. Falls back to
+    per-range calls if the refs cannot be resolved.
+
+    :param repo_path: Absolute path to git repository, or an open git.Repo
+    :type repo_path: Union[Path, git.Repo]
+    :param ranges: (from_ref, to_ref) pairs to diff
+    :type ranges: Sequence[RefRange]
+    :param exclusions: List of file patterns to exclude
+    :type exclusions: List[str]
+    :param resolved_refs: SHAs from resolve_refs covering every ref in ranges
+        (looked up here if None)
+    :type resolved_refs: Optional[Dict[str, Tuple[str, str]]]
+    :return: Mapping of each range to (lines_added, lines_removed)
+    :rtype: Dict[RefRange, Tuple[int, int]]
+
+    :Example:
+
+    >>> changes = calculate_line_changes_in_ranges(
+    ...     Path("/path/to/repo"),
+    ...     [("9.2.5", "9.2.6")],
+    ...     ["*.lock", "*.min.js"]
+    ... )
+    >>> changes[("9.2.5", "9.2.6")]
+    (3245, 1102)
+    """
+    if not ranges:
+        return {}
+
+    repo = open_repository(repo_path)
+    exclusion_regexes = _compile_exclusions(tuple(exclusions))
+
+    try:
+        resolved = resolved_refs or _resolve_refs(repo, [ref for pair in ranges for ref in pair])
+        tree_pairs = [
+            (resolved[from_ref][1], resolved[to_ref][1])
+            for from_ref, to_ref in ranges
+        ]
+
+        #: Identical trees have nothing to diff
+        diffed_pairs = [pair for pair in dict.fromkeys(tree_pairs) if pair[0] != pair[1]]
+        if not diffed_pairs:
+            return {commit_range: (0, 0) for commit_range in ranges}
+
+        #: diff-tree echoes each "<from> <to>" input line before that pair's
+        #: numstat rows, which splits the combined output back into ranges
+        with tempfile.TemporaryFile() as pairs_file:
+            pairs_file.write(''.join(f"{a} {b}\n" for a, b in diffed_pairs).encode())
+            pairs_file.seek(0)
+            diff_process = repo.git.diff_tree(
+                "--stdin", "--numstat", "-z", "-M", "-r",
+                istream=pairs_file,
+                as_process=True
+            )
+            totals = _sum_numstat_z(_stream_output(diff_process), exclusion_regexes)
 
     except git.GitCommandError as e:
-        print(f"⚠️  Warning: Could not calculate line changes {from_tag}..{to_tag}: {e}")
-        return 0, 0
+        print(f"⚠️  Warning: Could not diff ranges together, diffing one by one: {e}")
+        return {
+            (from_ref, to_ref): calculate_line_changes(repo, from_ref, to_ref, exclusions)
+            for from_ref, to_ref in ranges
+        }
+
+    return {
+        pair: totals.get(trees, (0, 0))
+        for pair, trees in zip(ranges, tree_pairs)
+    }
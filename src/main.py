@@ -5,12 +5,41 @@ Console and HTML-based KPI reporting showing git release metrics from microservi
 """
 
 import argparse
+import contextlib
+import hashlib
+import io
+import json
+import os
+import pickle
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from src.git_analyzer import get_tags, count_commits_between, calculate_line_changes, fetch_repository
-from src.config_manager import load_config
+from src.git_analyzer import (
+    open_repository,
+    get_tags,
+    get_ref_snapshot,
+    resolve_refs,
+    count_commits_in_ranges,
+    calculate_line_changes_in_ranges,
+    fetch_repository,
+    write_commit_graph,
+)
+from src.config_manager import load_config, CONFIG_CACHE_DIR
 from src.report_generator import generate_html_report
 
+#: Directory for analyzed-project pickles, shared with the config cache
+#: (disable with KPI_NO_CACHE=1)
+PROJECT_CACHE_DIR = CONFIG_CACHE_DIR
+
+#: Remotes fetched at once (fetching waits on the network, not the CPU)
+FETCH_WORKERS = 8
+
+#: Fingerprint of the code that builds project data; results computed
+#: by other versions are recomputed rather than reused
+_PROJECT_CACHE_VERSION = hashlib.sha1(
+    Path(__file__).read_bytes() + Path(__file__).with_name("git_analyzer.py").read_bytes()
+).hexdigest()
+
 
 def parse_arguments():
     """
@@ -42,6 +71,8 @@ Examples:
   kpi --html --period 2025-11           # HTML report for November 2025
   kpi --html -o ./reports/monthly       # Custom output directory
   kpi --html --no-fetch                 # Skip git fetch (use local tags only)
+  kpi --html --singlecore               # Analyze and render serially (debugging)
+  kpi --html --inline-charts            # Single self-contained HTML file
 
 Configuration:
   Edit config.yaml to customize:
@@ -61,7 +92,8 @@ Output Formats:
 
 Generated Charts:
   All charts saved as PNG files in reports/.charts/
-  - Print/PDF friendly (static images, 150 DPI)
+  (or embedded in the HTML with --inline-charts)
+  - Print/PDF friendly (static images, 100 DPI)
   - Consistent styling matching HTML theme
   - Top performers highlighted in green
 
@@ -96,6 +128,18 @@ For more information, see README.md or docs/ directory.
         help="Skip git fetch (use local tags only, faster for offline use)"
     )
 
+    parser.add_argument(
+        "--singlecore",
+        action="store_true",
+        help="Analyze projects and render charts serially in one process (useful for debugging)"
+    )
+
+    parser.add_argument(
+        "--inline-charts",
+        action="store_true",
+        help="Embed charts in the HTML as base64 images instead of writing .charts/ PNG files"
+    )
+
     parser.add_argument(
         "--version", "-v",
         action="version",
@@ -105,132 +149,373 @@ For more information, see README.md or docs/ directory.
     return parser.parse_args()
 
 
-def collect_metrics_data(config, enable_fetch: bool = True, period: str = "all"):
+def _project_cache_key(
+    repo,
+    file_exclusions,
+    period_start,
+    period_end
+):
     """
-    Collect metrics from all configured projects.
+    Build the cache key for a project's analyzed metrics.
 
-    :param config: Configuration object
-    :param enable_fetch: Whether to fetch latest tags from remote (default: True)
-    :param period: Reporting period for filtering (default: "all")
-    :return: List of project data dictionaries
+    The key covers HEAD and every tag ref (so commits, fetched tags and
+    moved tags all invalidate it), the exclusions, the period and the
+    analysis code version.
+
+    :param repo: Project repository (path or open git.Repo)
+    :param file_exclusions: File patterns to exclude from line counts
+    :param period_start: Start of the reporting period (None for all time)
+    :param period_end: End of the reporting period (None for all time)
+    :return: Hex digest, or None if caching is disabled or refs are unreadable
     """
-    projects_data = []
+    if os.environ.get('KPI_NO_CACHE'):
+        return None
 
-    #: Import period parsing function
-    from src.report_generator import _parse_period_to_date_range
+    ref_snapshot = get_ref_snapshot(repo)
+    if ref_snapshot is None:
+        return None
 
-    #: Parse period to date range for filtering
-    period_start, period_end = _parse_period_to_date_range(period)
+    key_data = json.dumps([
+        _PROJECT_CACHE_VERSION,
+        ref_snapshot,
+        list(file_exclusions),
+        period_start.isoformat() if period_start else None,
+        period_end.isoformat() if period_end else None,
+    ])
+    return hashlib.sha1(key_data.encode('utf-8')).hexdigest()
 
-    #: Build project paths from configuration
-    project_paths = [
-        config.projects_directory / project_name
-        for project_name in config.included_projects
-    ]
 
-    total_projects = len(project_paths)
+def _project_cache_file(project_path: Path) -> Path:
+    """
+    Get the pickle path caching the analyzed metrics of project_path.
 
-    for index, project_path in enumerate(project_paths, start=1):
-        #: Print project progress header
-        print(f"\n[{index}/{total_projects}] 🔄 Processing {project_path.name}...")
-        #: Validate project exists and is a git repository
-        if not project_path.exists():
-            continue
-        if not (project_path / ".git").exists():
-            continue
-
-        #: Fetch latest tags from remote (if enabled)
-        if enable_fetch:
-            print(f"       📡 Fetching updates...", end=" ", flush=True)
-            success, msg = fetch_repository(project_path)
-            print(f"{'✅' if success else '⚠️ '} {msg}")
-
-        try:
-            print(f"       📊 Analyzing metrics...", end=" ", flush=True)
-            #: Get all tags
-            tags = get_tags(project_path)
-            if not tags:
-                continue
+    :param project_path: Path to the project's git repository
+    :return: Cache file path keyed on the absolute project path
+    """
+    path_hash = hashlib.sha1(str(project_path.resolve()).encode('utf-8')).hexdigest()
+    return PROJECT_CACHE_DIR / f"project-{path_hash}.pkl"
+
+
+def _load_cached_project(project_path: Path, cache_key):
+    """
+    Load previously analyzed project data if its cache key still matches.
+
+    :param project_path: Path to the project's git repository
+    :param cache_key: Key from _project_cache_key (None disables the lookup)
+    :return: Cached project data dictionary, or None on a miss
+    """
+    if cache_key is None:
+        return None
+
+    try:
+        with open(_project_cache_file(project_path), 'rb') as f:
+            #: Key is checked before the project data itself is unpickled
+            if pickle.load(f) != cache_key:
+                return None
+            project_data = pickle.load(f)
+    except Exception:
+        return None
+
+    return project_data if isinstance(project_data, dict) else None
+
+
+def _store_cached_project(project_path: Path, cache_key, project_data) -> None:
+    """
+    Write analyzed project data to the cache under cache_key.
+
+    Written to a temporary file and renamed into place, like the config
+    cache. Failures are ignored.
+
+    :param project_path: Path to the project's git repository
+    :param cache_key: Key from _project_cache_key (None disables the write)
+    :param project_data: Project data dictionary
+    """
+    if cache_key is None:
+        return
+
+    cache_file = _project_cache_file(project_path)
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, 'wb') as f:
+            pickle.dump(cache_key, f)
+            pickle.dump(project_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+
+def _fetch_project(project_path: Path, period_start=None):
+    """
+    Fetch one project's remote and index the fetched commits.
 
-            #: Collect release data (all releases)
-            releases = []
-            total_commits = 0
-            total_lines_added = 0
-            total_lines_removed = 0
-
-            for i, (tag, date) in enumerate(tags):
-                #: Filter by period if specified
-                if period_start and period_end:
-                    if not (period_start <= date <= period_end):
-                        continue  # Skip releases outside period
-
-                if i == 0:
-                    #: First tag (newest) - collect unreleased commits from HEAD to this tag
-                    unreleased_commits, unreleased_dates = count_commits_between(
-                        project_path,
-                        tag,
-                        'HEAD',
-                        return_dates=True
-                    )
-                    releases.append({
-                        'version': tag,
-                        'date': date.strftime('%Y-%m-%d'),
-                        'commits': None,
-                        'lines_added': None,
-                        'lines_removed': None,
-                        'unreleased_commits': unreleased_dates
-                    })
+    Runs in a thread: fetching is network-bound, so all projects are
+    fetched at once before any analysis starts.
+
+    :param project_path: Path to the project's git repository
+    :param period_start: Start of the reporting period (None for all time)
+    :return: (success, message) from fetch_repository, or None if the
+        project is not a git repository
+    """
+    if not (project_path / ".git").exists():
+        return None
+
+    try:
+        repo = open_repository(project_path)
+    except Exception:
+        return None
+
+    success, msg = fetch_repository(repo, shallow_since=period_start)
+    if success:
+        #: Index newly fetched commits for faster history queries
+        write_commit_graph(repo)
+    return success, msg
+
+
+def _analyze_project(
+    project_path: Path,
+    file_exclusions,
+    fetch_result,
+    period_start,
+    period_end
+):
+    """
+    Analyze one project repository.
+
+    Projects share no state, so this runs unchanged in a worker process.
+    Progress and warnings are printed as the work happens. Results are
+    cached under PROJECT_CACHE_DIR and reused until HEAD, a tag, the
+    exclusions or the period change.
+
+    :param project_path: Path to the project's git repository
+    :param file_exclusions: File patterns to exclude from line counts
+    :param fetch_result: (success, message) from _fetch_project, or None if not fetched
+    :param period_start: Start of the reporting period (None for all time)
+    :param period_end: End of the reporting period (None for all time)
+    :return: Project data dictionary, or None if the project was skipped
+    """
+    #: Validate project exists and is a git repository
+    if not project_path.exists():
+        return None
+    if not (project_path / ".git").exists():
+        return None
+
+    #: Open the repository once for every git helper below
+    try:
+        repo = open_repository(project_path)
+    except Exception as e:
+        print(f"       ⚠️  Error processing {project_path.name}: {e}")
+        return None
+
+    #: Report the fetch done up front by collect_metrics_data
+    if fetch_result is not None:
+        success, msg = fetch_result
+        print(f"       📡 Fetching updates... {'✅' if success else '⚠️ '} {msg}")
+
+    #: Reuse the previous analysis if HEAD, tags and settings are unchanged
+    cache_key = _project_cache_key(repo, file_exclusions, period_start, period_end)
+    project_data = _load_cached_project(project_path, cache_key)
+    if project_data is not None:
+        print(f"       📊 Analyzing metrics... ✅ (cached)")
+        print(f"       ✅ Completed: {project_data['release_count']} releases, "
+              f"{project_data['total_commits']} commits, +{project_data['total_lines_added']:,} lines")
+        return project_data
+
+    try:
+        print(f"       📊 Analyzing metrics...", end=" ", flush=True)
+        #: Get all tags
+        tags = get_tags(repo)
+        if not tags:
+            return None
+
+        #: Collect release data (all releases)
+        releases = []
+        total_commits = 0
+        total_lines_added = 0
+        total_lines_removed = 0
+
+        #: Releases inside the reporting period, newest first
+        selected = []
+        for i, (tag, date) in enumerate(tags):
+            if period_start and period_end:
+                if date < period_start:
+                    break  # Tags are newest first: the rest are older still
+                if date > period_end:
                     continue
+            selected.append((i, tag, date))
+
+        #: Newest tag pairs with HEAD (unreleased work), the rest with the next tag
+        commit_ranges = [
+            (tag, 'HEAD' if i == 0 else tags[i-1][0])
+            for i, tag, _ in selected
+        ]
+        line_ranges = [
+            commit_range
+            for (i, _, _), commit_range in zip(selected, commit_ranges)
+            if i > 0
+        ]
+
+        #: One git pass per repository instead of one per tag pair,
+        #: sharing a single lookup of every tag's commit and tree
+        resolved_refs = resolve_refs(repo, [ref for commit_range in commit_ranges for ref in commit_range])
+        range_dates = count_commits_in_ranges(repo, commit_ranges, resolved_refs)
+        range_lines = calculate_line_changes_in_ranges(
+            repo,
+            line_ranges,
+            file_exclusions,
+            resolved_refs
+        )
 
-                #: Count commits and line changes
-                prev_tag = tags[i-1][0]
-                commits, commit_dates = count_commits_between(
-                    project_path,
-                    tag,
-                    prev_tag,
-                    return_dates=True
-                )
-                lines_added, lines_removed = calculate_line_changes(
-                    project_path,
-                    tag,
-                    prev_tag,
-                    config.file_exclusions
-                )
+        for (i, tag, date), commit_range in zip(selected, commit_ranges):
+            commit_dates = range_dates[commit_range]
 
+            if i == 0:
+                #: First tag (newest) - collect unreleased commits from HEAD to this tag
                 releases.append({
                     'version': tag,
                     'date': date.strftime('%Y-%m-%d'),
-                    'commits': commits,
-                    'commit_dates': commit_dates,
-                    'lines_added': lines_added,
-                    'lines_removed': lines_removed
+                    'commits': None,
+                    'lines_added': None,
+                    'lines_removed': None,
+                    'unreleased_commits': commit_dates
                 })
+                continue
 
-                total_commits += commits
-                total_lines_added += lines_added
-                total_lines_removed += lines_removed
-
-            #: Build project summary
-            projects_data.append({
-                'name': project_path.name,
-                'release_count': len(tags),  # All releases
-                'total_commits': total_commits,
-                'total_lines_added': total_lines_added,
-                'total_lines_removed': total_lines_removed,
-                'net_change': total_lines_added - total_lines_removed,
-                'releases': releases
+            #: Count commits and line changes
+            commits = len(commit_dates)
+            lines_added, lines_removed = range_lines[commit_range]
+
+            releases.append({
+                'version': tag,
+                'date': date.strftime('%Y-%m-%d'),
+                'commits': commits,
+                'commit_dates': commit_dates,
+                'lines_added': lines_added,
+                'lines_removed': lines_removed
             })
 
-            #: Print completion status
-            print("✅")
-            print(f"       ✅ Completed: {len(tags)} releases, "
-                  f"{total_commits} commits, +{total_lines_added:,} lines")
+            total_commits += commits
+            total_lines_added += lines_added
+            total_lines_removed += lines_removed
+
+        #: Build project summary
+        project_data = {
+            'name': project_path.name,
+            'release_count': len(tags),  # All releases
+            'total_commits': total_commits,
+            'total_lines_added': total_lines_added,
+            'total_lines_removed': total_lines_removed,
+            'net_change': total_lines_added - total_lines_removed,
+            'releases': releases
+        }
+
+        #: Print completion status
+        print("✅")
+        print(f"       ✅ Completed: {len(tags)} releases, "
+              f"{total_commits} commits, +{total_lines_added:,} lines")
+
+        _store_cached_project(project_path, cache_key, project_data)
+        return project_data
+
+    except Exception as e:
+        print(f"\n       ⚠️  Error processing {project_path.name}: {e}")
+        return None
+
+
+def _analyze_project_captured(*args):
+    """
+    Run _analyze_project with its progress output captured.
 
-        except Exception as e:
-            print(f"\n       ⚠️  Error processing {project_path.name}: {e}")
-            continue
+    Worker processes print at the same time, so their output is returned
+    and printed by the parent in project order instead.
 
-    return projects_data
+    :return: Tuple of (project data or None, captured output)
+    """
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        project_data = _analyze_project(*args)
+    return project_data, output.getvalue()
+
+
+def collect_metrics_data(
+    config,
+    enable_fetch: bool = True,
+    period: str = "all",
+    single_core: bool = False,
+    project_paths=None
+):
+    """
+    Collect metrics from all configured projects.
+
+    All remotes are fetched first in parallel threads (network-bound),
+    then projects are analyzed in parallel worker processes, one per CPU
+    core.
+
+    :param config: Configuration object
+    :param enable_fetch: Whether to fetch latest tags from remote (default: True)
+    :param period: Reporting period for filtering (default: "all")
+    :param single_core: Fetch and analyze projects serially in this process (default: False)
+    :param project_paths: Repositories to analyze instead of the configured projects (default: None)
+    :return: List of project data dictionaries
+    """
+    #: Import period parsing function
+    from src.report_generator import _parse_period_to_date_range
+
+    #: Parse period to date range for filtering
+    period_start, period_end = _parse_period_to_date_range(period)
+
+    #: Build project paths from configuration unless given explicitly
+    if project_paths is None:
+        project_paths = [
+            config.projects_directory / project_name
+            for project_name in config.included_projects
+        ]
+    else:
+        project_paths = [Path(project_path) for project_path in project_paths]
+
+    total_projects = len(project_paths)
+
+    #: Fetch every remote up front; network waits overlap in threads
+    fetch_results = [None] * total_projects
+    if enable_fetch and project_paths:
+        print(f"\n📡 Fetching updates for {total_projects} projects...", flush=True)
+        if single_core:
+            fetch_results = [_fetch_project(path, period_start) for path in project_paths]
+        else:
+            with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, total_projects)) as executor:
+                fetch_results = list(executor.map(
+                    _fetch_project, project_paths, [period_start] * total_projects
+                ))
+
+    project_args = [
+        (project_path, config.file_exclusions, fetch_result, period_start, period_end)
+        for project_path, fetch_result in zip(project_paths, fetch_results)
+    ]
+
+    def print_header(index, project_path):
+        #: Print project progress header
+        print(f"\n[{index}/{total_projects}] 🔄 Processing {project_path.name}...")
+
+    if single_core or total_projects < 2:
+        results = []
+        for index, args in enumerate(project_args, start=1):
+            print_header(index, args[0])
+            results.append(_analyze_project(*args))
+    else:
+        max_workers = min(total_projects, os.cpu_count() or 1)
+        results = []
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            #: map() yields in submission order, so output stays in project order
+            captured = executor.map(_analyze_project_captured, *zip(*project_args))
+            for index, (project_path, (project_data, output)) in enumerate(
+                zip(project_paths, captured), start=1
+            ):
+                print_header(index, project_path)
+                print(output, end="", flush=True)
+                results.append(project_data)
+
+    return [project_data for project_data in results if project_data is not None]
 
 
 def generate_console_output(projects_data, config):
@@ -270,11 +555,14 @@ def generate_console_output(projects_data, config):
         print()
 
 
-def main():
+def main(projects=None):
     """
     Main entry point for KPI report generation.
 
     Supports both console and HTML output formats.
+
+    :param projects: Repository paths to analyze instead of config.yaml's
+        included_projects (default: None)
     """
     args = parse_arguments()
 
@@ -298,7 +586,13 @@ def main():
             print(f"   Date range: {period_start.strftime('%Y-%m-%d')} to {period_end.strftime('%Y-%m-%d')}")
 
     #: Collect metrics from all projects
-    projects_data = collect_metrics_data(config, enable_fetch=not args.no_fetch, period=args.period)
+    projects_data = collect_metrics_data(
+        config,
+        enable_fetch=not args.no_fetch,
+        period=args.period,
+        single_core=args.singlecore,
+        project_paths=projects
+    )
 
     if not projects_data:
         print("❌ No valid projects found to analyze")
@@ -314,7 +608,9 @@ def main():
             projects_data,
             output_dir,
             args.period,
-            config
+            config,
+            single_core=args.singlecore,
+            inline_charts=args.inline_charts
         )
 
         print(f"✅ HTML report generated: {output_path}")
@@ -5,8 +5,127 @@ Analyzes project activity patterns and generates natural language
 summaries with business and technical insights.
 """
 
-from typing import Dict, List, Any, Tuple
-from collections import defaultdict, Counter
+import bisect
+import copy
+import hashlib
+import heapq
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Dict, FrozenSet, List, Any, Optional, Tuple
+from collections import defaultdict
+
+
+@dataclass(slots=True, frozen=True)
+class ServiceInfo:
+    """
+    Per-service fields derived from config metadata.
+
+    :param category: Service category
+    :param tags: Service tags in config order
+    :param tags_set: Service tags for membership tests
+    :param primary_tag: First tag, used as the service capability
+    :param layer: First service layer sharing a tag, or None
+    """
+    category: str
+    tags: Tuple[str, ...]
+    tags_set: FrozenSet[str]
+    primary_tag: Optional[str]
+    layer: Optional[str]
+
+
+#: Recent summaries keyed by input fingerprint, oldest evicted first
+_SUMMARY_CACHE_SIZE = 32
+_summary_cache: Dict[Tuple, Dict[str, Any]] = {}
+
+#: report_data fields a summary reads; only these enter its fingerprint
+_SUMMARY_REPORT_FIELDS = (
+    'period_display',
+    'total_commits',
+    'total_releases',
+    'total_lines_added',
+    'total_lines_removed'
+)
+
+#: Numeric project fields read by the analyzers, with their defaults
+_PROJECT_DEFAULTS = {
+    'total_commits': 0,
+    'total_lines_added': 0,
+    'total_lines_removed': 0,
+    'net_change': 0,
+    'release_count': 0
+}
+
+#: Classification tables: ascending (limit, inclusive) upper bounds and
+#: one label per band; a value belongs to the first band it stays within
+#: (value < limit, or value <= limit when inclusive)
+_CHURN_WORK_TYPES = (
+    [(15, False), (40, True)],
+    ('new_features', 'mixed', 'refactoring')
+)
+_NET_CHANGE_GROWTH_TYPES = (
+    [(-1000, False), (0, True), (1000, True)],
+    ('consolidation', 'maintenance', 'growth', 'expansion')
+)
+_RELEASE_PATTERNS = (
+    [(1.5, False), (3, False)],
+    ('major', 'moderate', 'incremental')
+)
+
+#: Development focus balance point per focus level ({layer} is lowercased)
+_FOCUS_BALANCE_POINTS = {
+    'Primary': (
+        "This concentration enables rapid {layer} improvements. "
+        "However, limited activity in other areas may benefit from "
+        "increased allocation for balanced portfolio development"
+    ),
+    'Secondary': (
+        "Secondary focus provides diversification. Consider opportunities "
+        "to strengthen this area with dedicated sprint allocation"
+    ),
+    'Tertiary': (
+        "Tertiary focus indicates emerging priority. Monitor for potential "
+        "escalation needs in upcoming planning cycles"
+    )
+}
+
+
+def _category_commits(item: Tuple[str, Dict[str, Any]]) -> int:
+    """
+    Sort key for (name, stats) pairs by their commit count.
+
+    :param item: Name and stats dictionary pair
+    :type item: Tuple[str, Dict[str, Any]]
+    :return: Commit count of the pair
+    :rtype: int
+    """
+    return item[1]['commits']
+
+
+def _classify(
+    value: float,
+    table: Tuple[List[Tuple[float, bool]], Tuple[str, ...]]
+) -> str:
+    """
+    Look up the label for a value in a threshold classification table.
+
+    :param value: Value to classify
+    :type value: float
+    :param table: Ascending (limit, inclusive) bounds and band labels
+    :type table: Tuple[List[Tuple[float, bool]], Tuple[str, ...]]
+    :return: Label of the band containing the value
+    :rtype: str
+
+    :Example:
+
+    >>> _classify(40, _CHURN_WORK_TYPES)
+    'mixed'
+    >>> _classify(40.1, _CHURN_WORK_TYPES)
+    'refactoring'
+    """
+    limits, labels = table
+    #: (limit, False) <= (value, False) iff value >= limit, and
+    #: (limit, True) <= (value, False) iff value > limit
+    return labels[bisect.bisect_right(limits, (value, False))]
 
 
 def generate_executive_summary(
@@ -19,7 +138,8 @@ def generate_executive_summary(
 
     Main entry point for narrative generation. Analyzes category
     distribution, development focus, velocity metrics, and top
-    performers to create comprehensive summary.
+    performers to create comprehensive summary. Results are cached per
+    input fingerprint; each caller gets its own copy.
 
     :param projects_data: List of project dictionaries with metrics
     :type projects_data: List[Dict[str, Any]]
@@ -42,28 +162,120 @@ def generate_executive_summary(
     if not projects_data or report_data['total_commits'] == 0:
         return _generate_minimal_summary(report_data['period_display'])
 
+    projects_data = _normalize_projects(projects_data)
+
+    #: Reuse the summary for identical inputs
+    key = _summary_fingerprint(projects_data, report_data, config)
+    cached = _summary_cache.get(key)
+    if cached is not None:
+        return copy.deepcopy(cached)
+
+    narrative = _build_executive_summary(projects_data, report_data, config)
+
+    if len(_summary_cache) >= _SUMMARY_CACHE_SIZE:
+        del _summary_cache[next(iter(_summary_cache))]
+    _summary_cache[key] = narrative
+    return copy.deepcopy(narrative)
+
+
+def _summary_fingerprint(
+    projects_data: List[Dict[str, Any]],
+    report_data: Dict[str, Any],
+    config: Any
+) -> Tuple:
+    """
+    Build a hashable fingerprint of everything a summary depends on.
+
+    Covers each project's name and numeric fields, the scalar report
+    fields in _SUMMARY_REPORT_FIELDS and a digest of the config fields
+    the analyzers read, so other (possibly unhashable) report_data
+    values are ignored and a config edited in place gets a new key.
+
+    :param projects_data: Normalized project dictionaries with metrics
+    :type projects_data: List[Dict[str, Any]]
+    :param report_data: Report totals and metadata
+    :type report_data: Dict[str, Any]
+    :param config: Configuration object with service metadata
+    :type config: Any
+    :return: Fingerprint usable as a dict key
+    :rtype: Tuple
+    """
+    projects_key = tuple(
+        (
+            p['name'],
+            p['total_commits'],
+            p['total_lines_added'],
+            p['total_lines_removed'],
+            p['net_change'],
+            p['release_count']
+        )
+        for p in projects_data
+    )
+    report_key = tuple(report_data.get(field) for field in _SUMMARY_REPORT_FIELDS)
+    return (_config_fingerprint(config), report_key, projects_key)
+
+
+def _config_fingerprint(config: Any) -> str:
+    """
+    Digest the config fields that narrative generation reads.
+
+    :param config: Configuration with service metadata and tag_groups
+    :type config: Any
+    :return: Hex digest of service_metadata and tag_groups
+    :rtype: str
+    """
+    state = repr((sorted(config.service_metadata.items()), config.tag_groups))
+    return hashlib.sha1(state.encode('utf-8')).hexdigest()
+
+
+def _build_executive_summary(
+    projects_data: List[Dict[str, Any]],
+    report_data: Dict[str, Any],
+    config: Any
+) -> Dict[str, Any]:
+    """
+    Run every analyzer and assemble the executive summary.
+
+    :param projects_data: List of project dictionaries with metrics
+    :type projects_data: List[Dict[str, Any]]
+    :param report_data: Report totals and metadata
+    :type report_data: Dict[str, Any]
+    :param config: Configuration object with service metadata
+    :type config: Any
+    :return: Dict with narrative sections
+    :rtype: Dict[str, Any]
+    """
+    #: Single pass over projects; the analyzers below only transform it
+    aggregates = _collect_aggregates(projects_data, config)
+
     #: Analyze activity patterns (Phase 1 functions)
-    category_stats = _analyze_category_distribution(projects_data, config)
+    category_stats = _analyze_category_distribution(
+        projects_data, config, aggregates
+    )
     focus_insights = _identify_development_focus(
-        category_stats, projects_data, config
+        category_stats, projects_data, config, aggregates
     )
     velocity = _calculate_velocity_metrics(report_data)
-    top_performers = _identify_top_performers(projects_data, category_stats)
+    top_performers = _identify_top_performers(
+        projects_data, category_stats, aggregates
+    )
 
     #: Phase 2 analysis
-    api_analysis = _analyze_api_distribution(projects_data, config)
-    layer_analysis = _analyze_service_layers(projects_data, config)
-    concentration = _detect_concentration_risks(projects_data, category_stats)
+    api_analysis = _analyze_api_distribution(projects_data, config, aggregates)
+    layer_analysis = _analyze_service_layers(projects_data, config, aggregates)
+    concentration = _detect_concentration_risks(
+        projects_data, category_stats, aggregates
+    )
     recommendations = _generate_simple_recommendations(
         concentration, api_analysis, layer_analysis, velocity
     )
 
     #: NEW Phase 3 analysis - Dynamic multi-point sections
     multiple_focuses = _identify_multiple_focuses(
-        category_stats, layer_analysis, projects_data, config
+        category_stats, layer_analysis, projects_data, config, aggregates
     )
     dynamic_highlights = _generate_dynamic_highlights(
-        projects_data, category_stats, velocity, config
+        projects_data, category_stats, velocity, config, aggregates
     )
     velocity_breakdown = _break_down_velocity_metrics(velocity, report_data)
 
@@ -86,62 +298,295 @@ def generate_executive_summary(
     return narrative
 
 
-def _analyze_category_distribution(
+def _layer_ranks(service_layers: Dict[str, List[str]]) -> Dict[str, int]:
+    """
+    Map each layer tag to the position of the first layer listing it.
+
+    A service belongs to the first layer (in config order) sharing any
+    of its tags, so the lowest rank among its tags picks that layer
+    with one dict lookup per tag.
+
+    :param service_layers: Layer name to tag list mapping
+    :type service_layers: Dict[str, List[str]]
+    :return: Tag to layer index mapping
+    :rtype: Dict[str, int]
+
+    :Example:
+
+    >>> _layer_ranks({'data_layer': ['ETL'], 'presentation_layer': ['API', 'ETL']})
+    {'ETL': 0, 'API': 1}
+    """
+    ranks = {}
+    for rank, layer_tags in enumerate(service_layers.values()):
+        for tag in layer_tags:
+            ranks.setdefault(tag, rank)
+    return ranks
+
+
+def _build_service_index(config: Any) -> Dict[str, ServiceInfo]:
+    """
+    Resolve every service's metadata and layer from the config.
+
+    Built once per ``_collect_aggregates`` pass and carried in its result
+    as ``service_index``, so it always reflects the config as it is now
+    and nothing outlives the summary being built.
+
+    :param config: Configuration with service metadata and tag_groups
+    :type config: Any
+    :return: Service name to derived service info mapping
+    :rtype: Dict[str, ServiceInfo]
+
+    :Example:
+
+    >>> index = _build_service_index(config)
+    >>> index['api-gateway-service'].layer
+    'presentation_layer'
+    """
+    service_layers = config.tag_groups.get('service_layers', {})
+    layer_names = list(service_layers)
+    layer_ranks = _layer_ranks(service_layers)
+
+    index = {}
+    for service_name, metadata in config.service_metadata.items():
+        tags = tuple(metadata.tags)
+
+        #: Assign to first matching layer
+        rank = min(
+            (layer_ranks[tag] for tag in tags if tag in layer_ranks),
+            default=None
+        )
+        index[service_name] = ServiceInfo(
+            category=metadata.category,
+            tags=tags,
+            tags_set=frozenset(tags),
+            primary_tag=tags[0] if tags else None,
+            layer=layer_names[rank] if rank is not None else None
+        )
+
+    return index
+
+
+def _normalize_projects(projects_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Copy project dicts with missing numeric fields filled with 0.
+
+    Run once per entry point (generate_executive_summary, or an analyzer
+    called without aggregates) so everything downstream can subscript
+    the numeric fields directly. The caller's dicts are never modified.
+
+    :param projects_data: List of project data dictionaries
+    :type projects_data: List[Dict[str, Any]]
+    :return: New project dicts carrying every field in _PROJECT_DEFAULTS
+    :rtype: List[Dict[str, Any]]
+
+    :Example:
+
+    >>> projects = [{'name': 'svc-a', 'total_commits': 3}]
+    >>> _normalize_projects(projects)[0]['release_count']
+    0
+    >>> 'release_count' in projects[0]
+    False
+    """
+    normalized = []
+    for project in projects_data:
+        #: Copy first so the project's own key order is kept
+        project = dict(project)
+        for field, default in _PROJECT_DEFAULTS.items():
+            project.setdefault(field, default)
+        normalized.append(project)
+    return normalized
+
+
+def _collect_aggregates(
     projects_data: List[Dict[str, Any]],
-    config: Any
+    config: Optional[Any]
 ) -> Dict[str, Any]:
     """
-    Analyze distribution of activity across service categories.
+    Aggregate every per-project figure the analyzers need in one pass.
 
-    Groups projects by category and calculates commit/line totals
-    and percentages for each category.
+    Builds the service index once and looks each project up in it once
+    instead of once per analyzer; the index is returned as
+    ``service_index`` for later per-service lookups. ``config`` may be
+    None when only project-level totals are needed. Numeric project
+    fields are subscripted directly, so projects must have been passed
+    through _normalize_projects first.
 
     :param projects_data: List of project data dictionaries
     :type projects_data: List[Dict[str, Any]]
-    :param config: Configuration with service metadata
-    :type config: Any
-    :return: Category statistics dictionary
+    :param config: Configuration with service metadata and tag_groups
+    :type config: Optional[Any]
+    :return: Aggregated totals keyed by figure name
     :rtype: Dict[str, Any]
 
     :Example:
 
-    >>> stats = _analyze_category_distribution(projects, config)
-    >>> stats['categories']['Core Infrastructure']['commits']
-    28
-    >>> stats['categories']['Core Infrastructure']['percentage']
-    75.7
+    >>> aggregates = _collect_aggregates(projects, config)
+    >>> aggregates['categories']['Core Infrastructure']['commits']
+    37
+    >>> aggregates['api_commits']
+    40
+    """
+    service_index = _build_service_index(config) if config is not None else {}
+
+    aggregates = _aggregate_projects(projects_data, service_index)
+
+    aggregates['service_index'] = service_index
+    return aggregates
+
+
+def _aggregate_projects(
+    projects_data: List[Dict[str, Any]],
+    service_index: Dict[str, ServiceInfo]
+) -> Dict[str, Any]:
+    """
+    Single aggregation loop behind ``_collect_aggregates``.
+
+    :param projects_data: Project dicts carrying every numeric field
+    :type projects_data: List[Dict[str, Any]]
+    :param service_index: Service name to derived service info mapping
+    :type service_index: Dict[str, ServiceInfo]
+    :return: Aggregated totals keyed by figure name
+    :rtype: Dict[str, Any]
+    :raises KeyError: If a project dict lacks a numeric field
     """
-    #: Initialize category accumulators
     category_data = defaultdict(lambda: {
         'commits': 0,
         'lines_added': 0,
         'lines_removed': 0,
         'projects': []
     })
-
+    category_tag_commits = defaultdict(int)
+    category_tags = defaultdict(lambda: defaultdict(int))
+    category_layer_commits = defaultdict(lambda: defaultdict(int))
+    layer_commits = defaultdict(int)
+    api_services = []
+    api_commits = 0
+    category_commits = 0
+    category_lines_added = 0
+    category_lines_removed = 0
     total_commits = 0
-    total_lines_added = 0
+    total_releases = 0
+    dormant_count = 0
+    top_by_commits = None
+    top_by_growth = None
+    top_commits_seen = 0
+    top_growth_seen = 0
+    top_service = None
+    top_commits = 0
 
-    #: Aggregate metrics by category
     for project in projects_data:
         project_name = project['name']
+        commits = project['total_commits']
+        net_change = project['net_change']
 
-        #: Get category from metadata
-        if project_name in config.service_metadata:
-            metadata = config.service_metadata[project_name]
-            category = metadata.category
+        total_commits += commits
+        total_releases += project['release_count']
+        if commits == 0:
+            dormant_count += 1
+
+        #: First project wins ties, matching a stable descending sort
+        if top_by_commits is None or commits > top_commits_seen:
+            top_by_commits = project
+            top_commits_seen = commits
+        if top_by_growth is None or net_change > top_growth_seen:
+            top_by_growth = project
+            top_growth_seen = net_change
+        if commits > top_commits:
+            top_commits = commits
+            top_service = project_name
+
+        info = service_index.get(project_name)
+        if info is None:
+            continue
+
+        category = info.category
+        layer = info.layer
+        lines_added = project['total_lines_added']
+        lines_removed = project['total_lines_removed']
+
+        data = category_data[category]
+        data['commits'] += commits
+        data['lines_added'] += lines_added
+        data['lines_removed'] += lines_removed
+        data['projects'].append(project_name)
+        category_commits += commits
+        category_lines_added += lines_added
+        category_lines_removed += lines_removed
+
+        for tag in info.tags:
+            category_tag_commits[(category, tag)] += commits
+
+        if 'API' in info.tags_set:
+            api_services.append(project_name)
+            api_commits += commits
+
+        if layer is not None:
+            layer_commits[layer] += commits
+
+        if commits > 0:
+            tag_counts = category_tags[category]
+            for tag in info.tags:
+                tag_counts[tag] += 1
+            if layer is not None:
+                category_layer_commits[category][layer] += commits
+
+    return {
+        'categories': dict(category_data),
+        'category_commits': category_commits,
+        'category_lines_added': category_lines_added,
+        'category_lines_removed': category_lines_removed,
+        'category_tag_commits': category_tag_commits,
+        'category_tags': category_tags,
+        'category_layer_commits': category_layer_commits,
+        'layer_commits': layer_commits,
+        'api_services': api_services,
+        'api_commits': api_commits,
+        'total_commits': total_commits,
+        'total_releases': total_releases,
+        'total_services': len(projects_data),
+        'dormant_count': dormant_count,
+        'top_by_commits': top_by_commits,
+        'top_by_growth': top_by_growth,
+        'top_service': top_service,
+        'top_commits': top_commits
+    }
 
-            commits = project.get('total_commits', 0)
-            lines_added = project.get('total_lines_added', 0)
-            lines_removed = project.get('total_lines_removed', 0)
 
-            category_data[category]['commits'] += commits
-            category_data[category]['lines_added'] += lines_added
-            category_data[category]['lines_removed'] += lines_removed
-            category_data[category]['projects'].append(project_name)
+def _analyze_category_distribution(
+    projects_data: List[Dict[str, Any]],
+    config: Any,
+    aggregates: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Analyze distribution of activity across service categories.
+
+    Groups projects by category and calculates commit/line totals
+    and percentages for each category.
+
+    :param projects_data: List of project data dictionaries
+    :type projects_data: List[Dict[str, Any]]
+    :param config: Configuration with service metadata
+    :type config: Any
+    :param aggregates: Precomputed ``_collect_aggregates`` result
+    :type aggregates: Optional[Dict[str, Any]]
+    :return: Category statistics dictionary
+    :rtype: Dict[str, Any]
+
+    :Example:
+
+    >>> stats = _analyze_category_distribution(projects, config)
+    >>> stats['categories']['Core Infrastructure']['commits']
+    28
+    >>> stats['categories']['Core Infrastructure']['percentage']
+    75.7
+    """
+    if aggregates is None:
+        projects_data = _normalize_projects(projects_data)
+        aggregates = _collect_aggregates(projects_data, config)
 
-            total_commits += commits
-            total_lines_added += lines_added
+    category_data = aggregates['categories']
+    total_commits = aggregates['category_commits']
+    total_lines_added = aggregates['category_lines_added']
 
     #: Calculate percentages and sort by commits
     categories_with_pct = {}
@@ -155,14 +600,16 @@ def _analyze_category_distribution(
     #: Sort categories by commit count
     sorted_categories = sorted(
         categories_with_pct.items(),
-        key=lambda x: x[1]['commits'],
+        key=_category_commits,
         reverse=True
     )
 
     return {
         'categories': dict(sorted_categories),
+        'sorted_categories_list': sorted_categories,
         'total_commits': total_commits,
         'total_lines_added': total_lines_added,
+        'total_lines_removed': aggregates['category_lines_removed'],
         'top_category': sorted_categories[0] if sorted_categories else None
     }
 
@@ -170,7 +617,8 @@ def _analyze_category_distribution(
 def _identify_development_focus(
     category_stats: Dict[str, Any],
     projects_data: List[Dict[str, Any]],
-    config: Any
+    config: Any,
+    aggregates: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
     """
     Identify development focus areas using tags and churn analysis.
@@ -184,6 +632,8 @@ def _identify_development_focus(
     :type projects_data: List[Dict[str, Any]]
     :param config: Configuration with tag descriptions
     :type config: Any
+    :param aggregates: Precomputed ``_collect_aggregates`` result
+    :type aggregates: Optional[Dict[str, Any]]
     :return: Focus insights dictionary
     :rtype: Dict[str, Any]
 
@@ -195,57 +645,50 @@ def _identify_development_focus(
     >>> focus['top_tags']
     ['orchestration', 'data_processing']
     """
+    if aggregates is None:
+        projects_data = _normalize_projects(projects_data)
+        aggregates = _collect_aggregates(projects_data, config)
+
     #: Collect tags from top 2-3 categories
-    tag_counts = Counter()
-    top_categories = list(category_stats['categories'].keys())[:3]
+    tag_counts = defaultdict(int)
+    sorted_categories = category_stats.get('sorted_categories_list')
+    if sorted_categories is None:
+        sorted_categories = list(category_stats['categories'].items())
+    top_categories = [name for name, _ in sorted_categories[:3]]
 
-    for project in projects_data:
-        project_name = project['name']
-        if project_name in config.service_metadata:
-            metadata = config.service_metadata[project_name]
-            if metadata.category in top_categories:
-                commits = project.get('total_commits', 0)
-                for tag in metadata.tags:
-                    tag_counts[tag] += commits
+    for (category, tag), commits in aggregates['category_tag_commits'].items():
+        if category in top_categories:
+            tag_counts[tag] += commits
 
     #: Get top 3 tags
-    top_tags = [tag for tag, _ in tag_counts.most_common(3)]
+    top_tags = [
+        tag for tag, _ in heapq.nlargest(3, tag_counts.items(), key=itemgetter(1))
+    ]
 
     #: Calculate churn rate
     total_added = category_stats['total_lines_added']
-    total_removed = sum(
-        cat['lines_removed']
-        for cat in category_stats['categories'].values()
-    )
+    total_removed = category_stats.get('total_lines_removed')
+    if total_removed is None:
+        total_removed = sum(
+            cat['lines_removed']
+            for cat in category_stats['categories'].values()
+        )
 
     churn_rate = (total_removed / total_added * 100) if total_added > 0 else 0
 
     #: Determine work type based on churn
-    if churn_rate < 15:
-        work_type = 'new_features'
-    elif churn_rate < 40:
-        work_type = 'mixed'
-    else:
-        work_type = 'refactoring'
+    work_type = _classify(churn_rate, _CHURN_WORK_TYPES)
 
     #: Calculate commit/release ratio (if available)
     total_commits = category_stats['total_commits']
     avg_commits_per_release = 0
-    total_releases = 0
-
-    for project in projects_data:
-        total_releases += project.get('release_count', 0)
+    total_releases = aggregates['total_releases']
 
     if total_releases > 0:
         avg_commits_per_release = total_commits / total_releases
 
     #: Determine release pattern
-    if avg_commits_per_release < 1.5:
-        release_pattern = 'major'
-    elif avg_commits_per_release < 3.0:
-        release_pattern = 'moderate'
-    else:
-        release_pattern = 'incremental'
+    release_pattern = _classify(avg_commits_per_release, _RELEASE_PATTERNS)
 
     return {
         'top_tags': top_tags,
@@ -298,30 +741,13 @@ def _calculate_velocity_metrics(report_data: Dict[str, Any]) -> Dict[str, Any]:
     churn_rate = (total_lines_removed / total_lines_added * 100) if total_lines_added > 0 else 0
 
     #: Classify work type based on churn rate
-    if churn_rate < 15:
-        work_type = 'new_features'
-    elif churn_rate > 40:
-        work_type = 'refactoring'
-    else:
-        work_type = 'mixed'
+    work_type = _classify(churn_rate, _CHURN_WORK_TYPES)
 
     #: Determine growth type
-    if net_change > 1000:
-        growth_type = 'expansion'
-    elif net_change > 0:
-        growth_type = 'growth'
-    elif net_change < -1000:
-        growth_type = 'consolidation'
-    else:
-        growth_type = 'maintenance'
+    growth_type = _classify(net_change, _NET_CHANGE_GROWTH_TYPES)
 
     #: Determine release pattern
-    if avg_commits_per_release < 1.5:
-        release_pattern = 'major'
-    elif avg_commits_per_release < 3:
-        release_pattern = 'moderate'
-    else:
-        release_pattern = 'incremental'
+    release_pattern = _classify(avg_commits_per_release, _RELEASE_PATTERNS)
 
     return {
         'avg_commits_per_release': round(avg_commits_per_release, 1),
@@ -336,7 +762,8 @@ def _calculate_velocity_metrics(report_data: Dict[str, Any]) -> Dict[str, Any]:
 
 def _identify_top_performers(
     projects_data: List[Dict[str, Any]],
-    category_stats: Dict[str, Any]
+    category_stats: Dict[str, Any],
+    aggregates: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
     """
     Identify top performing projects by various metrics.
@@ -348,6 +775,8 @@ def _identify_top_performers(
     :type projects_data: List[Dict[str, Any]]
     :param category_stats: Category distribution stats
     :type category_stats: Dict[str, Any]
+    :param aggregates: Precomputed ``_collect_aggregates`` result
+    :type aggregates: Optional[Dict[str, Any]]
     :return: Top performers dictionary
     :rtype: Dict[str, Any]
 
@@ -357,32 +786,20 @@ def _identify_top_performers(
     >>> performers['top_by_commits']['name']
     'api-gateway-service'
     """
-    if not projects_data:
-        return {'top_by_commits': None, 'top_by_growth': None}
-
-    #: Sort by commits
-    by_commits = sorted(
-        projects_data,
-        key=lambda p: p.get('total_commits', 0),
-        reverse=True
-    )
-
-    #: Sort by net change
-    by_growth = sorted(
-        projects_data,
-        key=lambda p: p.get('net_change', 0),
-        reverse=True
-    )
+    if aggregates is None:
+        projects_data = _normalize_projects(projects_data)
+        aggregates = _collect_aggregates(projects_data, None)
 
     return {
-        'top_by_commits': by_commits[0] if by_commits else None,
-        'top_by_growth': by_growth[0] if by_growth else None
+        'top_by_commits': aggregates['top_by_commits'],
+        'top_by_growth': aggregates['top_by_growth']
     }
 
 
 def _analyze_api_distribution(
     projects_data: List[Dict[str, Any]],
-    config: Any
+    config: Any,
+    aggregates: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
     """
     Analyze distribution of API vs non-API services.
@@ -394,24 +811,18 @@ def _analyze_api_distribution(
     :type projects_data: List[Dict[str, Any]]
     :param config: Configuration with service metadata
     :type config: Any
+    :param aggregates: Precomputed ``_collect_aggregates`` result
+    :type aggregates: Optional[Dict[str, Any]]
     :return: API distribution analysis
     :rtype: Dict[str, Any]
     """
-    api_services = []
-    api_commits = 0
-    total_commits = 0
-
-    for project in projects_data:
-        project_name = project['name']
-        commits = project.get('total_commits', 0)
-        total_commits += commits
+    if aggregates is None:
+        projects_data = _normalize_projects(projects_data)
+        aggregates = _collect_aggregates(projects_data, config)
 
-        #: Check if service has API tag
-        if project_name in config.service_metadata:
-            tags = config.service_metadata[project_name].tags
-            if 'API' in tags:
-                api_services.append(project_name)
-                api_commits += commits
+    api_services = aggregates['api_services']
+    api_commits = aggregates['api_commits']
+    total_commits = aggregates['total_commits']
 
     api_percentage = (api_commits / total_commits * 100) if total_commits > 0 else 0
 
@@ -426,7 +837,8 @@ def _analyze_api_distribution(
 
 def _analyze_service_layers(
     projects_data: List[Dict[str, Any]],
-    config: Any
+    config: Any,
+    aggregates: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
     """
     Analyze activity distribution across service layers.
@@ -438,30 +850,21 @@ def _analyze_service_layers(
     :type projects_data: List[Dict[str, Any]]
     :param config: Configuration with tag_groups
     :type config: Any
+    :param aggregates: Precomputed ``_collect_aggregates`` result
+    :type aggregates: Optional[Dict[str, Any]]
     :return: Layer distribution analysis
     :rtype: Dict[str, Any]
     """
-    from collections import defaultdict
+    if aggregates is None:
+        projects_data = _normalize_projects(projects_data)
+        aggregates = _collect_aggregates(projects_data, config)
 
-    layer_commits = defaultdict(int)
-    total_commits = sum(p.get('total_commits', 0) for p in projects_data)
+    layer_commits = aggregates['layer_commits']
+    total_commits = aggregates['total_commits']
 
     #: Get layer definitions from config
     service_layers = config.tag_groups.get('service_layers', {})
 
-    for project in projects_data:
-        project_name = project['name']
-        commits = project.get('total_commits', 0)
-
-        if project_name in config.service_metadata:
-            project_tags = set(config.service_metadata[project_name].tags)
-
-            #: Assign to layer based on tag match
-            for layer_name, layer_tags in service_layers.items():
-                if any(tag in project_tags for tag in layer_tags):
-                    layer_commits[layer_name] += commits
-                    break  # Assign to first matching layer
-
     #: Calculate percentages
     layer_distribution = {}
     for layer_name in service_layers.keys():
@@ -480,7 +883,8 @@ def _analyze_service_layers(
 
 def _detect_concentration_risks(
     projects_data: List[Dict[str, Any]],
-    category_stats: Dict[str, Any]
+    category_stats: Dict[str, Any],
+    aggregates: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
     """
     Detect concentration risks from single service dominance.
@@ -492,25 +896,24 @@ def _detect_concentration_risks(
     :type projects_data: List[Dict[str, Any]]
     :param category_stats: Category distribution statistics
     :type category_stats: Dict[str, Any]
+    :param aggregates: Precomputed ``_collect_aggregates`` result
+    :type aggregates: Optional[Dict[str, Any]]
     :return: Concentration risk analysis
     :rtype: Dict[str, Any]
     """
-    total_commits = sum(p.get('total_commits', 0) for p in projects_data)
+    if aggregates is None:
+        projects_data = _normalize_projects(projects_data)
+        aggregates = _collect_aggregates(projects_data, None)
 
-    #: Find service with most commits
-    top_service = None
-    top_commits = 0
-    for project in projects_data:
-        commits = project.get('total_commits', 0)
-        if commits > top_commits:
-            top_commits = commits
-            top_service = project['name']
+    total_commits = aggregates['total_commits']
+    top_service = aggregates['top_service']
+    top_commits = aggregates['top_commits']
 
     concentration_percentage = (top_commits / total_commits * 100) if total_commits > 0 else 0
 
     #: Count dormant services (0 commits)
-    dormant_count = sum(1 for p in projects_data if p.get('total_commits', 0) == 0)
-    total_services = len(projects_data)
+    dormant_count = aggregates['dormant_count']
+    total_services = aggregates['total_services']
     dormant_percentage = (dormant_count / total_services * 100) if total_services > 0 else 0
 
     return {
@@ -526,7 +929,8 @@ def _detect_concentration_risks(
 def _get_top_tags_for_category(
     projects_data: List[Dict[str, Any]],
     category_name: str,
-    config: Any
+    config: Any,
+    aggregates: Optional[Dict[str, Any]] = None
 ) -> List[str]:
     """
     Extract top 2-3 tags for services in a category.
@@ -536,30 +940,29 @@ def _get_top_tags_for_category(
     :param category_name: Category to analyze
     :type category_name: str
     :param config: Config object with metadata
+    :param aggregates: Precomputed ``_collect_aggregates`` result
+    :type aggregates: Optional[Dict[str, Any]]
     :return: List of top tags
     :rtype: List[str]
     """
-    from collections import Counter
-
-    tags = []
-    for project in projects_data:
-        project_name = project['name']
-        if project_name in config.service_metadata:
-            metadata = config.service_metadata[project_name]
-            if metadata.category == category_name and project.get('total_commits', 0) > 0:
-                tags.extend(metadata.tags)
-
-    #: Count tag frequencies and return top 3
-    if tags:
-        tag_counts = Counter(tags)
-        return [tag for tag, _ in tag_counts.most_common(3)]
+    if aggregates is None:
+        projects_data = _normalize_projects(projects_data)
+        aggregates = _collect_aggregates(projects_data, config)
+
+    #: Tag frequencies across active services; return top 3
+    tag_counts = aggregates['category_tags'].get(category_name)
+    if tag_counts:
+        return [
+            tag for tag, _ in heapq.nlargest(3, tag_counts.items(), key=itemgetter(1))
+        ]
     return []
 
 
 def _get_dominant_layer_for_category(
     projects_data: List[Dict[str, Any]],
     category_name: str,
-    config: Any
+    config: Any,
+    aggregates: Optional[Dict[str, Any]] = None
 ) -> str:
     """
     Find dominant service layer for a category.
@@ -569,33 +972,20 @@ def _get_dominant_layer_for_category(
     :param category_name: Category to analyze
     :type category_name: str
     :param config: Config object with metadata
+    :param aggregates: Precomputed ``_collect_aggregates`` result
+    :type aggregates: Optional[Dict[str, Any]]
     :return: Dominant layer name (title cased)
     :rtype: str
     """
-    from collections import defaultdict
-
-    layer_commits = defaultdict(int)
-    service_layers = config.tag_groups.get('service_layers', {})
-
-    #: Aggregate commits by layer for this category
-    for project in projects_data:
-        project_name = project['name']
-        commits = project.get('total_commits', 0)
+    if aggregates is None:
+        projects_data = _normalize_projects(projects_data)
+        aggregates = _collect_aggregates(projects_data, config)
 
-        if project_name in config.service_metadata:
-            metadata = config.service_metadata[project_name]
-            if metadata.category == category_name and commits > 0:
-                project_tags = set(metadata.tags)
-
-                #: Find matching layer
-                for layer_name, layer_tags in service_layers.items():
-                    if any(tag in project_tags for tag in layer_tags):
-                        layer_commits[layer_name] += commits
-                        break
+    layer_commits = aggregates['category_layer_commits'].get(category_name)
 
     #: Return dominant layer
     if layer_commits:
-        dominant = max(layer_commits.items(), key=lambda x: x[1])[0]
+        dominant = max(layer_commits.items(), key=itemgetter(1))[0]
         return dominant.replace('_', ' ').title()
     return "Unknown Layer"
 
@@ -604,7 +994,8 @@ def _identify_multiple_focuses(
     category_stats: Dict[str, Any],
     layer_analysis: Dict[str, Any],
     projects_data: List[Dict[str, Any]],
-    config: Any
+    config: Any,
+    aggregates: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
     """
     Identify top 3 development focuses by category AND layer.
@@ -621,15 +1012,23 @@ def _identify_multiple_focuses(
     :param projects_data: List of project data
     :type projects_data: List[Dict[str, Any]]
     :param config: Config object with metadata
+    :param aggregates: Precomputed ``_collect_aggregates`` result
+    :type aggregates: Optional[Dict[str, Any]]
     :return: Dict with focus hierarchy
     :rtype: Dict[str, Any]
     """
-    #: Sort categories by commit count
-    categories_sorted = sorted(
-        category_stats['categories'].items(),
-        key=lambda x: x[1]['commits'],
-        reverse=True
-    )
+    if aggregates is None:
+        projects_data = _normalize_projects(projects_data)
+        aggregates = _collect_aggregates(projects_data, config)
+
+    #: Categories by commit count; hand-built stats may be unsorted
+    categories_sorted = category_stats.get('sorted_categories_list')
+    if categories_sorted is None:
+        categories_sorted = sorted(
+            category_stats['categories'].items(),
+            key=_category_commits,
+            reverse=True
+        )
 
     #: Build focus list based on thresholds
     focuses = []
@@ -640,10 +1039,12 @@ def _identify_multiple_focuses(
 
         #: Get dominant layer globally (not just for this category)
         layer_dist = layer_analysis['layer_distribution']
-        dominant_layer = max(layer_dist.items(), key=lambda x: x[1]['commits'])
+        dominant_layer = max(layer_dist.items(), key=_category_commits)
 
         #: Get top tags for this category
-        top_tags = _get_top_tags_for_category(projects_data, cat_name, config)
+        top_tags = _get_top_tags_for_category(
+            projects_data, cat_name, config, aggregates
+        )
 
         focuses.append({
             'level': 'Primary',
@@ -657,8 +1058,12 @@ def _identify_multiple_focuses(
     if len(categories_sorted) > 1:
         cat_name, cat_data = categories_sorted[1]
         if cat_data['percentage'] > 10:
-            layer = _get_dominant_layer_for_category(projects_data, cat_name, config)
-            top_tags = _get_top_tags_for_category(projects_data, cat_name, config)
+            layer = _get_dominant_layer_for_category(
+                projects_data, cat_name, config, aggregates
+            )
+            top_tags = _get_top_tags_for_category(
+                projects_data, cat_name, config, aggregates
+            )
 
             focuses.append({
                 'level': 'Secondary',
@@ -672,8 +1077,12 @@ def _identify_multiple_focuses(
     if len(categories_sorted) > 2:
         cat_name, cat_data = categories_sorted[2]
         if cat_data['percentage'] > 5:
-            layer = _get_dominant_layer_for_category(projects_data, cat_name, config)
-            top_tags = _get_top_tags_for_category(projects_data, cat_name, config)
+            layer = _get_dominant_layer_for_category(
+                projects_data, cat_name, config, aggregates
+            )
+            top_tags = _get_top_tags_for_category(
+                projects_data, cat_name, config, aggregates
+            )
 
             focuses.append({
                 'level': 'Tertiary',
@@ -689,20 +1098,29 @@ def _identify_multiple_focuses(
     }
 
 
-def _get_service_capability(service_name: str, config: Any) -> str:
+def _get_service_capability(
+    service_name: str,
+    config: Any,
+    service_index: Optional[Dict[str, ServiceInfo]] = None
+) -> str:
     """
     Extract primary capability from service metadata.
 
     :param service_name: Service name
     :type service_name: str
     :param config: Config object
+    :param service_index: Index from ``_collect_aggregates`` (built from
+        config if None)
+    :type service_index: Optional[Dict[str, ServiceInfo]]
     :return: Primary capability/tag
     :rtype: str
     """
-    if service_name in config.service_metadata:
-        tags = config.service_metadata[service_name].tags
-        if tags:
-            return tags[0]  # Primary tag as capability
+    if service_index is None:
+        service_index = _build_service_index(config)
+
+    info = service_index.get(service_name)
+    if info is not None and info.primary_tag is not None:
+        return info.primary_tag  # Primary tag as capability
     return "development"
 
 
@@ -710,7 +1128,8 @@ def _generate_dynamic_highlights(
     projects_data: List[Dict[str, Any]],
     category_stats: Dict[str, Any],
     velocity: Dict[str, Any],
-    config: Any
+    config: Any,
+    aggregates: Optional[Dict[str, Any]] = None
 ) -> List[Dict[str, str]]:
     """
     Generate 3-5 dynamic highlights based on data patterns.
@@ -732,23 +1151,31 @@ def _generate_dynamic_highlights(
     :param velocity: Velocity metrics
     :type velocity: Dict[str, Any]
     :param config: Config object
+    :param aggregates: Precomputed ``_collect_aggregates`` result
+    :type aggregates: Optional[Dict[str, Any]]
     :return: List of highlight dicts with positive + cautionary
     :rtype: List[Dict[str, str]]
     """
+    if aggregates is None:
+        projects_data = _normalize_projects(projects_data)
+        aggregates = _collect_aggregates(projects_data, config)
+
     highlights = []
     highlighted_services = set()  # Track services already highlighted
-    total_commits = sum(p.get('total_commits', 0) for p in projects_data)
+    total_commits = aggregates['total_commits']
 
     #: 1. Top performer (ALWAYS include)
-    top_project = max(projects_data, key=lambda p: p.get('total_commits', 0))
-    if top_project.get('total_commits', 0) > 0:
+    top_project = aggregates['top_by_commits']
+    if top_project is not None and top_project['total_commits'] > 0:
         commits = top_project['total_commits']
-        lines = top_project.get('total_lines_added', 0)
+        lines = top_project['total_lines_added']
         service_name = top_project['name']
         highlighted_services.add(service_name)  # Track it
 
         #: Get service capability from config
-        capability = _get_service_capability(service_name, config)
+        capability = _get_service_capability(
+            service_name, config, aggregates['service_index']
+        )
 
         positive = (
             f"{service_name} led with {commits} commits "
@@ -765,14 +1192,16 @@ def _generate_dynamic_highlights(
         highlights.append({'positive': positive, 'cautionary': cautionary})
 
     #: 2. Fastest growing (if growth > 30% and not already highlighted)
+    fastest_service = None
+    fastest_rate = 30
     for project in projects_data:
         service_name = project['name']
         if service_name in highlighted_services:
             continue  # Skip already highlighted services
 
-        lines_added = project.get('total_lines_added', 0)
-        lines_removed = project.get('total_lines_removed', 0)
-        net_change = project.get('net_change', 0)
+        lines_added = project['total_lines_added']
+        lines_removed = project['total_lines_removed']
+        net_change = project['net_change']
 
         #: Calculate growth rate (simplified - based on lines_removed as proxy for previous size)
         if lines_added > 0 and lines_removed > 0:
@@ -780,18 +1209,22 @@ def _generate_dynamic_highlights(
             if previous_size > 0:
                 growth_rate = (net_change / previous_size) * 100
 
-                if growth_rate > 30 and len(highlights) < 5:
-                    highlighted_services.add(service_name)  # Track it
-                    positive = (
-                        f"{service_name} saw fastest growth rate "
-                        f"({growth_rate:.1f}% increase in codebase size)"
-                    )
-                    cautionary = (
-                        "Rapid expansion may benefit from refactoring allocation "
-                        "to maintain long-term code quality"
-                    )
-                    highlights.append({'positive': positive, 'cautionary': cautionary})
-                    break
+                #: Keep the highest rate; first project wins ties
+                if growth_rate > fastest_rate:
+                    fastest_service = service_name
+                    fastest_rate = growth_rate
+
+    if fastest_service is not None and len(highlights) < 5:
+        highlighted_services.add(fastest_service)  # Track it
+        positive = (
+            f"{fastest_service} saw fastest growth rate "
+            f"({fastest_rate:.1f}% increase in codebase size)"
+        )
+        cautionary = (
+            "Rapid expansion may benefit from refactoring allocation "
+            "to maintain long-term code quality"
+        )
+        highlights.append({'positive': positive, 'cautionary': cautionary})
 
     #: 3. High velocity standout (if lines/commit > 200)
     avg_lines_per_commit = velocity.get('avg_lines_per_commit', 0)
@@ -808,14 +1241,14 @@ def _generate_dynamic_highlights(
 
     #: 4. Release velocity leader (if commits/release ratio varies and not already highlighted)
     release_projects = [p for p in projects_data
-                        if p.get('release_count', 0) > 0
+                        if p['release_count'] > 0
                         and p['name'] not in highlighted_services]  # Filter out already highlighted
     if release_projects and len(highlights) < 5:
         ratios = [
             (p['name'], p['total_commits'] / p['release_count'])
             for p in release_projects
         ]
-        ratios.sort(key=lambda x: x[1], reverse=True)
+        ratios.sort(key=itemgetter(1), reverse=True)
 
         if ratios and ratios[0][1] > 3:  # High commits per release
             service_name, ratio = ratios[0]
@@ -871,46 +1304,50 @@ def _break_down_velocity_metrics(
     """
     metrics = []
 
-    #: 1. Commit rate (ALWAYS)
+    #: Read every velocity field once up front
     avg_commits = velocity.get('avg_commits_per_release', 0)
+    avg_lines = velocity.get('avg_lines_per_commit', 0)
+    net_change = velocity.get('net_change', 0)
+    churn_rate = velocity.get('churn_rate', 0)
+    work_type = velocity.get('work_type', 'unknown')
+    release_pattern = velocity.get('release_pattern', '')
+
+    #: 1. Commit rate (ALWAYS)
     total_commits = report_data.get('total_commits', 0)
     total_releases = report_data.get('total_releases', 0)
+    continuous = avg_commits < 2
 
     observation = (
         f"Commit Rate: {total_commits} commits across {total_releases} releases "
         f"({avg_commits:.1f}:1 ratio) shows "
-        f"{'continuous delivery' if avg_commits < 2 else 'batched development'}"
+        f"{'continuous delivery' if continuous else 'batched development'}"
     )
 
     balance = (
         "Frequent releases demonstrate agility; consider batch strategies for integration testing"
-        if avg_commits < 2
+        if continuous
         else "Batched releases enable thorough testing; monitor for delivery delays"
     )
 
     metrics.append({'observation': observation, 'balance_point': balance})
 
     #: 2. Code output velocity (ALWAYS)
-    avg_lines = velocity.get('avg_lines_per_commit', 0)
-    net_change = velocity.get('net_change', 0)
+    substantial = avg_lines > 100
 
     observation = (
         f"Code Growth: +{net_change:,} net lines ({avg_lines:.0f} lines/commit) "
-        f"indicates {'substantial' if avg_lines > 100 else 'incremental'} feature development"
+        f"indicates {'substantial' if substantial else 'incremental'} feature development"
     )
 
     balance = (
         "High growth rate shows productivity; 15-20% refactoring allocation recommended"
-        if avg_lines > 100
+        if substantial
         else "Incremental changes enable stable evolution; monitor velocity for capacity signals"
     )
 
     metrics.append({'observation': observation, 'balance_point': balance})
 
     #: 3. Churn analysis (ALWAYS)
-    churn_rate = velocity.get('churn_rate', 0)
-    work_type = velocity.get('work_type', 'unknown')
-
     observation = (
         f"Code Churn: {churn_rate:.1f}% modification rate indicates "
         f"{work_type.replace('_', ' ')} development focus"
@@ -926,7 +1363,6 @@ def _break_down_velocity_metrics(
     metrics.append({'observation': observation, 'balance_point': balance})
 
     #: 4. Release cadence (OPTIONAL - if release data rich enough)
-    release_pattern = velocity.get('release_pattern', '')
     if release_pattern and len(metrics) < 4:
         observation = (
             f"Release Cadence: {release_pattern.replace('_', ' ').title()} release pattern "
@@ -1045,12 +1481,13 @@ def _generate_balanced_narrative(
     total_lines = category_stats['total_lines_added']
 
     #: Determine period characterization
-    if velocity['growth_type'] == 'expansion':
+    growth_type = velocity['growth_type']
+    if growth_type == 'expansion':
         if len(categories) == 1:
             period_summary = "Focused Growth Period"
         else:
             period_summary = "Broad Expansion Period"
-    elif velocity['growth_type'] == 'consolidation':
+    elif growth_type == 'consolidation':
         period_summary = "Optimization Period"
     else:
         period_summary = "Steady Development Period"
@@ -1098,23 +1535,11 @@ def _generate_balanced_narrative(
             f"focusing on {layer} with {', '.join(tags[:2]) if len(tags) >= 2 else (tags[0] if tags else 'core development')}"
         )
 
-        #: Generate appropriate balance point based on level
+        #: Balance point for this level (anything unrecognised reads as Tertiary)
         if level == 'Primary':
-            balance = (
-                f"This concentration enables rapid {layer.lower()} improvements. "
-                f"However, limited activity in other areas may benefit from "
-                f"increased allocation for balanced portfolio development"
-            )
-        elif level == 'Secondary':
-            balance = (
-                f"Secondary focus provides diversification. Consider opportunities "
-                f"to strengthen this area with dedicated sprint allocation"
-            )
-        else:  # Tertiary
-            balance = (
-                f"Tertiary focus indicates emerging priority. Monitor for potential "
-                f"escalation needs in upcoming planning cycles"
-            )
+            balance = _FOCUS_BALANCE_POINTS['Primary'].format(layer=layer.lower())
+        else:
+            balance = _FOCUS_BALANCE_POINTS.get(level, _FOCUS_BALANCE_POINTS['Tertiary'])
 
         development_focus_points.append({
             'observation': observation,
@@ -5,26 +5,42 @@ Transforms collected git metrics into professional HTML reports using Jinja2
 with embedded matplotlib charts.
 """
 
+import base64
+import io
+import os
+from calendar import monthrange
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any, Tuple, Optional
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from typing import Dict, List, Any, Tuple, Optional, Union
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
 from src.chart_generator import (
     generate_project_breakdown_chart,
     generate_timeline_chart,
     generate_release_activity_chart,
     generate_code_volume_chart,
-    generate_commit_timeline_chart
+    generate_commit_timeline_chart,
+    render_all_charts
 )
 from src.narrative_generator import generate_executive_summary
+from src.config_manager import CONFIG_CACHE_DIR
 
+#: Compiled-template bytecode directory (disable with KPI_NO_CACHE=1)
+TEMPLATE_CACHE_DIR = CONFIG_CACHE_DIR / "jinja"
 
+#: Chart PNG directory, relative to the report output directory
+CHART_DIR_NAME = ".charts"
+_CHART_SRC_PREFIX = CHART_DIR_NAME + "/"
+
+
+@lru_cache(maxsize=256)
 def _parse_period_to_date_range(period: str) -> Tuple[Optional[datetime], Optional[datetime]]:
     """
     Parse period string to date range.
 
     Converts period specifications into start and end datetime objects
-    for filtering releases and commits by time period.
+    for filtering releases and commits by time period. Results are
+    memoized, so an invalid period is only warned about once.
 
     :param period: Period string ("all", "YYYY", "YYYY-MM", "YYYY-QN")
     :type period: str
@@ -42,8 +58,6 @@ def _parse_period_to_date_range(period: str) -> Tuple[Optional[datetime], Option
     >>> _parse_period_to_date_range("all")
     (None, None)
     """
-    from calendar import monthrange
-
     if period == "all":
         return None, None
 
@@ -113,13 +127,19 @@ def _generate_all_charts(
     projects_data: List[Dict[str, Any]],
     report_data: Dict[str, Any],
     period: str,
-    output_dir: Path
+    output_dir: Path,
+    single_core: bool = False,
+    inline_charts: bool = False
 ) -> Dict[str, str]:
     """
     Generate all charts for the report.
 
     Creates project breakdown charts, timeline chart, and summary chart.
-    Returns dict mapping chart names to relative paths for HTML embedding.
+    Chart data is prepared here and the independent renders are dispatched
+    to a process pool via render_all_charts().
+    Returns dict mapping chart names to relative paths for HTML embedding,
+    or to base64 data URIs when inline_charts is set (charts are rendered
+    into memory and nothing is written to .charts/).
 
     :param projects_data: List of project data dictionaries
     :type projects_data: List[Dict[str, Any]]
@@ -129,14 +149,21 @@ def _generate_all_charts(
     :type period: str
     :param output_dir: Output directory for HTML report
     :type output_dir: Path
-    :return: Dict mapping chart names to relative file paths
+    :param single_core: Render charts serially instead of in a process pool
+    :type single_core: bool
+    :param inline_charts: Embed charts as data URIs instead of PNG files
+    :type inline_charts: bool
+    :return: Dict mapping chart names to relative file paths or data URIs
     :rtype: Dict[str, str]
     """
-    #: Create charts subdirectory
-    chart_dir = output_dir / ".charts"
-    chart_dir.mkdir(parents=True, exist_ok=True)
+    #: Create charts subdirectory (not needed when charts stay in memory)
+    chart_dir = None
+    if not inline_charts:
+        chart_dir = output_dir / CHART_DIR_NAME
+        chart_dir.mkdir(parents=True, exist_ok=True)
 
-    chart_paths = {}
+    #: Chart name -> (chart function, args), rendered together at the end
+    chart_tasks = {}
 
     #: 1. Release Activity chart (Releases + Commits)
     activity_data = {
@@ -144,8 +171,10 @@ def _generate_all_charts(
         'total_commits': report_data['total_commits']
     }
 
-    path = generate_release_activity_chart(activity_data, period, chart_dir)
-    chart_paths['release_activity'] = f".charts/{path.name}"
+    chart_tasks['release_activity'] = (
+        generate_release_activity_chart,
+        (activity_data, period, _chart_target(chart_dir))
+    )
 
     #: 2. Code Volume chart (Lines Added/Removed + Net Change)
     volume_data = {
@@ -153,99 +182,155 @@ def _generate_all_charts(
         'total_lines_removed': report_data['total_lines_removed']
     }
 
-    path = generate_code_volume_chart(volume_data, period, chart_dir)
-    chart_paths['code_volume'] = f".charts/{path.name}"
+    chart_tasks['code_volume'] = (
+        generate_code_volume_chart,
+        (volume_data, period, _chart_target(chart_dir))
+    )
 
     #: 3. Project breakdown charts (commits and lines added)
     if projects_data:
         #: Commits breakdown
-        path = generate_project_breakdown_chart(
-            projects_data,
-            'total_commits',
-            period,
-            chart_dir
+        chart_tasks['project_commits'] = (
+            generate_project_breakdown_chart,
+            (projects_data, 'total_commits', period, _chart_target(chart_dir))
         )
-        chart_paths['project_commits'] = f".charts/{path.name}"
 
         #: Lines added breakdown
-        path = generate_project_breakdown_chart(
-            projects_data,
-            'total_lines_added',
-            period,
-            chart_dir
+        chart_tasks['project_lines_added'] = (
+            generate_project_breakdown_chart,
+            (projects_data, 'total_lines_added', period, _chart_target(chart_dir))
         )
-        chart_paths['project_lines_added'] = f".charts/{path.name}"
 
         #: Net change breakdown
-        path = generate_project_breakdown_chart(
-            projects_data,
-            'net_change',
-            period,
-            chart_dir
+        chart_tasks['project_net_change'] = (
+            generate_project_breakdown_chart,
+            (projects_data, 'net_change', period, _chart_target(chart_dir))
         )
-        chart_paths['project_net_change'] = f".charts/{path.name}"
 
-    #: 4. Release timeline chart
-    #: Collect all releases with dates
+    #: 4-5. Release and commit timelines, collected in one pass
+    #: Note: The commit timeline uses actual commit dates (when commits
+    #: were made) not release dates (when tags were created) for an
+    #: accurate timeline, filtered to the date range of releases shown
     timeline_data = []
+    earliest_release = latest_release = None
+    commit_dates = []
     for project in projects_data:
-        for release in project.get('releases', []):
+        releases = project.get('releases', [])
+        for release in releases:
             if release.get('date'):
-                #: Parse date string to datetime
-                date_str = release['date']
-                date_obj = datetime.strptime(date_str, '%Y-%m-%d')
+                date_obj = _parse_release_date(release['date'])
                 timeline_data.append((date_obj, release['version']))
 
-    if timeline_data:
-        path = generate_timeline_chart(timeline_data, period, chart_dir)
-        chart_paths['timeline'] = f".charts/{path.name}"
-
-    #: 5. Commit timeline chart
-    #: Note: Uses actual commit dates (when commits were made)
-    #: not release dates (when tags were created) for accurate timeline
-    #: Filter to match the date range of releases being shown
+                #: Track the release date range as we go
+                if earliest_release is None or date_obj < earliest_release:
+                    earliest_release = date_obj
+                if latest_release is None or date_obj > latest_release:
+                    latest_release = date_obj
 
-    #: Find earliest and latest release dates
-    release_dates = []
-    for project in projects_data:
-        for release in project.get('releases', []):
-            if release.get('date'):
-                date_obj = datetime.strptime(release['date'], '%Y-%m-%d')
-                release_dates.append(date_obj)
-
-    if release_dates:
-        earliest_release = min(release_dates)
-        latest_release = max(release_dates)
-    else:
-        earliest_release = datetime.now()
-        latest_release = datetime.now()
-
-    commit_timeline_data = []
-    for project in projects_data:
-        #: Collect commits from releases (between tags)
-        for release in project.get('releases', []):
             #: Use individual commit dates (not release tag date)
-            for commit_date in release.get('commit_dates', []):
-                #: Only include commits within release date range
-                if earliest_release <= commit_date <= latest_release:
-                    commit_timeline_data.append((commit_date, 1))
+            commit_dates.extend(release.get('commit_dates', []))
 
         #: Also collect commits after most recent tag (unreleased commits)
-        if project.get('releases'):
-            most_recent_release = project['releases'][0]  # First release is newest
+        if releases:
+            most_recent_release = releases[0]  # First release is newest
             if most_recent_release.get('unreleased_commits'):
-                for commit_date in most_recent_release['unreleased_commits']:
-                    if earliest_release <= commit_date <= latest_release:
-                        commit_timeline_data.append((commit_date, 1))
+                commit_dates.extend(most_recent_release['unreleased_commits'])
+
+    if timeline_data:
+        chart_tasks['timeline'] = (
+            generate_timeline_chart,
+            (timeline_data, period, _chart_target(chart_dir))
+        )
+
+    #: No dated releases: only commits made right now would qualify
+    if earliest_release is None:
+        earliest_release = latest_release = datetime.now()
+
+    #: Only include commits within release date range
+    commit_timeline_data = [
+        (commit_date, 1)
+        for commit_date in commit_dates
+        if earliest_release <= commit_date <= latest_release
+    ]
 
     if commit_timeline_data:
-        path = generate_commit_timeline_chart(commit_timeline_data, period, chart_dir)
-        chart_paths['commit_timeline'] = f".charts/{path.name}"
+        chart_tasks['commit_timeline'] = (
+            generate_commit_timeline_chart,
+            (commit_timeline_data, period, _chart_target(chart_dir))
+        )
+
+    #: Render all charts (in parallel unless single_core requested)
+    rendered = render_all_charts(chart_tasks, single_core=single_core)
+
+    return {name: _chart_src(chart) for name, chart in rendered.items()}
+
+
+@lru_cache(maxsize=4096)
+def _parse_release_date(date_str: str) -> datetime:
+    """
+    Parse a release date string, memoized since dates repeat across projects.
 
-    return chart_paths
+    Zero-padded YYYY-MM-DD strings (what the collector writes) are sliced
+    into integers directly; anything else goes through strptime.
 
+    :param date_str: Release date in YYYY-MM-DD form
+    :type date_str: str
+    :return: Parsed date at midnight
+    :rtype: datetime
+    :raises ValueError: If date_str is not a valid YYYY-MM-DD date
 
-def _filter_active_projects(projects_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    :Example:
+
+    >>> _parse_release_date('2025-11-03')
+    datetime.datetime(2025, 11, 3, 0, 0)
+    """
+    year, month, day = date_str[0:4], date_str[5:7], date_str[8:10]
+    if (len(date_str) == 10 and date_str.isascii()
+            and date_str[4] == '-' and date_str[7] == '-'
+            and year.isdigit() and month.isdigit() and day.isdigit()):
+        try:
+            return datetime(int(year), int(month), int(day))
+        except ValueError:
+            pass
+    return datetime.strptime(date_str, '%Y-%m-%d')
+
+
+def _chart_target(chart_dir: Optional[Path]) -> Union[Path, io.BytesIO]:
+    """
+    Get the output target for one chart render.
+
+    :param chart_dir: Chart directory, or None to render into memory
+    :type chart_dir: Optional[Path]
+    :return: chart_dir, or a fresh BytesIO when chart_dir is None
+    :rtype: Union[Path, io.BytesIO]
+    """
+    return io.BytesIO() if chart_dir is None else chart_dir
+
+
+def _chart_src(chart: Union[Path, io.BytesIO]) -> str:
+    """
+    Build the HTML img src for a rendered chart.
+
+    :param chart: Saved chart PNG path or buffer holding the PNG
+    :type chart: Union[Path, io.BytesIO]
+    :return: Path relative to the report, or a base64 PNG data URI
+    :rtype: str
+
+    :Example:
+
+    >>> _chart_src(Path('reports/.charts/timeline-all.png'))
+    '.charts/timeline-all.png'
+    """
+    if isinstance(chart, io.BytesIO):
+        encoded = base64.b64encode(chart.getvalue()).decode('ascii')
+        return f"data:image/png;base64,{encoded}"
+
+    return _CHART_SRC_PREFIX + chart.name
+
+
+def _filter_active_projects(
+    projects_data: List[Dict[str, Any]]
+) -> Tuple[List[Dict[str, Any]], List[str]]:
     """
     Filter out projects with no meaningful activity.
 
@@ -254,8 +339,8 @@ def _filter_active_projects(projects_data: List[Dict[str, Any]]) -> List[Dict[st
 
     :param projects_data: List of all project data dictionaries
     :type projects_data: List[Dict[str, Any]]
-    :return: Filtered list containing only projects with activity
-    :rtype: List[Dict[str, Any]]
+    :return: Projects with activity, and names of the excluded projects
+    :rtype: Tuple[List[Dict[str, Any]], List[str]]
 
     :Example:
 
@@ -264,9 +349,10 @@ def _filter_active_projects(projects_data: List[Dict[str, Any]]) -> List[Dict[st
     ...     {'name': 'inactive', 'total_commits': 0, 'total_lines_added': 0, 'total_lines_removed': 0}
     ... ]
     >>> _filter_active_projects(projects)
-    [{'name': 'active', 'total_commits': 10, ...}]
+    ([{'name': 'active', 'total_commits': 10, ...}], ['inactive'])
     """
     active_projects = []
+    excluded_names = []
 
     for project in projects_data:
         #: Include project if it has any activity
@@ -276,15 +362,19 @@ def _filter_active_projects(projects_data: List[Dict[str, Any]]) -> List[Dict[st
 
         if has_commits or has_lines_added or has_lines_removed:
             active_projects.append(project)
+        else:
+            excluded_names.append(project['name'])
 
-    return active_projects
+    return active_projects, excluded_names
 
 
 def generate_html_report(
     projects_data: List[Dict[str, Any]],
     output_dir: Path,
     period: str = "all",
-    config: Any = None
+    config: Any = None,
+    single_core: bool = False,
+    inline_charts: bool = False
 ) -> Path:
     """
     Generate HTML report from project data.
@@ -295,6 +385,10 @@ def generate_html_report(
     :type output_dir: Path
     :param period: Report period (e.g., "2025-11", "all")
     :type period: str
+    :param single_core: Render charts serially instead of in a process pool
+    :type single_core: bool
+    :param inline_charts: Embed charts in the HTML as base64 data URIs
+    :type inline_charts: bool
     :return: Path to generated HTML file
     :rtype: Path
 
@@ -314,27 +408,29 @@ def generate_html_report(
     True
     """
     #: Filter out projects with no activity
-    active_projects = _filter_active_projects(projects_data)
+    active_projects, excluded_names = _filter_active_projects(projects_data)
 
     #: Show filtering summary if projects were excluded
-    if len(active_projects) < len(projects_data):
-        excluded_count = len(projects_data) - len(active_projects)
-        excluded_names = [p['name'] for p in projects_data if p not in active_projects]
+    if excluded_names:
         print(f"\n📊 Report Filtering:")
-        print(f"   Excluded {excluded_count} project(s) with no activity: {', '.join(excluded_names)}")
+        print(f"   Excluded {len(excluded_names)} project(s) with no activity: {', '.join(excluded_names)}")
         print(f"   Showing {len(active_projects)} active project(s)")
 
     #: Prepare data for template (use filtered projects)
     report_data = _prepare_report_data(active_projects, period, config)
 
     #: Generate charts (only for active projects)
-    chart_paths = _generate_all_charts(active_projects, report_data, period, output_dir)
-
-    #: Load and render template with charts
-    html_content = _render_template(report_data, chart_paths)
+    chart_paths = _generate_all_charts(
+        active_projects,
+        report_data,
+        period,
+        output_dir,
+        single_core=single_core,
+        inline_charts=inline_charts
+    )
 
-    #: Save to file
-    output_path = _save_report(html_content, output_dir, period)
+    #: Render template with charts straight to file
+    output_path = _save_report(report_data, chart_paths, output_dir, period)
 
     return output_path
 
@@ -353,11 +449,13 @@ def _prepare_report_data(
     :param period: Report period
     :return: Template-ready data dictionary
     """
-    #: Calculate aggregate totals
-    total_releases = sum(p.get('release_count', 0) for p in projects_data)
-    total_commits = sum(p.get('total_commits', 0) for p in projects_data)
-    total_lines_added = sum(p.get('total_lines_added', 0) for p in projects_data)
-    total_lines_removed = sum(p.get('total_lines_removed', 0) for p in projects_data)
+    #: Calculate aggregate totals in one pass
+    total_releases = total_commits = total_lines_added = total_lines_removed = 0
+    for project in projects_data:
+        total_releases += project.get('release_count', 0)
+        total_commits += project.get('total_commits', 0)
+        total_lines_added += project.get('total_lines_added', 0)
+        total_lines_removed += project.get('total_lines_removed', 0)
 
     #: Format period for display
     period_display = _format_period_display(period)
@@ -400,6 +498,7 @@ def _prepare_report_data(
     }
 
 
+@lru_cache(maxsize=256)
 def _format_period_display(period: str) -> str:
     """
     Convert period code to human-readable format.
@@ -428,41 +527,48 @@ def _format_period_display(period: str) -> str:
         return period
 
 
-def _render_template(
-    report_data: Dict[str, Any],
-    chart_paths: Dict[str, str]
-) -> str:
+@lru_cache(maxsize=None)
+def _jinja_env() -> Environment:
     """
-    Load Jinja2 template and render with data and charts.
+    Get the shared Jinja2 environment, creating it on first use.
 
-    :param report_data: Template data dictionary
-    :param chart_paths: Dict mapping chart names to relative paths
-    :return: Rendered HTML string
+    The environment keeps parsed templates in memory across reports, and
+    its bytecode cache lets later runs skip compiling them again.
+
+    :return: Jinja2 environment loading from ./templates
+    :rtype: Environment
     """
-    #: Set up Jinja2 environment
-    env = Environment(
+    bytecode_cache = None
+    if not os.environ.get('KPI_NO_CACHE'):
+        try:
+            TEMPLATE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(str(TEMPLATE_CACHE_DIR))
+        except OSError:
+            pass
+
+    return Environment(
         loader=FileSystemLoader('templates'),
-        autoescape=select_autoescape(['html'])
+        autoescape=select_autoescape(['html']),
+        bytecode_cache=bytecode_cache
     )
 
-    #: Load template
-    template = env.get_template('report.html')
-
-    #: Render with data and charts
-    return template.render(**report_data, charts=chart_paths)
-
 
 def _save_report(
-    html_content: str,
+    report_data: Dict[str, Any],
+    chart_paths: Dict[str, str],
     output_dir: Path,
     period: str
 ) -> Path:
     """
-    Save HTML content to file with proper naming.
+    Render the report template straight into its output file.
 
-    Creates output directory if it doesn't exist.
+    Creates output directory if it doesn't exist. The template is
+    streamed to a temporary file in chunks, so the full HTML is never
+    held in memory, and renamed into place so a failed render never
+    leaves a partial report behind.
 
-    :param html_content: Rendered HTML string
+    :param report_data: Template data dictionary
+    :param chart_paths: Dict mapping chart names to relative paths
     :param output_dir: Output directory
     :param period: Report period (for filename)
     :return: Path to saved file
@@ -473,9 +579,19 @@ def _save_report(
     #: Generate filename
     filename = f"kpi-report-{period}.html"
     output_path = output_dir / filename
+    tmp_path = output_path.with_name(f".{filename}.{os.getpid()}.tmp")
 
-    #: Write file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    #: Load template (parsed once per process, then served from cache)
+    template = _jinja_env().get_template('report.html')
+
+    #: Render with data and charts, writing chunks as they are produced
+    try:
+        template.stream(**report_data, charts=chart_paths).dump(
+            str(tmp_path), encoding='utf-8'
+        )
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
     return output_path
@@ -0,0 +1,126 @@
+"""
+Shared pytest configuration and fixtures.
+
+Pins matplotlib to the non-interactive Agg backend before any test module
+imports it, so mock.patch('matplotlib.pyplot...') in the unit tests never
+triggers interactive backend discovery. An MPLBACKEND already set in the
+environment is left alone.
+"""
+
+import os
+
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+import git
+import pytest
+
+from src.config_manager import load_config
+
+
+#: (tag or None, commit date, file contents) for each sample_repo commit;
+#: 1.0.0..1.1.0 spans two commits
+_SAMPLE_HISTORY = [
+    ("1.0.0", "2025-01-10T10:00:00", "def main():\n    pass\n"),
+    (None, "2025-01-20T10:00:00", "def main():\n    return 1\n"),
+    ("1.1.0", "2025-02-03T10:00:00", "def main():\n    return 2\n\n\ndef helper():\n    return 3\n"),
+    ("production", "2025-02-10T10:00:00", "def main():\n    return 2\n\n\ndef helper():\n    return 4\n"),
+    ("2.0.0-rc1", "2025-03-01T10:00:00", "def main():\n    return 5\n"),
+]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _isolated_caches(tmp_path_factory):
+    """
+    Keep the test session out of the developer's ~/.cache/kpi.
+
+    Caching is switched off with KPI_NO_CACHE, and the config, project
+    and template cache directories point into the session temp
+    directory. Tests that exercise a cache opt back in with
+    monkeypatch.delenv('KPI_NO_CACHE') and still write only there.
+
+    :param tmp_path_factory: pytest session temp directory factory
+    :type tmp_path_factory: pytest.TempPathFactory
+    """
+    cache_dir = tmp_path_factory.mktemp("kpi_cache")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("KPI_NO_CACHE", "1")
+        mp.setattr("src.config_manager.CONFIG_CACHE_DIR", cache_dir)
+        mp.setattr("src.main.PROJECT_CACHE_DIR", cache_dir)
+        mp.setattr("src.report_generator.TEMPLATE_CACHE_DIR", cache_dir / "jinja")
+        yield
+
+
+@pytest.fixture(scope="session")
+def sample_repo(tmp_path_factory):
+    """
+    Build the sample git repository once per test session.
+
+    The repository has semantic version tags 1.0.0 (annotated) and 1.1.0
+    (lightweight) with two commits between them, a newer 2.0.0-rc1 and
+    a non-version 'production' tag. The open git.Repo is shared by every
+    test, so the git_analyzer functions (which accept a path or a
+    git.Repo) never re-open it.
+
+    :param tmp_path_factory: pytest session temp directory factory
+    :type tmp_path_factory: pytest.TempPathFactory
+    :return: Open sample repository
+    :rtype: git.Repo
+    """
+    path = tmp_path_factory.mktemp("fixtures") / "sample_repo"
+    repo = git.Repo.init(path)
+    actor = git.Actor("KPI Tests", "kpi-tests@example.com")
+    source = path / "app.py"
+
+    #: The annotated tag's tagger comes from repo config, not the actor
+    with repo.config_writer() as config:
+        config.set_value("user", "name", actor.name)
+        config.set_value("user", "email", actor.email)
+
+    for tag, date, contents in _SAMPLE_HISTORY:
+        source.write_text(contents)
+        repo.index.add(["app.py"])
+        commit = repo.index.commit(
+            f"Change for {date}",
+            author=actor,
+            committer=actor,
+            author_date=date,
+            commit_date=date
+        )
+        if tag == "1.0.0":
+            repo.create_tag(tag, ref=commit, message=f"Release {tag}")
+        elif tag:
+            repo.create_tag(tag, ref=commit)
+
+    yield repo
+    repo.close()
+
+
+@pytest.fixture(scope="session")
+def default_config():
+    """
+    Load the repository's config.yaml once per test session.
+
+    Tests that only read the config share this one instance instead of
+    each re-loading the file; tests that change it load their own.
+
+    :return: Parsed default configuration
+    :rtype: Config
+    """
+    return load_config("config.yaml")
+
+
+@pytest.fixture(scope="session")
+def project_cache_dir(tmp_path_factory):
+    """
+    Session-wide PROJECT_CACHE_DIR for tests that run main().
+
+    The first run analyzes the sample repository with git and pickles
+    the result here; later runs in the session reuse it through main's
+    own project cache instead of repeating the git work.
+
+    :param tmp_path_factory: pytest session temp directory factory
+    :type tmp_path_factory: pytest.TempPathFactory
+    :return: Project cache directory
+    :rtype: Path
+    """
+    return tmp_path_factory.mktemp("project_cache")
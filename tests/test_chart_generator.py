@@ -9,20 +9,48 @@ Run with: pytest -m integration
 
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 import pytest
 from src.chart_generator import (
     generate_project_breakdown_chart,
-    generate_timeline_chart
+    generate_timeline_chart,
+    COLOR_PALETTE,
+    _RGBA_PALETTE,
+    _chart_cache_key,
+    _get_cached_figure,
+    _get_plt,
+    _save_figure_fast
 )
 
 
+#: Default-resolution dpi for these tests; they check files, not pixels
+TEST_DPI = 50
+
+
+@pytest.fixture(autouse=True)
+def low_dpi(monkeypatch):
+    """
+    Render default-resolution charts at TEST_DPI.
+
+    PNG encoding scales with pixel count, so a quarter of the pixels makes
+    every render here cheaper while still drawing through the real Agg
+    backend. high_res charts keep HIGH_RES_DPI.
+    """
+    plt = _get_plt()
+    monkeypatch.setitem(plt.rcParams, 'figure.dpi', TEST_DPI)
+
+
 @pytest.mark.integration
 def test_project_breakdown_chart_generation(tmp_path):
     """
     Test project breakdown chart generates correctly.
 
-    Verifies that chart file is created with correct format.
+    Verifies that chart file is created with correct format, creating
+    the chart directory as needed.
     """
+    #: Use non-existent subdirectory
+    chart_dir = tmp_path / "charts" / "nested"
+
     projects = [
         {'name': 'service-a', 'total_commits': 50},
         {'name': 'service-b', 'total_commits': 30},
@@ -33,10 +61,12 @@ def test_project_breakdown_chart_generation(tmp_path):
         projects,
         'total_commits',
         "2025-11",
-        tmp_path
+        chart_dir
     )
 
-    #: Verify file was created
+    #: Verify directory and file were created
+    assert chart_dir.is_dir()
+    assert output.parent == chart_dir
     assert output.exists()
     assert output.suffix == ".png"
     assert output.name == "project-total_commits-2025-11.png"
@@ -44,37 +74,21 @@ def test_project_breakdown_chart_generation(tmp_path):
 
 
 @pytest.mark.integration
-def test_project_breakdown_chart_sorting(tmp_path):
-    """
-    Test that projects are sorted by metric value.
-
-    The chart should sort projects in descending order.
-    """
-    projects = [
+@pytest.mark.parametrize("projects", [
+    [
         {'name': 'low-activity', 'total_commits': 10},
         {'name': 'high-activity', 'total_commits': 100},
         {'name': 'medium-activity', 'total_commits': 50}
-    ]
-
-    output = generate_project_breakdown_chart(
-        projects,
-        'total_commits',
-        "test",
-        tmp_path
-    )
-
-    assert output.exists()
-
-
-@pytest.mark.integration
-def test_project_breakdown_chart_empty_list(tmp_path):
+    ],
+    []
+], ids=["unsorted", "empty"])
+def test_project_breakdown_chart_variants(tmp_path, projects):
     """
-    Test chart generation with empty project list.
+    Test project breakdown charts for unsorted and empty project lists.
 
-    Should create chart without errors.
+    The chart should sort projects in descending order, and an empty
+    list should still create a chart without errors.
     """
-    projects = []
-
     output = generate_project_breakdown_chart(
         projects,
         'total_commits',
@@ -83,6 +97,7 @@ def test_project_breakdown_chart_empty_list(tmp_path):
     )
 
     assert output.exists()
+    assert output.suffix == ".png"
 
 
 @pytest.mark.skip(reason="generate_summary_comparison_chart function not implemented")
@@ -161,14 +176,17 @@ def test_timeline_chart_with_data(tmp_path):
 
 
 @pytest.mark.integration
-def test_timeline_chart_empty_data(tmp_path):
+@pytest.mark.parametrize("timeline", [
+    [],
+    [(datetime(2025, 11, 15), "1.0.0")]
+], ids=["empty", "single_release"])
+def test_timeline_chart_variants(tmp_path, timeline):
     """
-    Test timeline chart with no release data.
+    Test timeline charts with no releases and with a single release.
 
-    Should create chart with "No data available" message.
+    No data should create a chart with a "No data available" message;
+    a single data point should be handled correctly.
     """
-    timeline = []
-
     output = generate_timeline_chart(
         timeline,
         "test",
@@ -180,67 +198,139 @@ def test_timeline_chart_empty_data(tmp_path):
 
 
 @pytest.mark.integration
-def test_timeline_chart_single_release(tmp_path):
+def test_different_metrics_generate_different_files(tmp_path):
     """
-    Test timeline chart with single release.
+    Test that different metrics generate separate chart files.
 
-    Should handle single data point correctly.
+    Each metric should have its own file.
     """
-    timeline = [(datetime(2025, 11, 15), "1.0.0")]
+    projects = [
+        {'name': 'service', 'total_commits': 100, 'total_lines_added': 1000}
+    ]
 
-    output = generate_timeline_chart(
-        timeline,
-        "test",
-        tmp_path
+    output1 = generate_project_breakdown_chart(
+        projects, 'total_commits', "test", tmp_path
+    )
+    output2 = generate_project_breakdown_chart(
+        projects, 'total_lines_added', "test", tmp_path
     )
 
-    assert output.exists()
+    assert output1.exists()
+    assert output2.exists()
+    assert output1.name != output2.name
+    assert "total_commits" in output1.name
+    assert "total_lines_added" in output2.name
 
 
 @pytest.mark.integration
-def test_chart_directory_creation(tmp_path):
+def test_save_figure_fast_writes_png(tmp_path):
     """
-    Test that chart directory is created if it doesn't exist.
+    Test that the Agg-buffer writer produces a valid PNG.
 
-    Chart generators should create directories as needed.
+    Uncompressed output must still be a readable PNG of the figure size.
     """
-    #: Use non-existent subdirectory
-    chart_dir = tmp_path / "charts" / "nested"
+    from PIL import Image
 
-    assert not chart_dir.exists()
+    fig, ax = _get_cached_figure((4, 3))
+    ax.plot([1, 2, 3])
 
-    projects = [{'name': 'test', 'total_commits': 10}]
-    output = generate_project_breakdown_chart(
-        projects,
-        'total_commits',
-        "test",
-        chart_dir
-    )
+    output = _save_figure_fast(fig, tmp_path / "fast.png", compress_level=0)
 
-    assert chart_dir.exists()
-    assert output.exists()
+    with Image.open(output) as image:
+        assert image.format == "PNG"
+        assert image.size == tuple(int(v) for v in fig.canvas.get_width_height())
+
+
+def test_get_plt_keeps_hex_palette():
+    """
+    Test that configuring pyplot leaves COLOR_PALETTE as hex strings.
+
+    Draw calls read the RGBA copy, and the chart cache key must not change
+    once matplotlib has been set up.
+    """
+    from matplotlib.colors import to_rgba
+
+    palette = dict(COLOR_PALETTE)
+    key = _chart_cache_key('palette', [1])
+
+    _get_plt()
+
+    assert COLOR_PALETTE == palette
+    assert all(color.startswith('#') for color in COLOR_PALETTE.values())
+    assert _RGBA_PALETTE['primary'] == to_rgba(COLOR_PALETTE['primary'])
+    assert _chart_cache_key('palette', [1]) == key
 
 
 @pytest.mark.integration
-def test_different_metrics_generate_different_files(tmp_path):
+def test_unchanged_chart_is_not_rerendered(tmp_path, monkeypatch):
     """
-    Test that different metrics generate separate chart files.
+    Test that a chart rendered from identical data is reused.
 
-    Each metric should have its own file.
+    Changing the plotted data must render the chart again.
     """
+    monkeypatch.delenv("KPI_NO_CACHE", raising=False)
     projects = [
-        {'name': 'service', 'total_commits': 100, 'total_lines_added': 1000}
+        {'name': 'service-a', 'total_commits': 50},
+        {'name': 'service-b', 'total_commits': 30}
     ]
 
-    output1 = generate_project_breakdown_chart(
+    output = generate_project_breakdown_chart(
         projects, 'total_commits', "test", tmp_path
     )
-    output2 = generate_project_breakdown_chart(
-        projects, 'total_lines_added', "test", tmp_path
+    first_mtime = output.stat().st_mtime_ns
+
+    with patch('src.chart_generator._save_figure_fast') as mock_save:
+        generate_project_breakdown_chart(
+            projects, 'total_commits', "test", tmp_path
+        )
+        mock_save.assert_not_called()
+
+        projects[1]['total_commits'] = 31
+        generate_project_breakdown_chart(
+            projects, 'total_commits', "test", tmp_path
+        )
+        mock_save.assert_called_once()
+
+    assert output.stat().st_mtime_ns == first_mtime
+
+
+@pytest.mark.integration
+def test_high_res_chart_uses_high_res_dpi(tmp_path):
+    """
+    Test that high_res renders more pixels than the default resolution.
+
+    The default and high-res outputs must not share a cache entry.
+    """
+    from PIL import Image
+
+    timeline = [(datetime(2025, 11, 1), "1.0.0")]
+
+    default = generate_timeline_chart(timeline, "default", tmp_path)
+    high_res = generate_timeline_chart(timeline, "high", tmp_path, high_res=True)
+
+    with Image.open(default) as default_image, Image.open(high_res) as high_image:
+        assert high_image.size[0] > default_image.size[0]
+        assert high_image.info['kpi-chart-key'] != default_image.info['kpi-chart-key']
+
+
+@pytest.mark.integration
+def test_chart_renders_into_bytesio(tmp_path):
+    """
+    Test that passing a BytesIO renders the PNG in memory.
+
+    The same buffer is returned and no file is written.
+    """
+    import io
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    projects = [{'name': 'service-a', 'total_commits': 50}]
+
+    output = generate_project_breakdown_chart(
+        projects, 'total_commits', "test", buffer
     )
 
-    assert output1.exists()
-    assert output2.exists()
-    assert output1.name != output2.name
-    assert "total_commits" in output1.name
-    assert "total_lines_added" in output2.name
+    assert output is buffer
+    with Image.open(io.BytesIO(buffer.getvalue())) as image:
+        assert image.format == "PNG"
+    assert not list(tmp_path.iterdir())
@@ -7,21 +7,33 @@ These run by default (pytest without -m integration).
 
 import pytest
 from pathlib import Path
-from datetime import datetime
+from datetime import date, datetime, timedelta, timezone
 from unittest.mock import Mock, patch, MagicMock, call
 from src.chart_generator import (
     generate_project_breakdown_chart,
-    generate_timeline_chart
+    generate_timeline_chart,
+    render_all_charts,
+    _bucket_by_month
 )
 
 
+class _MockedRendering:
+    """Patch out figure creation and PNG writing for every test in a class."""
+
+    @pytest.fixture(autouse=True)
+    def mock_rendering(self):
+        with patch('matplotlib.pyplot.figure') as mock_figure, \
+                patch('src.chart_generator._save_figure_fast') as mock_savefig:
+            self.mock_figure = mock_figure
+            self.mock_savefig = mock_savefig
+            yield
+
+
 @pytest.mark.unit
-class TestProjectBreakdownChartUnit:
+class TestProjectBreakdownChartUnit(_MockedRendering):
     """Fast unit tests for project breakdown charts using mocks."""
 
-    @patch('src.chart_generator.plt.savefig')
-    @patch('src.chart_generator.plt.figure')
-    def test_chart_generation_no_rendering(self, mock_figure, mock_savefig):
+    def test_chart_generation_no_rendering(self):
         """Test that chart function calls matplotlib correctly without rendering."""
         projects = [
             {'name': 'service-a', 'total_commits': 50},
@@ -38,15 +50,13 @@ class TestProjectBreakdownChartUnit:
         )
 
         # Verify matplotlib was called (implementation may call figure() multiple times)
-        assert mock_figure.called, "plt.figure() should be called"
-        mock_savefig.assert_called_once()  # Chart should be saved exactly once
+        assert self.mock_figure.called, "plt.figure() should be called"
+        self.mock_savefig.assert_called_once()  # Chart should be saved exactly once
         # Verify result is PNG file with expected characteristics
         assert result.suffix == '.png'
         assert 'total_commits' in result.name
 
-    @patch('src.chart_generator.plt.savefig')
-    @patch('src.chart_generator.plt.figure')
-    def test_chart_sorting_logic(self, mock_figure, mock_savefig):
+    def test_chart_sorting_logic(self):
         """Test that projects are sorted by metric value."""
         projects = [
             {'name': 'low', 'total_commits': 10},
@@ -62,13 +72,11 @@ class TestProjectBreakdownChartUnit:
         )
 
         # Verify chart was created and saved
-        assert mock_figure.called, "plt.figure() should be called"
-        mock_savefig.assert_called_once()  # Chart should be saved exactly once
+        assert self.mock_figure.called, "plt.figure() should be called"
+        self.mock_savefig.assert_called_once()  # Chart should be saved exactly once
         assert 'total_commits' in result.name
 
-    @patch('src.chart_generator.plt.savefig')
-    @patch('src.chart_generator.plt.figure')
-    def test_chart_with_empty_projects(self, mock_figure, mock_savefig):
+    def test_chart_with_empty_projects(self):
         """Test chart generation with empty project list."""
         projects = []
 
@@ -80,12 +88,10 @@ class TestProjectBreakdownChartUnit:
         )
 
         # Should still call matplotlib (creates empty chart)
-        assert mock_figure.called, "plt.figure() should be called"
-        mock_savefig.assert_called_once()  # Chart should be saved exactly once
+        assert self.mock_figure.called, "plt.figure() should be called"
+        self.mock_savefig.assert_called_once()  # Chart should be saved exactly once
 
-    @patch('src.chart_generator.plt.savefig')
-    @patch('src.chart_generator.plt.figure')
-    def test_different_metrics_handled(self, mock_figure, mock_savefig):
+    def test_different_metrics_handled(self):
         """Test that different metrics can be charted."""
         projects = [{'name': 'svc', 'total_commits': 100, 'total_lines_added': 5000}]
 
@@ -100,17 +106,15 @@ class TestProjectBreakdownChartUnit:
         )
 
         # Should save exactly 2 charts (savefig is reliable indicator)
-        assert mock_savefig.call_count == 2, "Should save exactly 2 charts"
-        assert mock_figure.called, "plt.figure() should be called"
+        assert self.mock_savefig.call_count == 2, "Should save exactly 2 charts"
+        assert self.mock_figure.called, "plt.figure() should be called"
 
 
 @pytest.mark.unit
-class TestTimelineChartUnit:
+class TestTimelineChartUnit(_MockedRendering):
     """Fast unit tests for timeline charts using mocks."""
 
-    @patch('src.chart_generator.plt.savefig')
-    @patch('src.chart_generator.plt.figure')
-    def test_timeline_with_data(self, mock_figure, mock_savefig):
+    def test_timeline_with_data(self):
         """Test timeline chart generation with release data."""
         timeline = [
             (datetime(2025, 10, 1), "1.0.0"),
@@ -125,15 +129,13 @@ class TestTimelineChartUnit:
         )
 
         # Verify matplotlib was called correctly
-        assert mock_figure.called, "plt.figure() should be called"
-        mock_savefig.assert_called_once()  # Chart should be saved exactly once
+        assert self.mock_figure.called, "plt.figure() should be called"
+        self.mock_savefig.assert_called_once()  # Chart should be saved exactly once
         # Verify result is PNG file with expected characteristics
         assert result.suffix == '.png'
         assert 'timeline' in result.name
 
-    @patch('src.chart_generator.plt.savefig')
-    @patch('src.chart_generator.plt.figure')
-    def test_timeline_with_empty_data(self, mock_figure, mock_savefig):
+    def test_timeline_with_empty_data(self):
         """Test timeline chart with no releases."""
         timeline = []
 
@@ -144,12 +146,10 @@ class TestTimelineChartUnit:
         )
 
         # Should still create chart (shows "No data")
-        assert mock_figure.called, "plt.figure() should be called"
-        mock_savefig.assert_called_once()  # Chart should be saved exactly once
+        assert self.mock_figure.called, "plt.figure() should be called"
+        self.mock_savefig.assert_called_once()  # Chart should be saved exactly once
 
-    @patch('src.chart_generator.plt.savefig')
-    @patch('src.chart_generator.plt.figure')
-    def test_timeline_with_single_release(self, mock_figure, mock_savefig):
+    def test_timeline_with_single_release(self):
         """Test timeline with single release."""
         timeline = [(datetime(2025, 11, 15), "1.0.0")]
 
@@ -160,59 +160,50 @@ class TestTimelineChartUnit:
         )
 
         # Should handle single point
-        assert mock_figure.called, "plt.figure() should be called"
-        mock_savefig.assert_called_once()  # Chart should be saved exactly once
+        assert self.mock_figure.called, "plt.figure() should be called"
+        self.mock_savefig.assert_called_once()  # Chart should be saved exactly once
 
 
 @pytest.mark.unit
-class TestChartDirectoryHandling:
+class TestChartDirectoryHandling(_MockedRendering):
     """Test chart directory creation logic."""
 
-    @patch('src.chart_generator.plt.savefig')
-    @patch('src.chart_generator.plt.figure')
-    @patch('pathlib.Path.mkdir')
-    def test_creates_directory_if_missing(self, mock_mkdir, mock_figure, mock_savefig):
+    def test_creates_directory_if_missing(self, tmp_path):
         """Test that chart directory is created if it doesn't exist."""
         projects = [{'name': 'svc', 'total_commits': 10}]
-        output_path = Path('/tmp/nested/dir/chart.png')
+        chart_dir = tmp_path / 'nested' / 'dir'
 
-        # Mock directory doesn't exist
-        with patch('pathlib.Path.exists', return_value=False):
-            generate_project_breakdown_chart(
-                projects,
-                'total_commits',
-                "test",
-                output_path
-            )
+        generate_project_breakdown_chart(
+            projects,
+            'total_commits',
+            "test",
+            chart_dir
+        )
 
-            # Verify mkdir was called
-            mock_mkdir.assert_called()
+        # Verify the missing directory was created
+        assert chart_dir.is_dir()
 
-    @patch('src.chart_generator.plt.savefig')
-    @patch('src.chart_generator.plt.figure')
-    def test_works_with_existing_directory(self, mock_figure, mock_savefig):
+    def test_works_with_existing_directory(self, tmp_path):
         """Test that function works when directory already exists."""
         projects = [{'name': 'svc', 'total_commits': 10}]
 
-        with patch('pathlib.Path.exists', return_value=True):
-            result = generate_project_breakdown_chart(
-                projects,
-                'total_commits',
-                "test",
-                Path('/tmp/chart.png')
-            )
+        result = generate_project_breakdown_chart(
+            projects,
+            'total_commits',
+            "test",
+            tmp_path
+        )
 
-            # Should still work
-            mock_savefig.assert_called_once()
+        # Should still work
+        self.mock_savefig.assert_called_once()
+        assert result.parent == tmp_path
 
 
 @pytest.mark.unit
-class TestChartPerformance:
+class TestChartPerformance(_MockedRendering):
     """Test that unit tests are actually fast."""
 
-    @patch('src.chart_generator.plt.savefig')
-    @patch('src.chart_generator.plt.figure')
-    def test_multiple_charts_generated_quickly(self, mock_figure, mock_savefig):
+    def test_multiple_charts_generated_quickly(self):
         """Test that generating multiple charts is fast with mocks."""
         projects = [{'name': f'svc-{i}', 'total_commits': i*10} for i in range(10)]
 
@@ -227,12 +218,10 @@ class TestChartPerformance:
 
         # With mocks, this should be instant
         # Verify all 3 charts were saved (savefig is reliable indicator)
-        assert mock_savefig.call_count == 3, "Should save exactly 3 charts"
-        assert mock_figure.called, "plt.figure() should be called"
+        assert self.mock_savefig.call_count == 3, "Should save exactly 3 charts"
+        assert self.mock_figure.called, "plt.figure() should be called"
 
-    @patch('src.chart_generator.plt.savefig')
-    @patch('src.chart_generator.plt.figure')
-    def test_timeline_generation_is_fast(self, mock_figure, mock_savefig):
+    def test_timeline_generation_is_fast(self):
         """Test that timeline generation with mocks is fast."""
         # Generate many releases (spread across months)
         timeline = [
@@ -243,5 +232,64 @@ class TestChartPerformance:
         generate_timeline_chart(timeline, "test", Path('/tmp/timeline.png'))
 
         # With mocks, should be instant regardless of data size
-        assert mock_figure.called, "plt.figure() should be called"
-        mock_savefig.assert_called_once()  # Chart should be saved exactly once
+        assert self.mock_figure.called, "plt.figure() should be called"
+        self.mock_savefig.assert_called_once()  # Chart should be saved exactly once
+
+
+@pytest.mark.unit
+class TestRenderAllChartsUnit(_MockedRendering):
+    """Fast unit tests for chart dispatch."""
+
+    def test_single_core_renders_every_task(self):
+        """Test that serial dispatch renders each task and keeps names."""
+        projects = [{'name': 'svc', 'total_commits': 10}]
+        timeline = [(datetime(2025, 11, 1), "1.0.0")]
+
+        paths = render_all_charts(
+            {
+                'project_commits': (
+                    generate_project_breakdown_chart,
+                    (projects, 'total_commits', "test", Path('/tmp'))
+                ),
+                'timeline': (
+                    generate_timeline_chart,
+                    (timeline, "test", Path('/tmp'))
+                )
+            },
+            single_core=True
+        )
+
+        assert list(paths) == ['project_commits', 'timeline']
+        assert paths['timeline'].name == 'timeline-test.png'
+        assert self.mock_savefig.call_count == 2
+
+    def test_empty_tasks(self):
+        """Test that no tasks produces no charts."""
+        assert render_all_charts({}) == {}
+
+
+@pytest.mark.unit
+class TestBucketByMonthUnit:
+    """Fast unit tests for month bucketing."""
+
+    def test_sums_counts_per_month_in_order(self):
+        """Test that counts are summed per month and sorted by date."""
+        month_dates, counts = _bucket_by_month([
+            (datetime(2025, 11, 15, 9, 30), 2),
+            (datetime(2025, 10, 3), 1),
+            (datetime(2025, 11, 1), 3)
+        ])
+
+        assert month_dates.tolist() == [date(2025, 10, 1), date(2025, 11, 1)]
+        assert counts.tolist() == [1, 5]
+
+    def test_mixed_offsets_share_bucket(self):
+        """Test that tag dates with different UTC offsets share a month."""
+        utc = datetime(2025, 11, 3, tzinfo=timezone.utc)
+        cet = datetime(2025, 11, 20, tzinfo=timezone(timedelta(hours=1)))
+
+        month_dates, counts = _bucket_by_month([(utc, 1), (cet, 1)])
+
+        assert month_dates.dtype == 'datetime64[D]'
+        assert month_dates.tolist() == [date(2025, 11, 1)]
+        assert counts.tolist() == [2]
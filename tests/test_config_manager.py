@@ -4,18 +4,80 @@ Unit tests for config_manager module.
 Tests configuration loading and validation.
 """
 
+import dataclasses
+import os
 import pytest
 from pathlib import Path
-from src.config_manager import load_config, Config
+from unittest.mock import patch
+from src.config_manager import (
+    load_config,
+    Config,
+    _validate_service_metadata,
+    _config_cache_file,
+    _store_cached_config,
+    _CONFIG_CACHE_ENTRIES
+)
 import yaml
 
 
+try:
+    #: libyaml-backed emitter, as config_manager does for loading
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper
+
+
+#: Minimal valid config.yaml for one generic service
+GENERIC_CONFIG = {
+    'projects_directory': './projects',
+    'included_projects': ['generic-service'],
+    'file_exclusions': ['*.lock'],
+    'report_output': './reports',
+    'valid_branches': ['main'],
+    'service_metadata': {
+        'generic-service': {
+            'category': 'Core Infrastructure',
+            'tags': ['API'],
+            'description': 'Generic service'
+        }
+    },
+    'tag_descriptions': {'API': 'API development'},
+    'category_priority': ['Core Infrastructure'],
+    'tag_groups': {
+        'service_layers': {
+            'presentation_layer': ['API']
+        },
+        'technical_characteristics': {
+            'user_facing': ['API']
+        }
+    }
+}
+
+#: Organization-specific config.local.yaml overriding the generic one
+LOCAL_CONFIG = {
+    **GENERIC_CONFIG,
+    'included_projects': ['org-specific-service'],
+    'projects_directory': '/org/projects',
+    'service_metadata': {
+        'org-specific-service': {
+            'category': 'Core Infrastructure',
+            'tags': ['API'],
+            'description': 'Organization service'
+        }
+    }
+}
+
+#: Both configs emitted once at import; tests only write the text
+GENERIC_CONFIG_YAML = yaml.dump(GENERIC_CONFIG, Dumper=_YamlDumper)
+LOCAL_CONFIG_YAML = yaml.dump(LOCAL_CONFIG, Dumper=_YamlDumper)
+
+
 class TestConfigManager:
     """Test configuration loading and validation."""
 
-    def test_load_valid_config(self):
+    def test_load_valid_config(self, default_config):
         """Test loading valid configuration file."""
-        config = load_config("config.yaml")
+        config = default_config
 
         assert isinstance(config, Config)
         assert isinstance(config.projects_directory, Path)
@@ -24,9 +86,9 @@ class TestConfigManager:
         assert isinstance(config.file_exclusions, list)
         assert isinstance(config.valid_branches, list)
 
-    def test_config_has_required_fields(self):
+    def test_config_has_required_fields(self, default_config):
         """Test that all required fields are present."""
-        config = load_config("config.yaml")
+        config = default_config
 
         assert config.projects_directory is not None
         assert config.included_projects is not None
@@ -39,9 +101,9 @@ class TestConfigManager:
         with pytest.raises(FileNotFoundError):
             load_config("nonexistent.yaml")
 
-    def test_config_projects_are_strings(self):
+    def test_config_projects_are_strings(self, default_config):
         """Test that project names are strings."""
-        config = load_config("config.yaml")
+        config = default_config
 
         for project in config.included_projects:
             assert isinstance(project, str)
@@ -52,50 +114,9 @@ class TestConfigManager:
         # Change to test directory
         monkeypatch.chdir(tmp_path)
 
-        # Create generic config.yaml
-        config_yaml_data = {
-            'projects_directory': './projects',
-            'included_projects': ['generic-service'],
-            'file_exclusions': ['*.lock'],
-            'report_output': './reports',
-            'valid_branches': ['main'],
-            'service_metadata': {
-                'generic-service': {
-                    'category': 'Core Infrastructure',
-                    'tags': ['API'],
-                    'description': 'Generic service'
-                }
-            },
-            'tag_descriptions': {'API': 'API development'},
-            'category_priority': ['Core Infrastructure'],
-            'tag_groups': {
-                'service_layers': {
-                    'presentation_layer': ['API']
-                },
-                'technical_characteristics': {
-                    'user_facing': ['API']
-                }
-            }
-        }
-
-        # Create organization-specific config.local.yaml
-        config_local_data = config_yaml_data.copy()
-        config_local_data['included_projects'] = ['org-specific-service']
-        config_local_data['projects_directory'] = '/org/projects'
-        config_local_data['service_metadata'] = {
-            'org-specific-service': {
-                'category': 'Core Infrastructure',
-                'tags': ['API'],
-                'description': 'Organization service'
-            }
-        }
-
-        # Write both configs
-        with open('config.yaml', 'w') as f:
-            yaml.dump(config_yaml_data, f)
-
-        with open('config.local.yaml', 'w') as f:
-            yaml.dump(config_local_data, f)
+        # Generic config.yaml plus organization-specific config.local.yaml
+        Path('config.yaml').write_text(GENERIC_CONFIG_YAML)
+        Path('config.local.yaml').write_text(LOCAL_CONFIG_YAML)
 
         # Load config - should prefer config.local.yaml
         config = load_config()
@@ -109,33 +130,7 @@ class TestConfigManager:
         monkeypatch.chdir(tmp_path)
 
         # Create only config.yaml (no config.local.yaml)
-        config_yaml_data = {
-            'projects_directory': './projects',
-            'included_projects': ['generic-service'],
-            'file_exclusions': ['*.lock'],
-            'report_output': './reports',
-            'valid_branches': ['main'],
-            'service_metadata': {
-                'generic-service': {
-                    'category': 'Core Infrastructure',
-                    'tags': ['API'],
-                    'description': 'Generic service'
-                }
-            },
-            'tag_descriptions': {'API': 'API development'},
-            'category_priority': ['Core Infrastructure'],
-            'tag_groups': {
-                'service_layers': {
-                    'presentation_layer': ['API']
-                },
-                'technical_characteristics': {
-                    'user_facing': ['API']
-                }
-            }
-        }
-
-        with open('config.yaml', 'w') as f:
-            yaml.dump(config_yaml_data, f)
+        Path('config.yaml').write_text(GENERIC_CONFIG_YAML)
 
         # Load config - should use config.yaml
         config = load_config()
@@ -153,3 +148,88 @@ class TestConfigManager:
 
             assert 'config.local.yaml' in gitignore_contents, \
                 "config.local.yaml should be in .gitignore to prevent accidental commits"
+
+    def test_config_cache_reused_until_file_changes(self, tmp_path, monkeypatch):
+        """Test that parsed config is cached and invalidated on modification."""
+        monkeypatch.delenv('KPI_NO_CACHE', raising=False)
+        monkeypatch.setattr('src.config_manager.CONFIG_CACHE_DIR', tmp_path / 'cache')
+
+        config_file = tmp_path / 'custom.yaml'
+        with open('config.yaml') as f:
+            config_data = yaml.safe_load(f)
+        config_file.write_text(yaml.dump(config_data))
+
+        first = load_config(str(config_file))
+        assert list((tmp_path / 'cache').glob('config-*.pkl'))
+
+        with patch('src.config_manager.yaml.load') as mock_load:
+            cached = load_config(str(config_file))
+            mock_load.assert_not_called()
+        assert cached == first
+
+        config_data['included_projects'] = config_data['included_projects'][:1]
+        config_file.write_text(yaml.dump(config_data))
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        reloaded = load_config(str(config_file))
+        assert reloaded.included_projects == config_data['included_projects']
+
+    def test_config_cache_keeps_newest_entries(self, tmp_path, monkeypatch, default_config):
+        """Test that pickles for other config paths are evicted past the limit."""
+        monkeypatch.setattr('src.config_manager.CONFIG_CACHE_DIR', tmp_path / 'cache')
+        config_files = [tmp_path / f'config-{i}.yaml' for i in range(_CONFIG_CACHE_ENTRIES + 3)]
+
+        for config_file in config_files:
+            _store_cached_config(config_file, 0, default_config)
+
+        assert len(list((tmp_path / 'cache').glob('config-*.pkl'))) == _CONFIG_CACHE_ENTRIES
+        assert _config_cache_file(config_files[-1]).exists()
+
+    def test_validate_service_metadata_errors(self):
+        """Test that missing fields, undefined tags and categories are rejected."""
+        data = {
+            'included_projects': ['svc'],
+            'service_metadata': {
+                'svc': {'category': 'Core', 'tags': ['API', 'Nope'], 'description': 'Svc'}
+            },
+            'tag_descriptions': {'API': 'API development'},
+            'category_priority': ['Core']
+        }
+
+        with pytest.raises(ValueError, match="undefined tag 'Nope'"):
+            _validate_service_metadata(data)
+
+        data['service_metadata']['svc']['tags'] = ['API']
+        data['service_metadata']['svc']['category'] = 'Edge'
+        with pytest.raises(ValueError, match="undefined category 'Edge'"):
+            _validate_service_metadata(data)
+
+        del data['service_metadata']['svc']['description']
+        with pytest.raises(ValueError, match="missing 'description'"):
+            _validate_service_metadata(data)
+
+    def test_config_cache_ignored_after_code_change(self, tmp_path, monkeypatch):
+        """Test that pickles written by another module version are not reused."""
+        monkeypatch.delenv('KPI_NO_CACHE', raising=False)
+        monkeypatch.setattr('src.config_manager.CONFIG_CACHE_DIR', tmp_path / 'cache')
+
+        load_config("config.yaml")
+        monkeypatch.setattr('src.config_manager._CONFIG_CACHE_VERSION', 'other')
+
+        with patch('src.config_manager.yaml.load', wraps=yaml.load) as mock_load:
+            load_config("config.yaml")
+            mock_load.assert_called_once()
+
+    def test_service_metadata_is_frozen(self, default_config):
+        """Test that loaded service metadata is immutable and hashable."""
+        metadata = next(iter(default_config.service_metadata.values()))
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            metadata.category = 'Other'
+        assert hash(metadata) == hash(dataclasses.replace(metadata))
+
+    def test_service_tags_are_tuples(self, default_config):
+        """Test that service tags load as immutable tuples."""
+        for metadata in default_config.service_metadata.values():
+            assert isinstance(metadata.tags, tuple)
@@ -5,71 +5,94 @@ Fast tests that mock git operations for quick feedback.
 These run by default (pytest without -m integration).
 """
 
+import random
 import pytest
 from pathlib import Path
 from datetime import datetime
+from io import BytesIO
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, MagicMock
 from src.git_analyzer import (
     _is_semantic_version,
     get_tags,
     count_commits_between,
     calculate_line_changes,
+    count_commits_in_ranges,
+    _commits_in_range,
+    _commit_generations,
+    calculate_line_changes_in_ranges,
+    write_commit_graph,
+    fetch_repository,
     should_exclude_file
 )
 
 
+@pytest.fixture(scope="module")
+def _patched_repo_class():
+    """Patch git.Repo once for the whole module."""
+    with patch('src.git_analyzer.git.Repo') as repo_class:
+        yield repo_class
+
+
+@pytest.fixture
+def mock_git_repo(_patched_repo_class):
+    """The module's git.Repo mock, with calls and configured results cleared."""
+    _patched_repo_class.reset_mock(return_value=True, side_effect=True)
+    return _patched_repo_class
+
+
+def _mock_git_process(stdout: bytes) -> SimpleNamespace:
+    """Stub a GitPython as_process=True result streaming the given stdout."""
+    return SimpleNamespace(stdout=BytesIO(stdout), wait=lambda: 0)
+
+
+def _stub_diff_repo(diff_output: bytes) -> SimpleNamespace:
+    """Stub an open repository whose git diff streams diff_output (no call recording)."""
+    return SimpleNamespace(
+        git=SimpleNamespace(diff=lambda *args, **kwargs: _mock_git_process(diff_output))
+    )
+
+
 @pytest.mark.unit
 class TestSemanticVersionValidationUnit:
     """Fast unit tests for semantic version validation (no mocks needed - pure logic)."""
 
-    def test_valid_semantic_versions(self):
-        """Test that valid semantic versions are accepted."""
-        assert _is_semantic_version("1.2.3") is True
-        assert _is_semantic_version("9.2.6") is True
-        assert _is_semantic_version("10.15.20") is True
-        assert _is_semantic_version("0.0.1") is True
-
-    def test_valid_semantic_versions_with_suffix(self):
-        """Test that RC/beta tags are accepted."""
-        assert _is_semantic_version("1.2.3-rc1") is True
-        assert _is_semantic_version("1.2.3-beta") is True
-        assert _is_semantic_version("2.0.0-alpha1") is True
-        assert _is_semantic_version("1.0.0-RC2") is True
-
-    def test_invalid_semantic_versions(self):
-        """Test that invalid semantic versions are rejected."""
-        assert _is_semantic_version("1.2") is False
-        assert _is_semantic_version("v1.2.3") is False
-        assert _is_semantic_version("1.2.3.4") is False
-        assert _is_semantic_version("abc") is False
-        assert _is_semantic_version("release-1.2.3") is False
-        assert _is_semantic_version("") is False
+    @pytest.mark.parametrize("tag,expected", [
+        ("1.2.3", True),
+        ("9.2.6", True),
+        ("10.15.20", True),
+        ("0.0.1", True),
+        ("1.2.3-rc1", True),  # RC/beta suffixes are accepted
+        ("1.2.3-beta", True),
+        ("2.0.0-alpha1", True),
+        ("1.0.0-RC2", True),
+        ("1.2", False),
+        ("v1.2.3", False),
+        ("1.2.3.4", False),
+        ("abc", False),
+        ("release-1.2.3", False),
+        ("1.2.3\n", False),  # Whole tag must match, not just up to a newline
+        ("", False)
+    ], ids=lambda value: repr(value) if isinstance(value, str) else None)
+    def test_semantic_version(self, tag, expected):
+        """Test that semantic versions are accepted and anything else rejected."""
+        assert _is_semantic_version(tag) is expected
 
 
 @pytest.mark.unit
 class TestGetTagsUnit:
     """Fast unit tests for git tag extraction using mocks."""
 
-    @patch('src.git_analyzer.git.Repo')
-    def test_get_tags_with_mock_repo(self, mock_repo_class):
+    def test_get_tags_with_mock_repo(self, mock_git_repo):
         """Test tag extraction with mocked repository."""
-        # Create mock tags
-        mock_tag1 = Mock()
-        mock_tag1.name = '1.2.3'
-        mock_tag1.commit.committed_date = 1700000000
-
-        mock_tag2 = Mock()
-        mock_tag2.name = '2.0.0'
-        mock_tag2.commit.committed_date = 1700100000
-
-        mock_tag3 = Mock()
-        mock_tag3.name = 'invalid'  # Should be filtered out
-        mock_tag3.commit.committed_date = 1700050000
-
-        # Setup mock repo
+        # Mock for-each-ref output: name, peeled commit date, direct commit date
         mock_repo = Mock()
-        mock_repo.tags = [mock_tag1, mock_tag2, mock_tag3]
-        mock_repo_class.return_value = mock_repo
+        mock_repo.git.for_each_ref.return_value = (
+            "1.2.3\t\t1700000000\n"         # Lightweight tag
+            "2.0.0\t1700100000\t\n"         # Annotated tag
+            "invalid\t\t1700050000"          # Should be filtered out
+        )
+        mock_git_repo.return_value = mock_repo
 
         # Call function
         tags = get_tags(Path('/fake/path'))
@@ -80,167 +103,427 @@ class TestGetTagsUnit:
         assert tags[1][0] == '1.2.3'
         assert isinstance(tags[0][1], datetime)
 
-    @patch('src.git_analyzer.git.Repo')
-    def test_get_tags_empty_repo(self, mock_repo_class):
+    def test_get_tags_empty_repo(self, mock_git_repo):
         """Test tag extraction from repository with no tags."""
         mock_repo = Mock()
-        mock_repo.tags = []
-        mock_repo_class.return_value = mock_repo
+        mock_repo.git.for_each_ref.return_value = ""
+        mock_git_repo.return_value = mock_repo
 
         tags = get_tags(Path('/fake/path'))
 
         assert tags == []
 
+    def test_get_tags_with_open_repo(self, mock_git_repo):
+        """Test that an already-open repository is used as-is."""
+        mock_repo = Mock()
+        mock_repo.git.for_each_ref.return_value = "1.2.3\t\t1700000000"
+
+        tags = get_tags(mock_repo)
+
+        assert [tag for tag, _ in tags] == ['1.2.3']
+        mock_git_repo.assert_not_called()
+
+
+@pytest.mark.unit
+class TestFetchRepositoryUnit:
+    """Fast unit tests for remote fetching using mocks."""
+
+    def test_fetch_counts_only_new_tags(self):
+        """Test that up-to-date tags and branches are not reported as new."""
+        import git
+        mock_repo = Mock()
+        mock_repo.remotes.origin.fetch.return_value = [
+            SimpleNamespace(flags=git.FetchInfo.HEAD_UPTODATE),  # origin/main
+            SimpleNamespace(flags=git.FetchInfo.HEAD_UPTODATE),  # existing tag
+            SimpleNamespace(flags=git.FetchInfo.NEW_TAG),
+            SimpleNamespace(flags=git.FetchInfo.NEW_TAG),
+        ]
+
+        assert fetch_repository(mock_repo) == (True, "Fetched 2 new tags")
+
+    def test_fetch_up_to_date(self):
+        """Test the message when nothing new was fetched."""
+        import git
+        mock_repo = Mock()
+        mock_repo.remotes.origin.fetch.return_value = [
+            SimpleNamespace(flags=git.FetchInfo.HEAD_UPTODATE),
+        ]
+
+        assert fetch_repository(mock_repo) == (True, "Already up to date")
+
+    def test_fetch_never_makes_complete_clone_shallow(self, tmp_path):
+        """Test that a period start is ignored for a complete clone."""
+        mock_repo = Mock(git_dir=str(tmp_path))
+        mock_repo.remotes.origin.fetch.return_value = []
+
+        fetch_repository(mock_repo, shallow_since=datetime(2025, 10, 1))
+
+        mock_repo.remotes.origin.fetch.assert_called_once_with(tags=True, prune=True)
+
+    def test_fetch_deepens_shallow_clone_to_period(self, tmp_path):
+        """Test that a shallow clone starting after the period is deepened."""
+        (tmp_path / "shallow").write_text("abc123\n")
+        mock_repo = Mock(git_dir=str(tmp_path))
+        mock_repo.git.log.return_value = str(int(datetime(2025, 12, 1).timestamp()))
+        mock_repo.remotes.origin.fetch.return_value = []
+
+        fetch_repository(mock_repo, shallow_since=datetime(2025, 10, 1))
+
+        mock_repo.remotes.origin.fetch.assert_called_once_with(
+            tags=True, prune=True, shallow_since='2025-10-01'
+        )
+
+    def test_fetch_keeps_deeper_shallow_history(self, tmp_path):
+        """Test that a shallow clone already reaching the period is not shortened."""
+        (tmp_path / "shallow").write_text("abc123\n")
+        mock_repo = Mock(git_dir=str(tmp_path))
+        mock_repo.git.log.return_value = str(int(datetime(2025, 1, 1).timestamp()))
+        mock_repo.remotes.origin.fetch.return_value = []
+
+        fetch_repository(mock_repo, shallow_since=datetime(2025, 10, 1))
+
+        mock_repo.remotes.origin.fetch.assert_called_once_with(tags=True, prune=True)
+
+
+@pytest.mark.unit
+class TestCommitGraphUnit:
+    """Fast unit tests for commit-graph maintenance using mocks."""
+
+    def test_write_commit_graph_incremental(self):
+        """Test that the commit-graph is extended with a split write."""
+        mock_repo = Mock()
+
+        assert write_commit_graph(mock_repo) is True
+        mock_repo.git.commit_graph.assert_called_once_with("write", "--reachable", "--split")
+
+    def test_write_commit_graph_failure_ignored(self):
+        """Test that git errors (old git, read-only repo) are not raised."""
+        import git
+        mock_repo = Mock()
+        mock_repo.git.commit_graph.side_effect = git.GitCommandError("commit-graph", 129)
+
+        assert write_commit_graph(mock_repo) is False
+
 
 @pytest.mark.unit
 class TestCountCommitsBetweenUnit:
     """Fast unit tests for commit counting using mocks."""
 
-    @patch('src.git_analyzer.git.Repo')
-    def test_count_commits_between_tags(self, mock_repo_class):
+    def test_count_commits_between_tags(self, mock_git_repo):
         """Test commit counting with mocked git log."""
         # Setup mock repo
         mock_repo = Mock()
-        mock_repo.iter_commits.return_value = [Mock(), Mock(), Mock()]  # 3 commits
-        mock_repo_class.return_value = mock_repo
+        mock_repo.git.rev_list.return_value = "3"  # 3 commits
+        mock_git_repo.return_value = mock_repo
 
         # Call function
         count = count_commits_between(Path('/fake/path'), 'v1.0.0', 'v1.1.0')
 
         # Verify count and that correct git range was used
         assert count == 3
-        mock_repo.iter_commits.assert_called_once_with('v1.0.0..v1.1.0')
+        mock_repo.git.rev_list.assert_called_once_with('--count', 'v1.0.0..v1.1.0', '--')
+
+    def test_count_commits_between_with_dates(self, mock_git_repo):
+        """Test commit dates read from committer timestamps."""
+        mock_repo = Mock()
+        mock_repo.git.log.return_value = "300\n200\n100"
+        mock_git_repo.return_value = mock_repo
+
+        count, dates = count_commits_between(
+            Path('/fake/path'), 'v1.0.0', 'v1.1.0', return_dates=True
+        )
 
-    @patch('src.git_analyzer.git.Repo')
-    def test_count_commits_same_ref(self, mock_repo_class):
+        assert count == 3
+        assert dates == [datetime.fromtimestamp(ts) for ts in (300, 200, 100)]
+        mock_repo.git.log.assert_called_once_with('--format=%ct', 'v1.0.0..v1.1.0', '--')
+
+    def test_count_commits_same_ref(self, mock_git_repo):
         """Test commit counting when refs are the same."""
         mock_repo = Mock()
-        mock_repo.iter_commits.return_value = []
-        mock_repo_class.return_value = mock_repo
+        mock_repo.git.rev_list.return_value = "0"
+        mock_git_repo.return_value = mock_repo
 
         count = count_commits_between(Path('/fake/path'), 'v1.0.0', 'v1.0.0')
 
         assert count == 0
 
 
+#: Exclusion pattern sets shared by the should_exclude_file cases
+LOCK_PATTERNS = ["*.lock", "package-lock.json"]
+MINIFIED_PATTERNS = ["*.min.js", "*.min.css"]
+DIRECTORY_PATTERNS = ["node_modules/*", "dist/*"]
+NORMAL_PATTERNS = ["*.lock", "*.min.js"]
+
+
 @pytest.mark.unit
 class TestFileExclusionUnit:
     """Fast unit tests for file exclusion logic (no mocks needed - pure logic)."""
 
-    def test_exclude_lock_files(self):
-        """Test that lock files are excluded."""
-        patterns = ["*.lock", "package-lock.json"]
+    @pytest.mark.parametrize("filepath,patterns,expected", [
+        #: Lock files
+        ("yarn.lock", LOCK_PATTERNS, True),
+        ("package-lock.json", LOCK_PATTERNS, True),
+        ("src/main.js", LOCK_PATTERNS, False),
+        #: Specific (minified) files
+        ("app.min.js", MINIFIED_PATTERNS, True),
+        ("style.min.css", MINIFIED_PATTERNS, True),
+        ("app.js", MINIFIED_PATTERNS, False),
+        #: Directory patterns
+        ("node_modules/package/file.js", DIRECTORY_PATTERNS, True),
+        ("dist/bundle.js", DIRECTORY_PATTERNS, True),
+        ("src/index.js", DIRECTORY_PATTERNS, False),
+        #: Normal files pass through
+        ("src/main.py", NORMAL_PATTERNS, False),
+        ("README.md", NORMAL_PATTERNS, False),
+        ("tests/test_foo.py", NORMAL_PATTERNS, False),
+        #: Slash-free wildcards that can span '/' still check the full path
+        ("src/main.py", ["src*"], True),
+        ("a/x", ["?/x"], True),
+        ("lib/src.py", ["src*"], True),
+        ("lib/main.py", ["src*"], False),
+        #: An empty exclusion list never matches
+        ("yarn.lock", [], False),
+        ("", [], False)
+    ])
+    def test_should_exclude_file(self, filepath, patterns, expected):
+        """Test file exclusion across lock, minified, directory and wildcard patterns."""
+        assert should_exclude_file(filepath, patterns) is expected
 
-        assert should_exclude_file("yarn.lock", patterns) is True
-        assert should_exclude_file("package-lock.json", patterns) is True
-        assert should_exclude_file("src/main.js", patterns) is False
 
-    def test_exclude_specific_files(self):
-        """Test exclusion of specific files."""
-        patterns = ["*.min.js", "*.min.css"]
+@pytest.mark.unit
+class TestLineChangesUnit:
+    """Fast unit tests for line change calculations using mocks."""
 
-        assert should_exclude_file("app.min.js", patterns) is True
-        assert should_exclude_file("style.min.css", patterns) is True
-        assert should_exclude_file("app.js", patterns) is False
+    @pytest.mark.parametrize("diff_output,exclusions,expected", [
+        #: Format: added\tremoved\tfilename, NUL-terminated
+        (
+            b"10\t2\tsrc/main.py\0"
+            b"5\t3\tsrc/utils.py\0"
+            b"0\t10\tsrc/old.py\0",
+            [],
+            (15, 15)  # 10 + 5 + 0, 2 + 3 + 10
+        ),
+        #: Only src/main.py survives the exclusions
+        (
+            b"10\t2\tsrc/main.py\0"
+            b"5\t3\tpackage-lock.json\0"
+            b"100\t50\tnode_modules/pkg/index.js\0",
+            ["package-lock.json", "node_modules/*"],
+            (10, 2)
+        ),
+        #: Binary files show as "-\t-" and are skipped
+        (
+            b"10\t2\tsrc/main.py\0"
+            b"-\t-\timage.png\0"
+            b"5\t3\tREADME.md\0",
+            [],
+            (15, 5)  # 10 + 5, 2 + 3
+        )
+    ], ids=["plain", "exclusions", "binary_files"])
+    def test_calculate_line_changes(self, mock_git_repo, diff_output, exclusions, expected):
+        """Test line change calculation with mocked git diff."""
+        mock_repo = Mock()
+        mock_repo.git.diff.return_value = _mock_git_process(diff_output)
+        mock_git_repo.return_value = mock_repo
 
-    def test_exclude_directory_patterns(self):
-        """Test directory pattern matching."""
-        patterns = ["node_modules/*", "dist/*"]
+        assert calculate_line_changes(
+            Path('/fake/path'),
+            'v1.0.0',
+            'v1.1.0',
+            exclusions
+        ) == expected
+        # Verify git diff was called with correct arguments
+        mock_repo.git.diff.assert_called_once_with(
+            'v1.0.0', 'v1.1.0', numstat=True, z=True, as_process=True
+        )
 
-        assert should_exclude_file("node_modules/package/file.js", patterns) is True
-        assert should_exclude_file("dist/bundle.js", patterns) is True
-        assert should_exclude_file("src/index.js", patterns) is False
+    def test_calculate_line_changes_renames_and_raw_paths(self):
+        """Test renames match on the new path and raw paths are not quoted."""
+        # Renames leave the path empty and follow it with old and new paths
+        repo = _stub_diff_repo(
+            b"4\t1\t\0src/old.py\0src/new.py\0"
+            b"2\t0\t\0deps/old.txt\0deps/yarn.lock\0"
+            b"7\t0\tvendor/\xc3\xa9t\xc3\xa9.lock\0"
+            b"3\t3\tname\twith\ttabs.py\0"
+        )
 
-    def test_do_not_exclude_normal_files(self):
-        """Test that normal files pass through."""
-        patterns = ["*.lock", "*.min.js"]
+        added, removed = calculate_line_changes(repo, 'v1.0.0', 'v1.1.0', ["*.lock"])
 
-        assert should_exclude_file("src/main.py", patterns) is False
-        assert should_exclude_file("README.md", patterns) is False
-        assert should_exclude_file("tests/test_foo.py", patterns) is False
+        assert added == 7  # 4 + 3
+        assert removed == 4  # 1 + 3
 
+    @patch('src.git_analyzer._STREAM_CHUNK_SIZE', 5)
+    def test_calculate_line_changes_streamed_in_small_chunks(self):
+        """Test records split across read chunks are reassembled."""
+        repo = _stub_diff_repo(
+            b"4\t1\t\0src/old.py\0src/new.py\0"
+            b"120\t30\tsrc/main.py\0"
+            b"9\t9\tyarn.lock\0"
+        )
 
-@pytest.mark.unit
-class TestLineChangesUnit:
-    """Fast unit tests for line change calculations using mocks."""
+        added, removed = calculate_line_changes(repo, 'v1.0.0', 'v1.1.0', ["*.lock"])
 
-    @patch('src.git_analyzer.git.Repo')
-    def test_calculate_line_changes_with_mock(self, mock_repo_class):
-        """Test line change calculation with mocked git diff."""
-        # Setup mock repo
-        mock_repo = Mock()
+        assert added == 124
+        assert removed == 31
 
-        # Mock diff output (format: added\tremoved\tfilename)
-        mock_diff_output = """10\t2\tsrc/main.py
-5\t3\tsrc/utils.py
-0\t10\tsrc/old.py"""
 
-        mock_repo.git.diff.return_value = mock_diff_output
-        mock_repo_class.return_value = mock_repo
+@pytest.mark.unit
+class TestRangeBatchUnit:
+    """Fast unit tests for the batched per-repository range queries."""
 
-        # Call function
-        added, removed = calculate_line_changes(
+    #: rev-parse output for v2^{commit} v2^{tree} HEAD^{commit} HEAD^{tree} v1^{commit} v1^{tree}
+    REV_PARSE_OUTPUT = "c3\nf3\nc4\nf4\nc1\nf1"
+
+    def test_count_commits_in_ranges_with_merge(self, mock_git_repo):
+        """Test that each range counts commits reachable from to_ref only."""
+        mock_repo = Mock()
+        mock_repo.git.rev_parse.return_value = self.REV_PARSE_OUTPUT
+        mock_repo.git.merge_base.return_value = "c1"
+        #: c4 (HEAD) <- c3 (v2, merge of c2 and side) <- c1 (v1)
+        mock_repo.git.log.return_value = "\n".join([
+            "c4\tc3\t400",
+            "c3\tc2 side\t300",
+            "side\tc1\t250",
+            "c2\tc1\t200",
+        ])
+        mock_git_repo.return_value = mock_repo
+
+        dates = count_commits_in_ranges(
             Path('/fake/path'),
-            'v1.0.0',
-            'v1.1.0',
-            []
+            [('v2', 'HEAD'), ('v1', 'v2')]
         )
 
-        # Verify line counts and git diff was called correctly
-        assert added == 15  # 10 + 5 + 0
-        assert removed == 15  # 2 + 3 + 10
-        # Verify git diff was called with correct arguments
-        mock_repo.git.diff.assert_called_once_with('v1.0.0', 'v1.1.0', numstat=True)
+        assert dates[('v2', 'HEAD')] == [datetime.fromtimestamp(400)]
+        assert dates[('v1', 'v2')] == [
+            datetime.fromtimestamp(300),
+            datetime.fromtimestamp(250),
+            datetime.fromtimestamp(200),
+        ]
+        #: Graph is read once for all ranges, hiding history before every from_ref
+        mock_repo.git.merge_base.assert_called_once_with("--octopus", "c3", "c1")
+        mock_repo.git.log.assert_called_once_with(
+            "--format=%H%x09%P%x09%ct", "c3", "c4", "c1", "^c1", "--"
+        )
 
-    @patch('src.git_analyzer.git.Repo')
-    def test_calculate_line_changes_with_exclusions(self, mock_repo_class):
-        """Test line changes with file exclusions."""
+    def test_count_commits_in_many_consecutive_ranges(self, mock_git_repo):
+        """Test that every consecutive tag range counts only its own commits."""
+        #: Linear history c1..c400 with a tag on every 10th commit
+        shas = [f"c{i}" for i in range(1, 401)]
+        tags = shas[9::10]
         mock_repo = Mock()
+        mock_repo.git.merge_base.return_value = "c10"
+        mock_repo.git.log.return_value = "\n".join(
+            f"{sha}\t{parent}\t{i}"
+            for i, (sha, parent) in enumerate(zip(shas, ["", *shas]), start=1)
+            if i > 10
+        )
+        mock_git_repo.return_value = mock_repo
+        resolved_refs = {tag: (tag, f"tree-{tag}") for tag in tags}
+        ranges = list(zip(tags, tags[1:]))[::-1]
 
-        # Include files that should be excluded
-        mock_diff_output = """10\t2\tsrc/main.py
-5\t3\tpackage-lock.json
-100\t50\tnode_modules/pkg/index.js"""
+        dates = count_commits_in_ranges(Path('/fake/path'), ranges, resolved_refs)
 
-        mock_repo.git.diff.return_value = mock_diff_output
-        mock_repo_class.return_value = mock_repo
+        for from_tag, to_tag in ranges:
+            newest = int(to_tag[1:])
+            assert dates[(from_tag, to_tag)] == [
+                datetime.fromtimestamp(ts) for ts in range(newest, newest - 10, -1)
+            ]
 
-        # Call with exclusions
-        added, removed = calculate_line_changes(
+    def test_count_commits_with_clock_skew(self, mock_git_repo):
+        """Test that a commit dated before its parent does not end the walk early."""
+        mock_repo = Mock()
+        mock_repo.git.merge_base.return_value = "base"
+        #: to <- a <- base; from <- old <- a, with old dated before its parent a
+        mock_repo.git.log.return_value = "\n".join([
+            "to\ta\t50",
+            "from\told\t45",
+            "a\tbase\t40",
+            "old\ta\t10",
+        ])
+        mock_git_repo.return_value = mock_repo
+        resolved_refs = {'v1': ('from', 'f1'), 'v2': ('to', 'f2')}
+
+        dates = count_commits_in_ranges(Path('/fake/path'), [('v1', 'v2')], resolved_refs)
+
+        assert dates == {('v1', 'v2'): [datetime.fromtimestamp(50)]}
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_commits_in_range_matches_set_difference(self, seed):
+        """Test the walk against exact ancestor-set subtraction on random merge graphs."""
+        rng = random.Random(seed)
+        shas = [f"c{i}" for i in range(60)]
+        parents = {shas[0]: []}
+        for i, sha in enumerate(shas[1:], start=1):
+            parents[sha] = rng.sample(shas[max(0, i - 8):i], k=min(i, rng.choice((1, 1, 2))))
+
+        def ancestors(sha):
+            reached, stack = set(), [sha]
+            while stack:
+                sha = stack.pop()
+                if sha not in reached:
+                    reached.add(sha)
+                    stack.extend(parents[sha])
+            return reached
+
+        generations = _commit_generations(parents)
+        for _ in range(10):
+            from_commit, to_commit = rng.sample(shas, 2)
+            expected = ancestors(to_commit) - ancestors(from_commit)
+            in_range = _commits_in_range(parents, generations, from_commit, to_commit)
+            assert sorted(in_range) == sorted(expected)
+
+    def test_calculate_line_changes_in_ranges(self, mock_git_repo):
+        """Test splitting one diff-tree output back into per-range totals."""
+        mock_repo = Mock()
+        mock_repo.git.rev_parse.return_value = self.REV_PARSE_OUTPUT
+        diff_tree_output = (
+            b"f1 f3\n10\t2\tsrc/main.py\0"
+            b"5\t3\tpackage-lock.json\0"
+            b"-\t-\timage.png\0"
+            b"f3 f4\n1\t1\tREADME.md\0"
+        )
+        mock_repo.git.diff_tree.return_value = _mock_git_process(diff_tree_output)
+        mock_git_repo.return_value = mock_repo
+
+        changes = calculate_line_changes_in_ranges(
             Path('/fake/path'),
-            'v1.0.0',
-            'v1.1.0',
-            ["package-lock.json", "node_modules/*"]
+            [('v2', 'HEAD'), ('v1', 'v2')],
+            ["package-lock.json"]
         )
 
-        # Only src/main.py should be counted
-        assert added == 10
-        assert removed == 2
-        # Verify git diff was called with correct arguments
-        mock_repo.git.diff.assert_called_once_with('v1.0.0', 'v1.1.0', numstat=True)
+        assert changes == {('v1', 'v2'): (10, 2), ('v2', 'HEAD'): (1, 1)}
+        mock_repo.git.diff_tree.assert_called_once()
 
-    @patch('src.git_analyzer.git.Repo')
-    def test_calculate_line_changes_binary_files(self, mock_repo_class):
-        """Test that binary files are handled correctly."""
+    def test_head_at_newest_tag_skips_walk_and_diff(self, mock_git_repo):
+        """Test that ranges between refs on one commit are empty without git work."""
         mock_repo = Mock()
+        mock_repo.git.rev_parse.return_value = "c4\nf4\nc4\nf4"
+        mock_git_repo.return_value = mock_repo
 
-        # Binary files show as "-\t-"
-        mock_diff_output = """10\t2\tsrc/main.py
--\t-\timage.png
-5\t3\tREADME.md"""
+        dates = count_commits_in_ranges(Path('/fake/path'), [('v2', 'HEAD')])
+        changes = calculate_line_changes_in_ranges(Path('/fake/path'), [('v2', 'HEAD')], [])
 
-        mock_repo.git.diff.return_value = mock_diff_output
-        mock_repo_class.return_value = mock_repo
+        assert dates == {('v2', 'HEAD'): []}
+        assert changes == {('v2', 'HEAD'): (0, 0)}
+        mock_repo.git.log.assert_not_called()
+        mock_repo.git.diff_tree.assert_not_called()
 
-        added, removed = calculate_line_changes(
-            Path('/fake/path'),
-            'v1.0.0',
-            'v1.1.0',
-            []
+    def test_shared_resolved_refs_skip_rev_parse(self, mock_git_repo):
+        """Test that refs resolved once up front are not looked up again."""
+        mock_repo = Mock()
+        mock_repo.git.diff_tree.return_value = _mock_git_process(b"f1 f3\n7\t1\tsrc/main.py\0")
+        mock_git_repo.return_value = mock_repo
+        resolved_refs = {'v1': ('c1', 'f1'), 'v2': ('c3', 'f3')}
+
+        changes = calculate_line_changes_in_ranges(
+            Path('/fake/path'), [('v1', 'v2')], [], resolved_refs
         )
 
-        # Binary file should be skipped
-        assert added == 15  # 10 + 5
-        assert removed == 5  # 2 + 3
-        # Verify git diff was called with correct arguments
-        mock_repo.git.diff.assert_called_once_with('v1.0.0', 'v1.1.0', numstat=True)
+        assert changes == {('v1', 'v2'): (7, 1)}
+        mock_repo.git.rev_parse.assert_not_called()
+
+    def test_empty_ranges_skip_git(self, mock_git_repo):
+        """Test that no git process is started when there is nothing to count."""
+        assert count_commits_in_ranges(Path('/fake/path'), []) == {}
+        assert calculate_line_changes_in_ranges(Path('/fake/path'), [], []) == {}
+        mock_git_repo.assert_not_called()
@@ -7,19 +7,41 @@ Tests the complete console output workflow.
 import pytest
 import sys
 from io import StringIO
-from src.main import main
+from types import SimpleNamespace
+from unittest.mock import patch
+from src.main import (
+    main,
+    collect_metrics_data,
+    _analyze_project,
+    _project_cache_key,
+    _store_cached_project
+)
+
+
+@pytest.fixture
+def run_main_on_fixture(sample_repo, project_cache_dir, monkeypatch):
+    """
+    Run the real main() against the sample repository.
+
+    Fetching is skipped (the fixture has no remote) and the project cache
+    is the session-wide project_cache_dir, so only the first run in a
+    session walks the repository with git.
+    """
+    #: Mock sys.argv to avoid argument parsing conflicts
+    monkeypatch.setattr('sys.argv', ['pytest', '--no-fetch'])
+    monkeypatch.delenv('KPI_NO_CACHE', raising=False)
+    monkeypatch.setattr('src.main.PROJECT_CACHE_DIR', project_cache_dir)
+
+    return lambda: main(projects=[sample_repo.working_tree_dir])
 
 
 class TestMainExecution:
     """Test main script execution."""
 
-    def test_main_runs_without_errors(self, capsys, monkeypatch):
+    def test_main_runs_without_errors(self, run_main_on_fixture, capsys):
         """Test that main() executes without crashing."""
-        #: Mock sys.argv to avoid argument parsing conflicts
-        monkeypatch.setattr('sys.argv', ['pytest'])
-
         # Run main function
-        main()
+        run_main_on_fixture()
 
         # Capture output
         captured = capsys.readouterr()
@@ -31,50 +53,9 @@ class TestMainExecution:
         # Should process at least one project
         assert "📦" in captured.out
 
-    def test_main_handles_fixture_repo(self, monkeypatch, capsys):
+    def test_main_handles_fixture_repo(self, run_main_on_fixture, capsys):
         """Test main with fixture repository."""
-        from pathlib import Path
-
-        # Mock the projects list to use only our fixture
-        def mock_main():
-            from src.git_analyzer import get_tags, count_commits_between
-
-            projects = [
-                Path("tests/fixtures/sample_repo"),
-            ]
-
-            print("=" * 60)
-            print("KPI Report Generator - Test Fixture")
-            print("=" * 60)
-            print()
-
-            for project_path in projects:
-                if not project_path.exists():
-                    print(f"⚠️  SKIP: {project_path.name} (not found)")
-                    continue
-
-                if not (project_path / ".git").exists():
-                    print(f"⚠️  SKIP: {project_path.name} (not a git repository)")
-                    continue
-
-                print(f"📦 {project_path.name}")
-                print("-" * 60)
-
-                tags = get_tags(project_path)
-
-                for i, (tag, date) in enumerate(tags[:5]):
-                    if i == 0:
-                        print(f"  {tag:15} {date.strftime('%Y-%m-%d')} (latest)")
-                        continue
-
-                    prev_tag = tags[i-1][0]
-                    commits = count_commits_between(project_path, tag, prev_tag)
-                    print(f"  {tag:15} {date.strftime('%Y-%m-%d')} → {commits:3d} commits")
-
-                print()
-
-        # Run test version
-        mock_main()
+        run_main_on_fixture()
 
         # Capture output
         captured = capsys.readouterr()
@@ -84,12 +65,9 @@ class TestMainExecution:
         assert "2.0.0-rc1" in captured.out  # Latest tag in fixture
         assert "commits" in captured.out
 
-    def test_main_output_format(self, capsys, monkeypatch):
+    def test_main_output_format(self, run_main_on_fixture, capsys):
         """Test that main output is well-formatted."""
-        #: Mock sys.argv to avoid argument parsing conflicts
-        monkeypatch.setattr('sys.argv', ['pytest'])
-
-        main()
+        run_main_on_fixture()
 
         captured = capsys.readouterr()
 
@@ -97,3 +75,94 @@ class TestMainExecution:
         assert "=" * 60 in captured.out or "=" * 70 in captured.out  # Header line (varies by phase)
         assert "-" * 60 in captured.out or "-" * 70 in captured.out  # Separator lines
         assert "→" in captured.out  # Arrow for commit counts
+
+
+@pytest.mark.unit
+class TestCollectMetricsData:
+    """Test per-project dispatch in collect_metrics_data."""
+
+    def test_skipped_projects_dropped_and_order_kept(self, tmp_path, capsys):
+        """Test that projects come back in config order without skipped ones."""
+        config = SimpleNamespace(
+            projects_directory=tmp_path,
+            included_projects=["alpha", "missing", "beta"],
+            file_exclusions=["*.lock"]
+        )
+
+        def fake_analyze(project_path, *args):
+            return None if project_path.name == "missing" else {"name": project_path.name}
+
+        with patch("src.main._analyze_project", side_effect=fake_analyze) as mock_analyze:
+            projects = collect_metrics_data(config, enable_fetch=False, single_core=True)
+
+        assert [p["name"] for p in projects] == ["alpha", "beta"]
+        mock_analyze.assert_any_call(tmp_path / "beta", ["*.lock"], None, None, None)
+        assert "[3/3] 🔄 Processing beta..." in capsys.readouterr().out
+
+    def test_fetch_results_passed_to_analysis(self, tmp_path):
+        """Test that projects are fetched up front and results reach analysis."""
+        config = SimpleNamespace(
+            projects_directory=tmp_path,
+            included_projects=["alpha", "beta"],
+            file_exclusions=[]
+        )
+
+        with patch("src.main._fetch_project", return_value=(True, "Fetched 1 new tag")) as mock_fetch, \
+                patch("src.main._analyze_project", return_value=None) as mock_analyze:
+            collect_metrics_data(config, enable_fetch=True, single_core=True)
+
+        assert mock_fetch.call_count == 2
+        mock_analyze.assert_any_call(tmp_path / "alpha", [], (True, "Fetched 1 new tag"), None, None)
+
+
+@pytest.mark.unit
+class TestProjectCache:
+    """Test the on-disk cache of analyzed project data."""
+
+    @pytest.fixture
+    def cache_dir(self, tmp_path, monkeypatch):
+        """Point the project cache at a temporary directory."""
+        monkeypatch.setattr("src.main.PROJECT_CACHE_DIR", tmp_path / "cache")
+        monkeypatch.delenv("KPI_NO_CACHE", raising=False)
+        return tmp_path / "cache"
+
+    def test_key_changes_with_refs_and_settings(self, cache_dir):
+        """Test that moving refs or changing exclusions invalidates the key."""
+        project = cache_dir.parent / "repo"
+        with patch("src.main.get_ref_snapshot", return_value="abc HEAD"):
+            key = _project_cache_key(project, ["*.lock"], None, None)
+            assert key == _project_cache_key(project, ["*.lock"], None, None)
+            assert key != _project_cache_key(project, ["*.min.js"], None, None)
+        with patch("src.main.get_ref_snapshot", return_value="def HEAD"):
+            assert key != _project_cache_key(project, ["*.lock"], None, None)
+
+    def test_no_key_when_disabled(self, cache_dir, monkeypatch):
+        """Test that KPI_NO_CACHE turns the cache off."""
+        monkeypatch.setenv("KPI_NO_CACHE", "1")
+        assert _project_cache_key(cache_dir.parent, [], None, None) is None
+
+    def test_cache_hit_skips_git_work(self, cache_dir, tmp_path):
+        """Test that a stored analysis is returned without reading tags."""
+        project = tmp_path / "repo"
+        (project / ".git").mkdir(parents=True)
+        project_data = {
+            'name': 'repo', 'release_count': 2, 'total_commits': 5,
+            'total_lines_added': 10, 'total_lines_removed': 3,
+            'net_change': 7, 'releases': []
+        }
+
+        repo = object()
+        with patch("src.main.open_repository", return_value=repo), \
+                patch("src.main.get_ref_snapshot", return_value="abc HEAD"), \
+                patch("src.main.get_tags") as mock_get_tags:
+            _store_cached_project(project, _project_cache_key(project, [], None, None), project_data)
+
+            assert _analyze_project(project, [], None, None, None) == project_data
+            mock_get_tags.assert_not_called()
+
+        #: A new commit or tag misses the cache and analyzes again
+        with patch("src.main.open_repository", return_value=repo), \
+                patch("src.main.get_ref_snapshot", return_value="def HEAD"), \
+                patch("src.main.get_tags", return_value=[]) as mock_get_tags:
+            assert _analyze_project(project, [], None, None, None) is None
+            mock_get_tags.assert_called_once_with(repo)